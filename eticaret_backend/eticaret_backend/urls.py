@@ -1,29 +1,40 @@
-from django.contrib import admin
-from django.urls import path, include
-from django.conf import settings
-from django.conf.urls.static import static
-from rest_framework.routers import DefaultRouter
-from products.views import CategoryViewSet, SubCategoryViewSet, ProductViewSet, SliderViewSet
-from settings.views import ContactViewSet, SocialMediaViewSet, PolicyandTermsViewSet
-# API router'ı oluştur
-router = DefaultRouter()
-router.register(r'categories', CategoryViewSet, basename='categories')
-router.register(r'subcategories', SubCategoryViewSet, basename='subcategories')
-router.register(r'products', ProductViewSet, basename='products')
-router.register(r'sliders', SliderViewSet, basename='sliders')  
-
-
-
-urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('api/', include([
-        path('', include(router.urls)),
-        path('auth/', include('accounts.urls')),
-        path('orders/', include('orders.urls')),   
-        path('settings/', include('settings.urls')),
-    ])),
-    path('tinymce/', include('tinymce.urls')),
-] 
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+from django.contrib import admin
+from django.urls import path, include, re_path
+from django.conf import settings
+from django.conf.urls.static import static
+from django.views.decorators.cache import cache_control
+from django.views.static import serve
+from rest_framework.routers import DefaultRouter
+from products.storage import HASHED_PATH_PATTERN, IMMUTABLE_MAX_AGE
+from products.views import CategoryViewSet, SubCategoryViewSet, ProductViewSet, SliderViewSet
+from settings.views import ContactViewSet, SocialMediaViewSet, PolicyandTermsViewSet
+# API router'ı oluştur
+router = DefaultRouter()
+router.register(r'categories', CategoryViewSet, basename='categories')
+router.register(r'subcategories', SubCategoryViewSet, basename='subcategories')
+router.register(r'products', ProductViewSet, basename='products')
+router.register(r'sliders', SliderViewSet, basename='sliders')  
+
+
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+    path('api/', include([
+        path('', include(router.urls)),
+        path('auth/', include('accounts.urls')),
+        path('orders/', include('orders.urls')),   
+        path('settings/', include('settings.urls')),
+    ])),
+    path('tinymce/', include('tinymce.urls')),
+] 
+if settings.DEBUG:
+    # İçerik adresli resimlerin adı içerikle değişir; tarayıcı bunları süresiz önbellekleyebilir
+    urlpatterns += [
+        re_path(
+            rf'^{settings.MEDIA_URL.lstrip("/")}(?P<path>{HASHED_PATH_PATTERN})$',
+            cache_control(max_age=IMMUTABLE_MAX_AGE, public=True, immutable=True)(serve),
+            {'document_root': settings.MEDIA_ROOT}
+        ),
+    ]
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
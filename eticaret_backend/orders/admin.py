@@ -1,15 +1,43 @@
-from django.contrib import admin
-from .models import Order, OrderItem
-
-class OrderItemInline(admin.TabularInline):
-    model = OrderItem
-    extra = 0
-    readonly_fields = ['total']
-
-@admin.register(Order)
-class OrderAdmin(admin.ModelAdmin):
-    list_display = ['order_number', 'user', 'status', 'total_amount', 'created_at']
-    list_filter = ['status', 'created_at']
-    search_fields = ['order_number', 'user__username']
-    readonly_fields = ['order_number', 'total_amount', 'created_at', 'updated_at']
-    inlines = [OrderItemInline]
\ No newline at end of file
+from django.contrib import admin
+from django.db.models import Q
+from products.pagination import EstimatedCountPaginator
+from products.sales import sync_order_sales
+from .models import Order, OrderItem, StockReservation
+
+class OrderItemInline(admin.TabularInline):
+    model = OrderItem
+    extra = 0
+    readonly_fields = ['total']
+
+class StockReservationInline(admin.TabularInline):
+    model = StockReservation
+    extra = 0
+    can_delete = False
+    fields = ['product', 'variant', 'quantity', 'expires_at', 'released_at']
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ['order_number', 'user', 'status', 'total_amount', 'created_at']
+    list_select_related = ['user']
+    list_filter = ['status', 'created_at']
+    search_fields = ['order_number', 'user__email']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    readonly_fields = ['order_number', 'total_amount', 'created_at', 'updated_at']
+    inlines = [OrderItemInline, StockReservationInline]
+
+    def get_search_results(self, request, queryset, search_term):
+        # icontains yerine tam eşleşme; sipariş numarası ve e-posta üzerindeki benzersiz indeksler kullanılır
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        return queryset.filter(Q(order_number=term.upper()) | Q(user__email=term)), False
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        # Satış durumunda oluşturulan siparişin kalemleri sipariş kaydından sonra yazılır
+        sync_order_sales(form.instance)
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from orders.reservations import release_expired
+
+
+class Command(BaseCommand):
+    help = 'Süresi dolan stok rezervasyonlarını iade eder ve onay bekleyen siparişlerini iptal eder'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Tek işlemde işlenecek sipariş sayısı')
+
+    def handle(self, *args, **options):
+        released, cancelled = release_expired(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{released} rezervasyon iade edildi, {cancelled} sipariş iptal edildi.'))
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_admin_changelist_indexes'),
+        ('products', '0018_admin_changelist_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockReservation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(verbose_name='Adet')),
+                ('expires_at', models.DateTimeField(blank=True, null=True, verbose_name='Son Geçerlilik')),
+                ('released_at', models.DateTimeField(blank=True, null=True, verbose_name='İade Tarihi')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='orders.order', verbose_name='Sipariş')),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='products.product', verbose_name='Ürün')),
+                ('variant', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='products.productvariant', verbose_name='Varyant')),
+            ],
+            options={
+                'verbose_name': 'Stok Rezervasyonu',
+                'verbose_name_plural': 'Stok Rezervasyonları',
+                'indexes': [models.Index(fields=['released_at', 'expires_at'], name='reservation_expiry_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(models.Q(('product__isnull', False), ('variant__isnull', True)), models.Q(('product__isnull', True), ('variant__isnull', False)), _connector='OR'), name='reservation_product_or_variant')],
+            },
+        ),
+    ]
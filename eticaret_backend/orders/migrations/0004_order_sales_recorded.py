@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:44
+
+from django.db import migrations, models
+
+SALES_STATUSES = ('confirmed', 'shipped', 'delivered')
+
+
+def mark_recorded(apps, schema_editor):
+    # Satış durumundaki kalemli siparişler işlenmiş sayılır; sayaçları bununla
+    # eşitlemek için rebuild_sales_stats komutu çalıştırılmalıdır
+    Order = apps.get_model('orders', 'Order')
+    OrderItem = apps.get_model('orders', 'OrderItem')
+    Order.objects.filter(
+        status__in=SALES_STATUSES,
+        pk__in=OrderItem.objects.filter(product__isnull=False).values('order_id')
+    ).update(sales_recorded=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_stockreservation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='sales_recorded',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Satışa İşlendi'),
+        ),
+        migrations.RunPython(mark_recorded, migrations.RunPython.noop),
+    ]
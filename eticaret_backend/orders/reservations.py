@@ -0,0 +1,142 @@
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+from products.models import Product, ProductVariant
+
+from .models import Order, StockReservation
+
+
+class InsufficientStock(Exception):
+    """Talep edilen adetten az stoğu olan ürün/varyantlar: [{'product'|'variant': id, 'requested', 'available'}]"""
+
+    def __init__(self, shortages):
+        self.shortages = shortages
+        super().__init__('Yetersiz stok')
+
+
+class _Rollback(Exception):
+    pass
+
+
+def reservation_expiry(now=None):
+    return (now or timezone.now()) + settings.STOCK_RESERVATION_TTL
+
+
+def stock_demand(lines):
+    """
+    Satırları [(product_id, variant_ids, quantity)] stok kaynağı başına toplam talebe çevirir.
+
+    Varyant seçilen satır seçilen her varyantın stoğundan, seçilmeyen satır
+    ürün stoğundan düşer (stock-check ile aynı kural).
+    """
+    products, variants = Counter(), Counter()
+    for product_id, variant_ids, quantity in lines:
+        if variant_ids:
+            for variant_id in set(variant_ids):
+                variants[variant_id] += quantity
+        else:
+            products[product_id] += quantity
+    return products, variants
+
+
+def _amounts(demand):
+    return Case(*[When(pk=pk, then=Value(amount)) for pk, amount in demand.items()], output_field=IntegerField())
+
+
+def _decrement(model, demand, now):
+    # UPDATE ... SET stock = stock - n WHERE id IN (...) AND stock >= n; satır kilidi yalnızca bu ifade
+    # süresince tutulur. Koşulu sağlamayan satır güncellenmez, sayı eksik kalır.
+    if not demand:
+        return True
+    amounts = _amounts(demand)
+    updated = model.objects.filter(pk__in=demand, stock__gte=amounts).update(
+        stock=F('stock') - amounts, updated_at=now
+    )
+    return updated == len(demand)
+
+
+def _increment(model, demand, now):
+    if demand:
+        model.objects.filter(pk__in=demand).update(stock=F('stock') + _amounts(demand), updated_at=now)
+
+
+def _shortages(products, variants):
+    shortages = []
+    for key, model, demand in [('product', Product, products), ('variant', ProductVariant, variants)]:
+        stocks = dict(model.objects.filter(pk__in=demand).values_list('pk', 'stock'))
+        for pk, requested in demand.items():
+            available = max(stocks.get(pk, 0), 0)
+            if available < requested:
+                shortages.append({key: pk, 'requested': requested, 'available': available})
+    return shortages
+
+
+def reserve_stock(order, lines, now=None):
+    """
+    Siparişin satırları için stoğu tek işlemde düşer ve rezervasyonları yazar.
+
+    Ürünler ve varyantlar birer koşullu UPDATE ile düşülür; herhangi biri
+    yetmezse hiçbir stok değişmez ve InsufficientStock fırlatılır.
+    """
+    now = now or timezone.now()
+    products, variants = stock_demand(lines)
+    try:
+        with transaction.atomic():
+            if not (_decrement(Product, products, now) and _decrement(ProductVariant, variants, now)):
+                raise _Rollback
+            expires_at = reservation_expiry(now) if order.status == 'pending' else None
+            StockReservation.objects.bulk_create(
+                [StockReservation(order=order, product_id=pk, quantity=amount, expires_at=expires_at)
+                 for pk, amount in products.items()]
+                + [StockReservation(order=order, variant_id=pk, quantity=amount, expires_at=expires_at)
+                   for pk, amount in variants.items()]
+            )
+    except _Rollback:
+        raise InsufficientStock(_shortages(products, variants))
+
+
+def release_reservations(reservations, now=None):
+    """İade edilmemiş rezervasyonların stoğunu geri ekler; iade edilen rezervasyon sayısını döndürür"""
+    now = now or timezone.now()
+    with transaction.atomic():
+        # Aynı rezervasyonu eş zamanlı iki iade işleminin iki kez eklememesi için satırlar kilitlenir
+        rows = list(reservations.select_for_update().filter(released_at__isnull=True).values_list(
+            'pk', 'product_id', 'variant_id', 'quantity'
+        ))
+        if not rows:
+            return 0
+        products, variants = Counter(), Counter()
+        for _, product_id, variant_id, quantity in rows:
+            if variant_id:
+                variants[variant_id] += quantity
+            else:
+                products[product_id] += quantity
+        _increment(Product, products, now)
+        _increment(ProductVariant, variants, now)
+        StockReservation.objects.filter(pk__in=[row[0] for row in rows]).update(released_at=now)
+    return len(rows)
+
+
+def release_expired(now=None, batch_size=500):
+    """
+    Süresi dolan rezervasyonları iade eder ve onay bekleyen siparişlerini iptal eder.
+
+    (iade edilen rezervasyon, iptal edilen sipariş) sayılarını döndürür.
+    """
+    now = now or timezone.now()
+    released = cancelled = 0
+    while True:
+        order_ids = list(StockReservation.objects.filter(
+            released_at__isnull=True, expires_at__lte=now, order__status='pending'
+        ).order_by().values_list('order_id', flat=True).distinct()[:batch_size])
+        if not order_ids:
+            return released, cancelled
+        with transaction.atomic():
+            released += release_reservations(StockReservation.objects.filter(order_id__in=order_ids), now)
+            # Onay bekleyen sipariş satış sayılmadığı için iptal satış sayaçlarını etkilemez; update() yeterli
+            cancelled += Order.objects.filter(pk__in=order_ids, status='pending').update(
+                status='cancelled', updated_at=now
+            )
@@ -0,0 +1,87 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F, FilteredRelation, Q
+from products.inventory import sale_price
+from products.models import Product
+
+from .models import Order, OrderItem
+from .reservations import reserve_stock
+
+
+class CheckoutError(Exception):
+    """Sepet satırı geçersiz: ürün bulunamadı, satışta değil ya da varyant ürüne ait değil"""
+
+    def __init__(self, message, line=None):
+        self.message = message
+        self.line = line
+        super().__init__(message)
+
+
+def load_cart_products(lines):
+    """
+    Satırlardaki aktif ürünleri ve seçilen varyantların fiyat farklarını tek sorguyla yükler.
+
+    Seçilen varyantlar FilteredRelation ile LEFT JOIN edilir; ürün başına
+    {variant_id: price_adjustment} eşlemesi `chosen_variants` özniteliğine yazılır.
+    """
+    product_ids = {line['product'] for line in lines}
+    variant_ids = {variant_id for line in lines for variant_id in line['variant_ids']}
+    rows = Product.objects.filter(pk__in=product_ids, status='active').only(
+        'name', 'price', 'discounted_price', 'is_on_sale'
+    ).order_by()
+    if variant_ids:
+        rows = rows.annotate(
+            chosen=FilteredRelation('variants', condition=Q(variants__pk__in=variant_ids)),
+            chosen_variant_id=F('chosen__id'),
+            chosen_adjustment=F('chosen__price_adjustment'),
+        )
+
+    products = {}
+    variants = defaultdict(dict)
+    for row in rows:
+        products.setdefault(row.pk, row)
+        if getattr(row, 'chosen_variant_id', None) is not None:
+            variants[row.pk][row.chosen_variant_id] = row.chosen_adjustment
+    for pk, product in products.items():
+        product.chosen_variants = variants[pk]
+    return products
+
+
+def place_order(user, shipping_address, lines):
+    """
+    Sepet satırlarından [{product, variant_ids, quantity}] sipariş oluşturur.
+
+    Fiyatlar istemciden alınmaz: birim fiyat ürünün satış fiyatı ile seçilen
+    varyantların fiyat farklarının toplamıdır. Sipariş, kalemler (tek
+    bulk_create) ve stok rezervasyonu tek işlemde yazılır; sepet büyüdükçe
+    sorgu sayısı artmaz.
+    """
+    products = load_cart_products(lines)
+
+    items = []
+    total_amount = Decimal('0')
+    for index, line in enumerate(lines):
+        product = products.get(line['product'])
+        if product is None:
+            raise CheckoutError('Ürün bulunamadı ya da satışta değil', index)
+        variant_ids = list(dict.fromkeys(line['variant_ids']))
+        if any(variant_id not in product.chosen_variants for variant_id in variant_ids):
+            raise CheckoutError('Geçersiz varyant seçimi', index)
+
+        price = sale_price(product.price, product.discounted_price, product.is_on_sale) + sum(
+            (product.chosen_variants[variant_id] for variant_id in variant_ids), Decimal('0')
+        )
+        # bulk_create OrderItem.save'i çağırmadığı için toplam burada hesaplanır
+        total = price * line['quantity']
+        items.append(OrderItem(product=product, quantity=line['quantity'], price=price, total=total))
+        total_amount += total
+
+    with transaction.atomic():
+        order = Order.objects.create(user=user, shipping_address=shipping_address, total_amount=total_amount)
+        for item in items:
+            item.order = order
+        OrderItem.objects.bulk_create(items)
+        reserve_stock(order, [(line['product'], line['variant_ids'], line['quantity']) for line in lines])
+    return order
@@ -0,0 +1,27 @@
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from products.sales import SALES_STATUSES, record_order_sales, sync_order_sales
+from .models import Order, StockReservation
+from .reservations import release_reservations
+
+
+@receiver(post_save, sender=Order)
+def order_saved(sender, instance, created, **kwargs):
+    # Sipariş satış sayılan bir duruma girince kalemleri eklenir, çıkınca (ör. iptal) geri alınır
+    sync_order_sales(instance)
+    previous = getattr(instance, '_loaded_status', None)
+    counted = instance.status in SALES_STATUSES
+    if not created and instance.status != previous:
+        # İptalde düşülen stok iade edilir; onaylanan siparişin rezervasyonu artık süresi dolunca iade edilmez
+        if instance.status == 'cancelled':
+            release_reservations(instance.reservations.all())
+        elif counted:
+            StockReservation.objects.filter(order=instance, released_at__isnull=True).update(expires_at=None)
+    instance._loaded_status = instance.status
+
+
+@receiver(pre_delete, sender=Order)
+def order_deleted(sender, instance, **kwargs):
+    if instance.sales_recorded:
+        record_order_sales(instance, -1)
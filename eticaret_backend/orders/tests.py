@@ -1,3 +1,322 @@
-from django.test import TestCase
-
-# Create your tests here.
+import random
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import OperationalError, close_old_connections
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from products.models import Category, Product, ProductSalesDay, ProductSalesSummary, ProductVariant
+from products.sales import update_best_sellers
+from products.testing import CatalogFactory, QueryBudgetMixin
+from .models import Order, OrderItem, StockReservation
+from .reservations import reserve_stock
+
+
+class OrderQueryBudgetTests(QueryBudgetMixin, TestCase):
+
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.user = self.catalog.user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.create_orders(2)
+
+    def create_orders(self, count):
+        for _ in range(count):
+            order = Order.objects.create(user=self.user, total_amount=2000, shipping_address='Adres')
+            for product in self.catalog.products(2, reviews=0, variants=0):
+                OrderItem.objects.create(order=order, product=product, quantity=1, price=product.price)
+
+    def test_order_list(self):
+        self.assertQueryBudget(2, '/api/orders/', grow=lambda: self.create_orders(5))
+
+    def test_admin_order_changelist(self):
+        admin = get_user_model().objects.create_superuser(email='admin@example.com', password='parola')
+        self.client.force_login(admin)
+        self.assertQueryBudget(4, '/admin/orders/order/?status__exact=pending', grow=lambda: self.create_orders(5))
+
+
+class CheckoutTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.client = APIClient()
+        self.client.force_authenticate(self.catalog.user())
+
+    def cart(self, count):
+        lines = []
+        for product in self.catalog.products(count, images=0, reviews=0, discounted_price=900):
+            variant = product.variants.first()
+            ProductVariant.objects.filter(pk=variant.pk).update(price_adjustment=100)
+            lines.append({'product': product.pk, 'variant_ids': [variant.pk], 'quantity': 2})
+        return {'shipping_address': 'Adres', 'items': lines, 'total_amount': '1'}
+
+    def test_prices_are_computed_on_server(self):
+        response = self.client.post('/api/orders/', self.cart(2), format='json')
+        self.assertEqual(response.status_code, 201)
+        order = Order.objects.get()
+        # İstemcinin gönderdiği toplam yok sayılır: (900 indirimli + 100 varyant farkı) x 2 adet x 2 satır
+        self.assertEqual(order.total_amount, Decimal('4000.00'))
+        self.assertEqual(
+            list(order.items.values_list('price', 'total')), [(Decimal('1000.00'), Decimal('2000.00'))] * 2
+        )
+
+        other = self.catalog.product(images=0, reviews=0)
+        cart = self.cart(1)
+        cart['items'][0]['variant_ids'] = [other.variants.first().pk]
+        response = self.client.post('/api/orders/', cart, format='json')
+        self.assertEqual((response.status_code, response.json()['line']), (400, 0))
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_query_budget(self):
+        small = self.assertQueryBudget(11, '/api/orders/', method='post', data=self.cart(2), format='json')
+        # 20 satırlık sepet de aynı sayıda sorguyla yazılır
+        self.assertQueryBudget(small, '/api/orders/', method='post', data=self.cart(20), format='json')
+
+
+class SalesStatsTests(TestCase):
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.user = self.catalog.user()
+        self.laptop, self.mouse = self.catalog.products(2, images=0, variants=0, reviews=0)
+        self.today = timezone.localdate()
+
+    def order(self, status='pending', **quantities):
+        order = Order.objects.create(user=self.user, total_amount=0, shipping_address='Adres', status=status)
+        for name, quantity in quantities.items():
+            product = getattr(self, name)
+            OrderItem.objects.create(order=order, product=product, quantity=quantity, price=product.price)
+        return order
+
+    def counters(self, product):
+        day = ProductSalesDay.objects.filter(product=product, day=self.today).first()
+        summary = ProductSalesSummary.objects.filter(product=product).first()
+        return (day.units if day else 0, summary.units_7d if summary else 0, summary.units_30d if summary else 0)
+
+    def set_status(self, order, status):
+        order.status = status
+        order.save()
+
+    def test_counters_follow_status(self):
+        order = self.order(laptop=2, mouse=1)
+        self.assertEqual(self.counters(self.laptop), (0, 0, 0))
+        self.set_status(order, 'confirmed')
+        self.assertEqual((self.counters(self.laptop), self.counters(self.mouse)), ((2, 2, 2), (1, 1, 1)))
+        self.assertEqual(ProductSalesDay.objects.get(product=self.laptop).revenue, Decimal('2000.00'))
+        # Satış sayılan durumlar arasındaki geçiş sayaçları değiştirmez
+        self.set_status(order, 'shipped')
+        self.assertEqual(self.counters(self.laptop), (2, 2, 2))
+        self.set_status(order, 'cancelled')
+        self.assertEqual(self.counters(self.laptop), (0, 0, 0))
+        self.set_status(order, 'delivered')
+        self.assertEqual(self.counters(self.laptop), (2, 2, 2))
+        Order.objects.get(pk=order.pk).delete()
+        self.assertEqual(self.counters(self.laptop), (0, 0, 0))
+
+    def test_order_created_in_sales_status_is_symmetric(self):
+        order = self.order('confirmed', laptop=3)
+        # Kalemler sipariş kaydından sonra yazıldığı için henüz işlenmedi; iptal sayaçları eksiye düşürmez
+        self.assertFalse(Order.objects.get(pk=order.pk).sales_recorded)
+        self.set_status(order, 'cancelled')
+        self.assertEqual(self.counters(self.laptop), (0, 0, 0))
+        self.assertFalse(ProductSalesDay.objects.filter(units__lt=0).exists())
+
+        order = self.order('confirmed', laptop=3)
+        order.save()
+        self.assertEqual(self.counters(self.laptop), (3, 3, 3))
+        Order.objects.get(pk=order.pk).delete()
+        self.assertEqual(self.counters(self.laptop), (0, 0, 0))
+
+    def test_admin_status_change(self):
+        order = self.order(laptop=1)
+        admin = get_user_model().objects.create_superuser(email='admin@example.com', password='parola')
+        self.client.force_login(admin)
+        response = self.client.post(f'/admin/orders/order/{order.pk}/change/', {
+            'user': self.user.pk, 'status': 'confirmed', 'shipping_address': 'Adres',
+            'items-TOTAL_FORMS': 1, 'items-INITIAL_FORMS': 1,
+            'items-0-id': order.items.get().pk, 'items-0-order': order.pk, 'items-0-product': self.laptop.pk,
+            'items-0-quantity': 1, 'items-0-price': '1000.00',
+            'reservations-TOTAL_FORMS': 0, 'reservations-INITIAL_FORMS': 0,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.counters(self.laptop), (1, 1, 1))
+
+    def test_record_is_a_single_upsert(self):
+        with self.assertNumQueries(1):
+            ProductSalesDay.record(self.today, {self.laptop.pk: (2, Decimal('10.50')), self.mouse.pk: (1, Decimal('5'))})
+        with self.assertNumQueries(1):
+            ProductSalesDay.record(self.today, {self.laptop.pk: (3, Decimal('1.25'))})
+        ProductSalesDay.record(self.today, {self.mouse.pk: (1, Decimal('5'))}, sign=-1)
+        self.assertEqual(
+            set(ProductSalesDay.objects.values_list('product_id', 'units', 'revenue')),
+            {(self.laptop.pk, 5, Decimal('11.75')), (self.mouse.pk, 0, Decimal('0'))}
+        )
+
+    def test_summary_windows(self):
+        for days_ago, units in [(0, 1), (6, 2), (7, 4), (29, 8), (30, 16)]:
+            ProductSalesDay.objects.create(
+                product=self.laptop, day=self.today - timedelta(days=days_ago), units=units, revenue=units * 10
+            )
+        ProductSalesSummary.refresh(today=self.today)
+        summary = ProductSalesSummary.objects.get(product=self.laptop)
+        self.assertEqual((summary.units_7d, summary.units_30d), (3, 15))
+        self.assertEqual((summary.revenue_7d, summary.revenue_30d), (Decimal('30'), Decimal('150')))
+        # Pencereden çıkan satışlar ertesi günkü yenilemede düşer
+        ProductSalesSummary.refresh(today=self.today + timedelta(days=1))
+        summary.refresh_from_db()
+        self.assertEqual((summary.units_7d, summary.units_30d), (1, 7))
+
+    def test_update_best_sellers(self):
+        keyboard = self.catalog.product(images=0, variants=0, reviews=0)
+        other = Category.objects.create(name='Telefon')
+        phone = self.catalog.product(
+            category=other, subcategory=other.subcategories.create(name='Akıllı Telefon'), images=0, variants=0, reviews=0
+        )
+        for product, units in [(self.laptop, 5), (self.mouse, 9), (keyboard, 1), (phone, 2)]:
+            ProductSalesDay.objects.create(product=product, day=self.today, units=units, revenue=units)
+        Product.objects.filter(pk=keyboard.pk).update(is_best_seller=True)
+
+        self.assertEqual(update_best_sellers(top=1), (2, 3))
+        self.assertEqual(set(Product.objects.filter(is_best_seller=True).values_list('pk', flat=True)), {self.mouse.pk, phone.pk})
+        self.assertEqual(update_best_sellers(top=1), (2, 0))
+
+        # Pasif ürün sıralamaya girmez
+        Product.objects.filter(pk=self.mouse.pk).update(status='inactive')
+        self.assertEqual(update_best_sellers(top=1), (2, 2))
+        self.assertTrue(Product.objects.get(pk=self.laptop.pk).is_best_seller)
+
+
+class StockReservationTests(TestCase):
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.product = self.catalog.product(images=0, reviews=0, stock=5)
+        self.variant = self.product.variants.first()
+        self.client = APIClient()
+        self.client.force_authenticate(self.catalog.user())
+
+    def order(self, quantity, variant_ids=()):
+        return self.client.post('/api/orders/', {
+            'total_amount': '1000', 'shipping_address': 'Adres',
+            'items': [{'product': self.product.pk, 'variant_ids': list(variant_ids), 'quantity': quantity, 'price': '1000'}],
+        }, format='json')
+
+    def stocks(self):
+        return (
+            Product.objects.values_list('stock', flat=True).get(pk=self.product.pk),
+            ProductVariant.objects.values_list('stock', flat=True).get(pk=self.variant.pk),
+        )
+
+    def test_reserves_and_releases_on_cancel(self):
+        response = self.order(3)
+        self.assertEqual(response.status_code, 201)
+        response = self.order(2, [self.variant.pk])
+        self.assertEqual(self.stocks(), (2, 3))
+
+        # Stok yetmeyince sipariş hiç yazılmaz ve stok değişmez
+        response = self.order(4, [self.variant.pk])
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['shortages'], [{'variant': self.variant.pk, 'requested': 4, 'available': 3}])
+        self.assertEqual(Order.objects.count(), 2)
+        self.assertEqual(self.stocks(), (2, 3))
+
+        order = Order.objects.order_by('pk').first()
+        self.client.post(f'/api/orders/{order.pk}/cancel/')
+        self.assertEqual(self.stocks(), (5, 3))
+        # İkinci iade stoğu yeniden eklemez
+        order.refresh_from_db()
+        order.save()
+        self.assertEqual(self.stocks(), (5, 3))
+
+    def test_second_order_for_last_unit_fails(self):
+        Product.objects.filter(pk=self.product.pk).update(stock=1)
+        self.assertEqual(self.order(1).status_code, 201)
+
+        response = self.order(1)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['shortages'], [{'product': self.product.pk, 'requested': 1, 'available': 0}])
+        self.assertEqual(Order.objects.count(), 1)
+        self.assertEqual(StockReservation.objects.count(), 1)
+        self.assertEqual(self.stocks()[0], 0)
+
+    def test_expired_reservations(self):
+        with self.settings(STOCK_RESERVATION_TTL=timedelta(seconds=-1)):
+            self.order(2)
+        confirmed = Order.objects.create(user=self.catalog.user(), total_amount=1000, shipping_address='Adres')
+        reserve_stock(confirmed, [(self.product.pk, [], 1)])
+        confirmed.status = 'confirmed'
+        confirmed.save()
+        self.assertEqual(self.stocks()[0], 2)
+
+        out = StringIO()
+        call_command('release_expired_reservations', stdout=out)
+        # Onaylanan siparişin rezervasyonu süresizdir, yalnızca bekleyen iade edilir
+        self.assertIn('1 rezervasyon iade edildi, 1 sipariş iptal edildi', out.getvalue())
+        self.assertEqual(self.stocks()[0], 4)
+        self.assertEqual(sorted(Order.objects.values_list('status', flat=True)), ['cancelled', 'confirmed'])
+
+
+class ConcurrentReservationTests(TransactionTestCase):
+    """Eş zamanlı sipariş istekleri aynı stoğu aşırı satmamalı"""
+
+    THREADS = 8
+    # Kilit hatasında bir isteğin en fazla deneme sayısı; bekleme üstel artar ve 50 ms ile sınırlıdır
+    MAX_ATTEMPTS = 200
+
+    def post_order(self, client, line):
+        product_id, variant_ids, quantity = line
+        data = {
+            'total_amount': '1000', 'shipping_address': 'Adres',
+            'items': [{'product': product_id, 'variant_ids': variant_ids, 'quantity': quantity, 'price': '1000'}],
+        }
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                return client.post('/api/orders/', data, format='json')
+            except OperationalError:
+                # Test veritabanı (paylaşımlı bellek içi SQLite) yazma kilidini beklemeden hata verir;
+                # sipariş işlemi geri alınır, istek kısa bir beklemeden sonra yeniden denenir
+                time.sleep(random.uniform(0, min(0.001 * 2 ** attempt, 0.05)))
+        raise AssertionError(f'Sipariş isteği {self.MAX_ATTEMPTS} denemede tamamlanamadı')
+
+    def test_no_overselling(self):
+        catalog = CatalogFactory()
+        product = catalog.product(images=0, reviews=0, variants=1, stock=50)
+        variant = product.variants.get()
+        ProductVariant.objects.filter(pk=variant.pk).update(stock=30)
+        user = catalog.user()
+        statuses, errors = [], []
+        start = threading.Barrier(self.THREADS)
+
+        def worker(indexes):
+            client = APIClient()
+            client.force_authenticate(user)
+            start.wait()
+            try:
+                for index in indexes:
+                    # Çift sıradakiler ürün, tek sıradakiler varyant stoğundan ister
+                    line = (product.pk, [], 1) if index % 2 == 0 else (product.pk, [variant.pk], 1)
+                    statuses.append(self.post_order(client, line).status_code)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                close_old_connections()
+
+        threads = [threading.Thread(target=worker, args=(range(i, 200, self.THREADS),)) for i in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(statuses), 200)
+        self.assertEqual(set(statuses), {201, 409})
+        self.assertEqual(Product.objects.get(pk=product.pk).stock, 0)
+        self.assertEqual(ProductVariant.objects.get(pk=variant.pk).stock, 0)
+        self.assertEqual(StockReservation.objects.filter(product=product).count(), 50)
+        self.assertEqual(StockReservation.objects.filter(variant=variant).count(), 30)
+        self.assertEqual(Order.objects.count(), 80)
+
@@ -1,12 +1,12 @@
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from .views import OrderViewSet
-
-router = DefaultRouter()
-router.register('', OrderViewSet, basename='orders')
-
-urlpatterns = [
-    path('', include(router.urls)),
-    path('orders/', OrderViewSet.as_view({'get': 'list'}), name='order-list'),
-   
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .views import OrderViewSet
+
+router = DefaultRouter()
+router.register('', OrderViewSet, basename='orders')
+
+urlpatterns = [
+    path('', include(router.urls)),
+    path('orders/', OrderViewSet.as_view({'get': 'list'}), name='order-list'),
+   
 ]
\ No newline at end of file
@@ -1,7 +1,10 @@
-from django.apps import AppConfig
-
-
-class ProductsConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'products'
-    verbose_name = 'Ürünler'
+from django.apps import AppConfig
+
+
+class ProductsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'products'
+    verbose_name = 'Ürünler'
+
+    def ready(self):
+        from . import signals  # noqa: F401
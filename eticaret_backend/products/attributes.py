@@ -0,0 +1,173 @@
+import re
+
+from rest_framework.exceptions import ValidationError
+
+from .models import ProductAttribute, tr_normalize
+
+# Farklı kaynaklardaki özellik adlarının (ör. 'işlemci', 'İşlemci', 'ram', 'RAM')
+# normalize edilmiş hallerinin ortak anahtarları
+KEY_ALIASES = {
+    'ram': 'ram',
+    'bellek': 'ram',
+    'ram bellek': 'ram',
+    'ram kapasitesi': 'ram',
+    'depolama': 'depolama',
+    'disk kapasitesi': 'depolama',
+    'ssd kapasitesi': 'depolama',
+    'dahili hafiza': 'depolama',
+    'ekran': 'ekran',
+    'ekran boyutu': 'ekran',
+    'ekran buyuklugu': 'ekran',
+    'islemci': 'islemci',
+    'islemci modeli': 'islemci',
+    'ekran karti': 'ekran_karti',
+    'ekran karti modeli': 'ekran_karti',
+    'isletim sistemi': 'isletim_sistemi',
+    'yenileme hizi': 'yenileme_hizi',
+    'ekran yenileme hizi': 'yenileme_hizi',
+}
+
+NUMBER = r'(\d+(?:[.,]\d+)?)'
+SIZE_RE = re.compile(NUMBER + r'\s*(tb|gb|mb)\b')
+INCH_RE = re.compile(NUMBER + r'\s*(?:"|\'\'|inch|inc)')
+HZ_RE = re.compile(NUMBER + r'\s*hz\b')
+PLAIN_NUMBER_RE = re.compile(r'^\s*' + NUMBER + r'\s*$')
+
+SIZE_FACTORS = {'tb': 1024, 'gb': 1, 'mb': 1 / 1024}
+
+
+def _number(text):
+    return float(text.replace(',', '.'))
+
+
+def parse_size_gb(value):
+    match = SIZE_RE.search(value)
+    if match:
+        return _number(match.group(1)) * SIZE_FACTORS[match.group(2)]
+    return parse_plain(value)
+
+
+def parse_inches(value):
+    match = INCH_RE.search(value)
+    if match:
+        return _number(match.group(1))
+    return parse_plain(value)
+
+
+def parse_hz(value):
+    match = HZ_RE.search(value)
+    return _number(match.group(1)) if match else None
+
+
+def parse_plain(value):
+    match = PLAIN_NUMBER_RE.match(value)
+    return _number(match.group(1)) if match else None
+
+
+# Ortak anahtar -> sayısal değer ayrıştırıcı (birimler: GB, inç, Hz)
+NUMERIC_PARSERS = {
+    'ram': parse_size_gb,
+    'depolama': parse_size_gb,
+    'ekran': parse_inches,
+    'yenileme_hizi': parse_hz,
+}
+
+
+def canonical_key(key):
+    normalized = ' '.join(tr_normalize(str(key)).replace('_', ' ').split())
+    return KEY_ALIASES.get(normalized, normalized.replace(' ', '_'))
+
+
+def normalize_value(value):
+    return ' '.join(tr_normalize(str(value)).split())
+
+
+def parse_specs(specs):
+    """Serbest biçimli specs sözlüğünü {ortak_anahtar: (değer, sayısal_değer)} haline getirir"""
+    attributes = {}
+    if not isinstance(specs, dict):
+        return attributes
+
+    for key, raw_value in specs.items():
+        if raw_value in (None, ''):
+            continue
+        key = canonical_key(key)
+        if not key:
+            continue
+        value = normalize_value(raw_value)
+        parser = NUMERIC_PARSERS.get(key, parse_plain)
+        attributes.setdefault(key, (value, parser(value)))
+
+        # '15.6" 165Hz' gibi ekran değerlerindeki yenileme hızı ayrı özellik olarak da tutulur
+        if key == 'ekran':
+            refresh_rate = parse_hz(value)
+            if refresh_rate is not None:
+                attributes.setdefault('yenileme_hizi', (f'{refresh_rate:g}hz', refresh_rate))
+    return attributes
+
+
+def sync_attributes(products):
+    """Verilen ürünlerin özellik satırlarını specs alanından yeniden üretir (1 DELETE + 1 INSERT)"""
+    products = [product for product in products if product.pk]
+    if not products:
+        return
+
+    rows = [
+        ProductAttribute(
+            product_id=product.pk,
+            key=key[:50],
+            value=value[:255],
+            numeric_value=numeric_value
+        )
+        for product in products
+        for key, (value, numeric_value) in parse_specs(product.specs).items()
+    ]
+    ProductAttribute.objects.filter(product_id__in=[product.pk for product in products]).delete()
+    ProductAttribute.objects.bulk_create(rows, batch_size=500)
+
+
+# ?spec.ram__gte=16, ?spec.islemci=intel core i5, ?spec.depolama__in=512,1024
+SPEC_PARAM_PREFIX = 'spec.'
+SPEC_KEY_RE = re.compile(r'^[\w-]+$')
+SPEC_OPERATORS = {'exact', 'in', 'gt', 'gte', 'lt', 'lte'}
+
+
+def _spec_lookup(param, key, op, raw):
+    lookup = {'attributes__key': key}
+    if op in ('gt', 'gte', 'lt', 'lte'):
+        number = parse_plain(raw)
+        if number is None:
+            raise ValidationError({param: 'Sayısal bir değer bekleniyor.'})
+        lookup[f'attributes__numeric_value__{op}'] = number
+    elif op == 'in':
+        values = [value for value in raw.split(',') if value.strip()]
+        numbers = [parse_plain(value) for value in values]
+        if values and None not in numbers:
+            lookup['attributes__numeric_value__in'] = numbers
+        else:
+            lookup['attributes__value__in'] = [normalize_value(value) for value in values]
+    else:
+        number = parse_plain(raw)
+        if number is not None:
+            lookup['attributes__numeric_value'] = number
+        else:
+            lookup['attributes__value'] = normalize_value(raw)
+    return lookup
+
+
+def apply_spec_filters(queryset, query_params):
+    """`spec.<anahtar>[__op]` parametrelerini ProductAttribute üzerinden indeksli join'lere çevirir"""
+    for param in query_params:
+        if not param.startswith(SPEC_PARAM_PREFIX):
+            continue
+        key, separator, op = param[len(SPEC_PARAM_PREFIX):].partition('__')
+        if not SPEC_KEY_RE.match(key) or key.endswith('_'):
+            raise ValidationError({param: 'Geçersiz özellik filtresi.'})
+        op = op if separator else 'exact'
+        if op not in SPEC_OPERATORS:
+            raise ValidationError({param: f'Bilinmeyen operatör: {op}'})
+        key = canonical_key(key)
+        for raw in query_params.getlist(param):
+            # Her koşul ayrı join üretir; (ürün, anahtar) tekil olduğu için satırlar çoğalmaz
+            queryset = queryset.filter(**_spec_lookup(param, key, op, raw))
+    return queryset
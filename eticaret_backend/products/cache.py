@@ -0,0 +1,127 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework.response import Response
+
+
+def _version_key(namespace):
+    return f'cache-version:{namespace}'
+
+
+def get_version(namespace):
+    """Ad alanının güncel önbellek sürümü; sürüm artınca eski kayıtlar kendiliğinden geçersizleşir"""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Sürüm anahtarı düşmüşse eski kayıtlarla çakışmaması için zamana bağlı başlatılır
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(*namespaces):
+    """Sürümleri artırır; son ad alanının yeni sürümünü döndürür"""
+    version = None
+    for namespace in namespaces:
+        key = _version_key(namespace)
+        try:
+            version = cache.incr(key)
+        except ValueError:
+            version = time.time_ns()
+            cache.set(key, version, None)
+    return version
+
+
+# Sürüm başına değişen öğeler bu süre tutulur; kaydı düşen süreç kopyasını baştan yükler
+CHANGE_LOG_TIMEOUT = 60 * 60 * 24
+# Bundan fazla sürüm geride kalan süreç değişiklikleri tek tek okumak yerine kopyasını baştan yükler
+CHANGE_LOG_LIMIT = 500
+
+
+def _changes_key(namespace, version):
+    return f'cache-changes:{namespace}:{version}'
+
+
+def record_changes(namespace, items):
+    """Sürümü artırır ve yeni sürümde değişen öğeleri kaydeder"""
+    version = bump_version(namespace)
+    cache.set(_changes_key(namespace, version), list(items), CHANGE_LOG_TIMEOUT)
+
+
+def changes_since(namespace, since, version):
+    """
+    `since` sürümünden sonra `version` sürümüne kadar değişen öğeler.
+
+    Süreç içi kopyalar yalnızca bunları yeniden yükler. Kayıt eksikse ya da
+    aradaki fark çok büyükse None döner; kopya baştan yüklenmelidir.
+    """
+    if since is None or not 0 < version - since <= CHANGE_LOG_LIMIT:
+        return None
+    keys = [_changes_key(namespace, number) for number in range(since + 1, version + 1)]
+    logged = cache.get_many(keys)
+    if len(logged) != len(keys):
+        return None
+    return {item for items in logged.values() for item in items}
+
+
+def response_cache_namespace(model):
+    return f'api-response:{model._meta.label_lower}'
+
+
+def invalidate_responses(model):
+    # Commit'ten önce sürüm artarsa eş zamanlı bir istek eski veriyi yeniden önbelleğe yazabilir
+    namespace = response_cache_namespace(model)
+    transaction.on_commit(lambda: bump_version(namespace))
+
+
+class CachedResponseMixin:
+    """
+    Viewset'lerin GET yanıtlarını önbellekte tutar.
+
+    Anahtar mutlak URL (host ve şema mutlak resim adreslerini etkiler) ile
+    seçilen renderer'dan oluşur ve `cache_models` içindeki modellerin sürüm
+    numaralarını içerir. Bu modeller kaydedilince/silinince sinyaller sürümü
+    artırır, böylece yalnızca ilgili yanıtlar geçersizleşir.
+    """
+    cache_models = ()
+
+    def get_response_cache_key(self, request):
+        versions = ':'.join(
+            str(get_version(response_cache_namespace(model))) for model in self.cache_models
+        )
+        raw = f'{request.accepted_renderer.format}:{request.build_absolute_uri()}'
+        digest = hashlib.sha1(raw.encode('utf-8')).hexdigest()
+        return f'api-response:{self.basename}:{versions}:{digest}'
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return handler(request, *args, **kwargs)
+
+        key = self.get_response_cache_key(request)
+        # Anahtar bağımlı modellerin sürümlerini içerdiği için ETag olarak da kullanılır
+        etag = quote_etag(hashlib.sha1(key.encode('utf-8')).hexdigest())
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        data = cache.get(key)
+        if data is not None:
+            response = Response(data)
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, getattr(settings, 'API_RESPONSE_CACHE_TIMEOUT', 3600))
+        if response.status_code == 200:
+            response['ETag'] = etag
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
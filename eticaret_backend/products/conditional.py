@@ -0,0 +1,115 @@
+import hashlib
+
+from django.db.models import Count, Max, Q, Value
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .models import (
+    Category, ImageDerivative, Product, ProductImage, ProductSalesSummary, ProductVariant, RelatedProduct, Review,
+    SubCategory
+)
+
+
+def _watermark(queryset, source, field='updated_at'):
+    # (kaynak, en son güncelleme, satır sayısı); sabit değer GROUP BY'a girmediği
+    # için boş kümede de tek satır döner. Silinen satırlar sayıyı değiştirir.
+    return queryset.order_by().values(part=Value(source)).annotate(
+        updated=Max(field), count=Count('pk')
+    ).values_list('part', 'updated', 'count')
+
+
+def catalog_watermark(products, related_of=None):
+    """
+    Ürün kümesinin ve yanıta giren ilişkilerinin değişim imi.
+
+    `related_of` verilirse bu ürünlerin önceden hesaplanmış benzer ürün
+    satırları da ime katılır; liste ürünlerin updated_at'ine dokunmadan
+    yeniden hesaplanabilir.
+
+    Model örneği üretmeden tek bir UNION ALL toplama sorgusu çalıştırır; dönen
+    (last_modified, parçalar) çifti ETag ve Last-Modified üretmek için yeterlidir.
+    Yalnızca veritabanı durumuna dayandığı için her süreçte aynı sonucu verir.
+    """
+    product_ids = products.order_by().values('pk')
+    category_ids = products.order_by().values('category')
+    # Kategori serializer'ı kategorinin tüm alt kategorilerini içerir
+    subcategories = SubCategory.objects.filter(category__in=category_ids)
+    images = ProductImage.objects.filter(product__in=product_ids)
+    related = []
+    if related_of is not None:
+        related.append(_watermark(RelatedProduct.objects.filter(product__in=related_of.values('pk')), 'related'))
+    parts = list(_watermark(products, 'product').union(
+        _watermark(images, 'image'),
+        _watermark(ProductVariant.objects.filter(product__in=product_ids), 'variant'),
+        _watermark(Review.objects.filter(product__in=product_ids, is_approved=True), 'review'),
+        _watermark(Category.objects.filter(pk__in=category_ids), 'category'),
+        _watermark(subcategories, 'subcategory'),
+        # Çok satan sıralaması satış özetlerine göre değişir
+        _watermark(ProductSalesSummary.objects.filter(product__in=product_ids), 'sales'),
+        _watermark(ImageDerivative.objects.filter(
+            Q(source__in=images.values('image')) | Q(source__in=subcategories.values('image'))
+        ), 'derivative', field='created_at'),
+        *related,
+        all=True
+    ))
+    parts.sort()
+    last_modified = max((updated for _, updated, _ in parts if updated is not None), default=None)
+    return last_modified, parts
+
+
+class ConditionalGetMixin:
+    """
+    Ürün uç noktalarına ETag / Last-Modified desteği ekler.
+
+    Doğrulayıcılar `get_conditional_queryset` üzerinden ucuz toplama sorgularıyla
+    hesaplanır; istemcideki kopya güncelse serializer hiç çalışmadan 304 döner.
+    """
+
+    def get_conditional_queryset(self):
+        """(yanıttaki ürünler, benzer ürün listesi yanıta giren ürünler ya da None)"""
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action != 'retrieve':
+            return queryset, None
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        product = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        # Detay yanıtı benzer ürünleri de içerir: önceden hesaplanmış liste aynı kategoriden
+        # seçilir, liste yoksa kategorideki ürünlere düşülür. Listenin kendisi RelatedProduct
+        # satırlarından okunduğu için o satırlar da ime katılır.
+        products = Product.objects.filter(
+            Q(pk__in=product.values('pk'))
+            | Q(status='active', category__in=product.values('category'))
+        )
+        return products, product
+
+    def get_validators(self, request):
+        """
+        (ETag, Last-Modified) çifti.
+
+        Listelerde Last-Modified verilmez: en yeni ürün silinince ya da pasife
+        alınınca en büyük updated_at geri gider, liste değiştiği halde tarih
+        ilerlemez. Silinen satırları sayılar üzerinden yakalayan ETag yeterlidir.
+        """
+        last_modified, parts = catalog_watermark(*self.get_conditional_queryset())
+        raw = repr((request.accepted_renderer.format, request.get_full_path(), parts))
+        etag = quote_etag(hashlib.sha1(raw.encode('utf-8')).hexdigest())
+        return etag, last_modified if self.action == 'retrieve' else None
+
+    def conditional_response(self, request, handler, *args, **kwargs):
+        etag, last_modified = self.get_validators(request)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is not None:
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
@@ -0,0 +1,206 @@
+import logging
+import posixpath
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps
+
+from .cache import changes_since, get_version, record_changes, response_cache_namespace
+from .models import ImageDerivative
+from .storage import content_storage, derivative_storage
+
+logger = logging.getLogger(__name__)
+
+# Yeni türevler srcset alanlarını değiştirdiği için önbelleğe alınmış API yanıtları da bu sürüme bağlıdır
+DERIVATIVE_CACHE_NAMESPACE = response_cache_namespace(ImageDerivative)
+
+# Biçim -> (Pillow biçimi, dosya uzantısı, kayıt seçenekleri)
+FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def derivative_widths():
+    return sorted(getattr(settings, 'IMAGE_DERIVATIVE_WIDTHS', (160, 320, 640, 1280)))
+
+
+def derivative_name(source, width, extension):
+    root = posixpath.splitext(source)[0]
+    return f'{root}-w{width}.{extension}'
+
+
+def derivatives_changed(sources):
+    """
+    Kaynakların türevleri değiştiğinde sürümü artırır ve yeni sürümde değişen kaynakları kaydeder.
+
+    Süreçlerdeki DerivativeIndex kopyaları yalnızca bu kaynakları yeniden yükler.
+    """
+    record_changes(DERIVATIVE_CACHE_NAMESPACE, sources)
+
+
+def flatten(image):
+    """JPEG saydamlık taşımaz; saydam pikseller siyah yerine beyaz zemine oturtulur"""
+    if image.mode in ('RGB', 'L'):
+        return image
+    if image.has_transparency_data:
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def generate_derivatives(source):
+    """
+    Orijinalden her genişlik ve biçim için bir türev üretir; yazılan satır sayısını döndürür.
+
+    Orijinalden geniş türev üretilmez; orijinal genişlikte bir kopya her zaman
+    eklenir, böylece srcset'in en büyük adayı da sıkıştırılmış biçimde sunulur.
+    """
+    if ImageDerivative.objects.filter(source=source).exists():
+        return 0
+    with content_storage.open(source) as handle:
+        original = Image.open(handle)
+        original = ImageOps.exif_transpose(original)
+        original.load()
+
+    widths = [width for width in derivative_widths() if width < original.width] + [original.width]
+    rows = []
+    for width in widths:
+        height = max(1, round(original.height * width / original.width))
+        resized = original if width == original.width else original.resize((width, height), Image.LANCZOS)
+        for format_name, (pillow_format, extension, options) in FORMATS.items():
+            image = flatten(resized) if pillow_format == 'JPEG' else resized
+            buffer = BytesIO()
+            image.save(buffer, pillow_format, **options)
+            name = derivative_storage.save(derivative_name(source, width, extension), ContentFile(buffer.getvalue()))
+            rows.append(ImageDerivative(
+                source=source, format=format_name, width=width, height=height,
+                image=name, size=buffer.tell()
+            ))
+
+    ImageDerivative.objects.bulk_create(rows, ignore_conflicts=True)
+    derivatives_changed([source])
+    return len(rows)
+
+
+class DerivativeWorker:
+    """
+    Türev üretimini yükleme isteğinin dışında, bir iş parçacığı havuzunda yürütür.
+
+    Aynı kaynak için aynı anda tek iş kuyruğa alınır; IMAGE_DERIVATIVE_WORKERS
+    0 ise üretim çağıran iş parçacığında yapılır.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = set()
+        self._failed = set()
+
+    def _run(self, source):
+        try:
+            generate_derivatives(source)
+        except Exception:
+            # Bozuk ya da eksik dosya her istekte yeniden denenmesin
+            logger.exception('Resim türevleri üretilemedi: %s', source)
+            self._failed.add(source)
+        finally:
+            with self._lock:
+                self._pending.discard(source)
+
+    def submit(self, source):
+        if not source:
+            return
+        with self._lock:
+            if source in self._pending or source in self._failed:
+                return
+            self._pending.add(source)
+            workers = getattr(settings, 'IMAGE_DERIVATIVE_WORKERS', 2)
+            if workers and self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-derivatives')
+        if self._executor is None:
+            self._run(source)
+        else:
+            self._executor.submit(self._run, source)
+
+    def schedule(self, source):
+        """Kaydı yapan işlem commit edildikten sonra üretimi başlatır"""
+        transaction.on_commit(lambda: self.submit(source))
+
+
+derivative_worker = DerivativeWorker()
+
+
+class DerivativeIndex:
+    """
+    Kaynak adı -> türevler eşlemesinin süreç içi kopyası.
+
+    Serileştiriciler her resim için sorgu atmak yerine buradan okur. Eşleme ilk
+    okumada tek sorguyla yüklenir; sonra sürüm arttığında yalnızca aradaki
+    sürümlerde değişen kaynakların türevleri tek sorguyla yeniden okunur.
+    Değişiklik kaydı eksikse ya da çok gerideyse eşleme baştan yüklenir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._sources = {}
+
+    def get(self, source):
+        version = get_version(DERIVATIVE_CACHE_NAMESPACE)
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._refresh(version)
+        return self._sources.get(source, [])
+
+    def _refresh(self, version):
+        changed = changes_since(DERIVATIVE_CACHE_NAMESPACE, self._version, version)
+        rows = ImageDerivative.objects.order_by('width').values_list('source', 'format', 'width', 'image')
+        if changed is not None:
+            rows = rows.filter(source__in=changed)
+        sources = defaultdict(list)
+        for row_source, format_name, width, name in rows.iterator(chunk_size=2000):
+            sources[row_source].append((format_name, width, name))
+        if changed is None:
+            self._sources = dict(sources)
+        else:
+            # Okuyan iş parçacıkları kilitsiz okur; kaynaklar tek tek değiştirilir, eşleme hiç boşalmaz
+            for source in changed:
+                if source in sources:
+                    self._sources[source] = sources[source]
+                else:
+                    self._sources.pop(source, None)
+        self._version = version
+
+
+derivative_index = DerivativeIndex()
+
+
+def image_srcset(image, request=None):
+    """
+    Resim alanı için biçim başına srcset metni: {'webp': 'url 320w, ...', 'jpeg': ...}.
+
+    Türevler henüz üretilmemişse üretim kuyruğa alınır ve None döner;
+    istemci bu durumda orijinal resmi kullanır.
+    """
+    if not image:
+        return None
+    derivatives = derivative_index.get(image.name)
+    if not derivatives:
+        derivative_worker.schedule(image.name)
+        return None
+    srcset = defaultdict(list)
+    for format_name, width, name in derivatives:
+        url = derivative_storage.url(name)
+        if request:
+            url = request.build_absolute_uri(url)
+        srcset[format_name].append(f'{url} {width}w')
+    return {format_name: ', '.join(candidates) for format_name, candidates in srcset.items()}
@@ -0,0 +1,175 @@
+# Bu modül Django'ya bağımlı değildir; süreç havuzundaki işçiler onu doğrudan içe aktarır
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = lxml_html = None
+
+
+def parse_price(text):
+    return float(text.replace('TL', '').replace('.', '').replace(',', '.').strip())
+
+
+def _image_src(attributes):
+    # Tembel yüklenen resimlerde adres farklı özniteliklerde olabilir
+    for attr in ['src', 'data-src', 'data-original']:
+        if attributes.get(attr):
+            return attributes[attr]
+    return None
+
+
+def _absolute(page_url, url):
+    return urljoin(page_url, url) if url else None
+
+
+class Extractor:
+    """
+    Sayfa çözümleyici arayüzü.
+
+    `listing` kategori sayfasındaki kartları [{name, price, url, image_url}],
+    `detail` ürün sayfasını {image_url, specs} olarak döndürür. Sonuçlar düz
+    sözlüklerdir; süreçler arasında taşınabilir.
+    """
+
+    name = None
+
+    def listing(self, html, page_url):
+        raise NotImplementedError
+
+    def detail(self, html, page_url):
+        raise NotImplementedError
+
+
+class SoupExtractor(Extractor):
+    """BeautifulSoup + html.parser; ek bağımlılık gerektirmez ama yavaştır"""
+
+    name = 'soup'
+
+    def listing(self, html, page_url):
+        soup = BeautifulSoup(html, 'html.parser')
+        items = []
+        for card in soup.find_all('div', class_='product-list__content'):
+            name = card.find('div', class_='product-list__product-name')
+            price = card.find('span', class_='product-list__price')
+            link = card.find('a')
+            if not (name and price and link and link.get('href')):
+                continue
+            image = card.find('img')
+            items.append({
+                'name': name.text.strip(),
+                'price': parse_price(price.text),
+                'url': urljoin(page_url, link['href']),
+                'image_url': _absolute(page_url, _image_src(image) if image else None),
+            })
+        return items
+
+    def detail(self, html, page_url):
+        soup = BeautifulSoup(html, 'html.parser')
+        image = soup.find('img', class_='img-responsive')
+
+        specs = {}
+        table = soup.find('div', class_='product-table')
+        if table:
+            for row in table.find_all('tr'):
+                cols = row.find_all('td')
+                if len(cols) >= 2:
+                    specs[cols[0].text.strip()] = cols[1].text.strip()
+        return {'image_url': _absolute(page_url, _image_src(image) if image else None), 'specs': specs}
+
+
+def _class(name):
+    # BeautifulSoup'taki class_ eşleşmesi gibi: class listesinde bu ad geçmeli
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+class LxmlExtractor(Extractor):
+    """libxml2 ayrıştırıcısı ve önceden derlenmiş XPath ifadeleri; SoupExtractor ile aynı çıktıyı üretir"""
+
+    name = 'lxml'
+
+    def __init__(self):
+        if etree is None:
+            raise ValueError('lxml kurulu değil')
+        self.cards = etree.XPath(f"//div[{_class('product-list__content')}]")
+        self.card_name = etree.XPath(f"(.//div[{_class('product-list__product-name')}])[1]")
+        self.card_price = etree.XPath(f"(.//span[{_class('product-list__price')}])[1]")
+        self.card_link = etree.XPath('(.//a)[1]')
+        self.card_image = etree.XPath('(.//img)[1]')
+        self.detail_image = etree.XPath(f"(//img[{_class('img-responsive')}])[1]")
+        self.detail_rows = etree.XPath(f"(//div[{_class('product-table')}])[1]//tr")
+        self.row_cells = etree.XPath('.//td')
+
+    def parse(self, html):
+        try:
+            return lxml_html.document_fromstring(html)
+        except etree.ParserError:
+            # Boş belge
+            return None
+
+    @staticmethod
+    def first(path, element):
+        found = path(element)
+        return found[0] if found else None
+
+    def listing(self, html, page_url):
+        document = self.parse(html)
+        if document is None:
+            return []
+        items = []
+        for card in self.cards(document):
+            name = self.first(self.card_name, card)
+            price = self.first(self.card_price, card)
+            link = self.first(self.card_link, card)
+            if name is None or price is None or link is None or not link.get('href'):
+                continue
+            image = self.first(self.card_image, card)
+            items.append({
+                'name': name.text_content().strip(),
+                'price': parse_price(price.text_content()),
+                'url': urljoin(page_url, link.get('href')),
+                'image_url': _absolute(page_url, _image_src(image.attrib) if image is not None else None),
+            })
+        return items
+
+    def detail(self, html, page_url):
+        document = self.parse(html)
+        if document is None:
+            return {'image_url': None, 'specs': {}}
+        image = self.first(self.detail_image, document)
+
+        specs = {}
+        for row in self.detail_rows(document):
+            cols = self.row_cells(row)
+            if len(cols) >= 2:
+                specs[cols[0].text_content().strip()] = cols[1].text_content().strip()
+        return {'image_url': _absolute(page_url, _image_src(image.attrib) if image is not None else None), 'specs': specs}
+
+
+EXTRACTORS = {extractor.name: extractor for extractor in [SoupExtractor, LxmlExtractor]}
+
+DEFAULT_EXTRACTOR = 'lxml' if etree is not None else 'soup'
+
+# Süreç başına bir örnek; XPath ifadeleri yalnızca bir kez derlenir
+_instances = {}
+
+
+def get_extractor(name=None):
+    name = name or DEFAULT_EXTRACTOR
+    if name not in _instances:
+        if name not in EXTRACTORS:
+            raise ValueError(f'Bilinmeyen çözümleyici: {name}')
+        _instances[name] = EXTRACTORS[name]()
+    return _instances[name]
+
+
+def available_extractors():
+    return [name for name in EXTRACTORS if name != 'lxml' or etree is not None]
+
+
+def extract(name, kind, html, page_url):
+    """Süreç havuzuna gönderilen iş: `kind` 'listing' ya da 'detail'"""
+    return getattr(get_extractor(name), kind)(html, page_url)
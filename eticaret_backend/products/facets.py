@@ -0,0 +1,121 @@
+import hashlib
+from collections import Counter
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .attributes import canonical_key
+from .cache import bump_version, get_version
+from .models import tr_normalize
+
+FACET_CACHE_NAMESPACE = 'product-facets'
+
+# Alt sınır dahil, üst sınır hariç fiyat aralıkları (TL)
+PRICE_BUCKETS = [(0, 1000), (1000, 5000), (5000, 10000), (10000, 25000), (25000, 50000), (50000, None)]
+
+# Facet olarak sunulan özelliklerin ortak anahtarları (bkz. attributes.KEY_ALIASES)
+SPEC_FACETS = {
+    'ram': 'RAM',
+    'depolama': 'Depolama',
+    'ekran': 'Ekran Boyutu',
+}
+
+# Sayımları etkilemeyen parametreler önbellek anahtarına girmez
+IGNORED_PARAMS = {'cursor', 'page_size', 'fields', 'expand', 'ordering', 'format'}
+
+
+def invalidate_facets():
+    # Commit'ten önce sürüm artarsa eş zamanlı bir istek eski sayımları yeniden önbelleğe yazabilir
+    transaction.on_commit(lambda: bump_version(FACET_CACHE_NAMESPACE))
+
+
+def facet_cache_key(query_params):
+    items = sorted(
+        (key, value)
+        for key in query_params
+        if key not in IGNORED_PARAMS
+        for value in query_params.getlist(key)
+    )
+    digest = hashlib.sha1(repr(items).encode('utf-8')).hexdigest()
+    return f'{FACET_CACHE_NAMESPACE}:{get_version(FACET_CACHE_NAMESPACE)}:{digest}'
+
+
+def _price_bucket(price):
+    for index, (low, high) in enumerate(PRICE_BUCKETS):
+        if price >= low and (high is None or price < high):
+            return index
+    return None
+
+
+def compute_facets(queryset):
+    """Filtrelenmiş ürünler için tüm facet sayılarını tek sorgu ve tek geçişte hesaplar"""
+    rows = queryset.prefetch_related(None).order_by().values_list(
+        'category__slug', 'category__name',
+        'subcategory__slug', 'subcategory__name',
+        'price', 'is_on_sale', 'specs'
+    )
+
+    total = 0
+    categories, subcategories, prices, on_sale = Counter(), Counter(), Counter(), Counter()
+    names = {}
+    specs = {key: Counter() for key in SPEC_FACETS}
+    spec_labels = {}
+
+    for category_slug, category_name, subcategory_slug, subcategory_name, price, sale, product_specs in rows:
+        total += 1
+        categories[category_slug] += 1
+        subcategories[subcategory_slug] += 1
+        names[('category', category_slug)] = category_name
+        names[('subcategory', subcategory_slug)] = subcategory_name
+        prices[_price_bucket(price or Decimal(0))] += 1
+        on_sale[bool(sale)] += 1
+
+        if isinstance(product_specs, dict):
+            for key, value in product_specs.items():
+                facet = canonical_key(key)
+                if facet not in specs or value in (None, ''):
+                    continue
+                value = str(value).strip()
+                normalized = tr_normalize(value).replace(' ', '')
+                specs[facet][normalized] += 1
+                spec_labels.setdefault((facet, normalized), value)
+
+    return {
+        'total': total,
+        'categories': [
+            {'slug': slug, 'name': names[('category', slug)], 'count': count}
+            for slug, count in categories.most_common()
+        ],
+        'subcategories': [
+            {'slug': slug, 'name': names[('subcategory', slug)], 'count': count}
+            for slug, count in subcategories.most_common()
+        ],
+        'price_ranges': [
+            {'min': low, 'max': high, 'count': prices[index]}
+            for index, (low, high) in enumerate(PRICE_BUCKETS)
+            if prices[index]
+        ],
+        'on_sale': {'true': on_sale[True], 'false': on_sale[False]},
+        'specs': {
+            key: {
+                'label': label,
+                'values': [
+                    {'value': spec_labels[(key, normalized)], 'count': count}
+                    for normalized, count in specs[key].most_common()
+                ],
+            }
+            for key, label in SPEC_FACETS.items()
+            if specs[key]
+        },
+    }
+
+
+def get_facets(queryset, query_params):
+    key = facet_cache_key(query_params)
+    data = cache.get(key)
+    if data is None:
+        data = compute_facets(queryset)
+        cache.set(key, data, getattr(settings, 'PRODUCT_FACET_CACHE_TIMEOUT', 600))
+    return data
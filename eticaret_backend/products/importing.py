@@ -0,0 +1,354 @@
+import csv
+import hashlib
+import json
+import time
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .attributes import sync_attributes
+from .cache import bump_version
+from .facets import FACET_CACHE_NAMESPACE
+from .models import Category, Product, SlugAllocator, SubCategory, tr_normalize, tr_slugify
+from .search import get_search_backend
+from .similarity import refresh_related
+from .suggest import suggestion_index
+
+# Toplu içe aktarmada mevcut ürünlerde güncellenebilen alanlar; created_at ve slug korunur.
+# Yalnızca satırda bulunan sütunlar yazılır.
+UPDATE_FIELDS = [
+    'category', 'subcategory', 'description', 'price', 'discounted_price',
+    'is_on_sale', 'specs', 'stock', 'status',
+]
+
+# Mağazada yönetilen alanlar; mevcut ürünlerde yalnızca overwrite istenirse ezilir
+MANAGED_FIELDS = {'description', 'stock', 'status'}
+
+# Satırda değeri boş olsa da (ör. CSV'deki boş hücre) bulunduğu kabul edilen sütunlar
+NULLABLE_COLUMNS = {'discounted_price'}
+
+# Taranan ürünlerde karşılaştırılan alanlar; açıklama, stok ve durum mağazada yönetildiği için
+# (MANAGED_FIELDS) yalnızca ürün oluşturulurken yazılır
+SYNC_FIELDS = [
+    'category', 'subcategory', 'price', 'specs',
+    'source_url', 'source_image_url', 'source_hash',
+]
+
+
+class CatalogRowError(ValueError):
+    pass
+
+
+def read_rows(path, file_format=None):
+    """JSON Lines, CSV ya da JSON dizi dosyasındaki satırları sözlük olarak akıtır"""
+    path = Path(path)
+    file_format = file_format or {'.jsonl': 'jsonl', '.ndjson': 'jsonl', '.csv': 'csv'}.get(path.suffix, 'json')
+    with path.open(encoding='utf-8', newline='') as handle:
+        if file_format == 'jsonl':
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+        elif file_format == 'csv':
+            yield from csv.DictReader(handle)
+        else:
+            # vatan_products.json gibi tek bir dizi; dosya bir kez belleğe okunur
+            yield from json.load(handle)
+
+
+def _decimal(value, field, required=False):
+    if value in (None, ''):
+        if required:
+            raise CatalogRowError(f'{field} zorunlu')
+        return None
+    try:
+        return Decimal(str(value).replace(',', '.')).quantize(Decimal('0.01'))
+    except InvalidOperation:
+        raise CatalogRowError(f'Geçersiz {field}: {value}')
+
+
+def _specs(value):
+    if isinstance(value, str):
+        value = json.loads(value) if value.strip() else {}
+    return value if isinstance(value, dict) else {}
+
+
+class CatalogImporter:
+    """
+    Ürün satırlarını toplu olarak ekler/günceller.
+
+    Kategoriler bellekteki eşlemelerden çözülür, slug'lar SlugAllocator ile
+    kök başına tek sorguyla ayrılır. Her parti tek bir işlem içinde
+    bulk_create/bulk_update ile yazılır. Toplu yazma sinyalleri atladığı için
+    özellik tablosu, arama indeksi ve önbellekler burada açıkça güncellenir.
+    """
+
+    def __init__(self, batch_size=500, create_categories=False, default_category='Elektronik', overwrite=False):
+        self.batch_size = batch_size
+        self.create_categories = create_categories
+        self.default_category = default_category
+        self.overwrite = overwrite
+        self.slugs = SlugAllocator(Product)
+        self.categories = {}
+        self.subcategories = {}
+        for category in Category.objects.all():
+            self._remember(self.categories, category)
+        for subcategory in SubCategory.objects.select_related('category'):
+            self._remember(self.subcategories, subcategory)
+        self.touched_categories = set()
+        self.stats = {'read': 0, 'created': 0, 'updated': 0, 'skipped': 0}
+        self.errors = []
+
+    def _remember(self, mapping, obj):
+        mapping[obj.slug] = obj
+        mapping[tr_normalize(obj.name)] = obj
+
+    def _lookup(self, mapping, key):
+        key = str(key).strip()
+        return mapping.get(key) or mapping.get(tr_normalize(key)) or mapping.get(tr_slugify(key))
+
+    def resolve_categories(self, row):
+        category_key = row.get('category')
+        subcategory_key = row.get('subcategory')
+        if not subcategory_key:
+            # vatan_products.json'daki gibi yalnızca alt kategori slug'ı verilmiş olabilir
+            subcategory_key, category_key = category_key, None
+        if not subcategory_key:
+            raise CatalogRowError('Alt kategori belirtilmemiş')
+
+        subcategory = self._lookup(self.subcategories, subcategory_key)
+        if subcategory is not None:
+            return subcategory.category, subcategory
+        if not self.create_categories:
+            raise CatalogRowError(f'Alt kategori bulunamadı: {subcategory_key}')
+
+        category_key = category_key or self.default_category
+        category = self._lookup(self.categories, category_key)
+        if category is None:
+            category = Category.objects.create(name=category_key)
+            self._remember(self.categories, category)
+        subcategory = SubCategory.objects.create(category=category, name=str(subcategory_key).strip().title())
+        self._remember(self.subcategories, subcategory)
+        return category, subcategory
+
+    def build(self, row):
+        name = (row.get('name') or '').strip()
+        if not name:
+            raise CatalogRowError('Ürün adı boş')
+        category, subcategory = self.resolve_categories(row)
+        price = _decimal(row.get('price'), 'price', required=True)
+        discounted_price = _decimal(row.get('discounted_price'), 'discounted_price')
+        # Product.save ile aynı kural: indirimli fiyat fiyattan düşük değilse yok sayılır
+        if discounted_price is not None and discounted_price >= price:
+            discounted_price = None
+
+        description = row.get('description') or ''
+        if not description and row.get('url'):
+            # Yalnızca yeni ürünlere yazılır; satırda açıklama sütunu sayılmaz
+            description = f"Detaylı bilgi için: {row['url']}"
+        product = Product(
+            name=name,
+            category=category,
+            subcategory=subcategory,
+            description=description,
+            price=price,
+            discounted_price=discounted_price,
+            is_on_sale=bool(discounted_price),
+            specs=_specs(row.get('specs')),
+            stock=int(row.get('stock') or 0),
+            status=row.get('status') or 'active',
+        )
+        # Mevcut ürünlerde yalnızca satırda bulunan sütunlar güncellenir
+        product._row_fields = {'category', 'subcategory', 'price'} | {
+            field for field in ('description', 'discounted_price', 'specs', 'stock', 'status')
+            if field in row and (field in NULLABLE_COLUMNS or row[field] not in (None, ''))
+        }
+        if 'discounted_price' in product._row_fields:
+            product._row_fields.add('is_on_sale')
+        return product
+
+    def update_fields(self, product, current_discount):
+        """Mevcut ürün için yazılacak alanlar; fiyatla çelişen eski indirim de kaldırılır"""
+        fields = {field for field in product._row_fields if field in UPDATE_FIELDS}
+        if not self.overwrite:
+            fields -= MANAGED_FIELDS
+        if 'discounted_price' not in fields and current_discount is not None and current_discount >= product.price:
+            # Product.save ile aynı kural: fiyata eşit ya da büyük kalan indirimli fiyat kaldırılır
+            product.discounted_price = None
+            product.is_on_sale = False
+            fields |= {'discounted_price', 'is_on_sale'}
+        return tuple(sorted(fields))
+
+    def run(self, rows):
+        started = time.monotonic()
+        batch = []
+        for row in rows:
+            self.stats['read'] += 1
+            try:
+                batch.append(self.build(row))
+            except (ValueError, TypeError) as error:
+                self.stats['skipped'] += 1
+                self.errors.append((self.stats['read'], str(error)))
+                continue
+            if len(batch) >= self.batch_size:
+                self.write(batch)
+                batch = []
+        if batch:
+            self.write(batch)
+        self.finish()
+        self.stats['seconds'] = time.monotonic() - started
+        return self.stats
+
+    def write(self, products):
+        # Dosya içinde tekrar eden adlarda son satır geçerlidir
+        products = list({product.name: product for product in products}.values())
+        existing = {
+            name: (pk, discounted_price)
+            for name, pk, discounted_price in Product.objects.filter(
+                name__in=[product.name for product in products]
+            ).values_list('name', 'pk', 'discounted_price')
+        }
+        now = timezone.now()
+        created, updated = [], []
+        changes = defaultdict(list)
+        for product in products:
+            if product.name in existing:
+                product.pk, current_discount = existing[product.name]
+                product.updated_at = now
+                updated.append(product)
+                # Aynı sütunları içeren satırlar tek bulk_update ile yazılır
+                changes[self.update_fields(product, current_discount) + ('updated_at',)].append(product)
+            else:
+                product.slug = self.slugs.allocate(product.name)
+                created.append(product)
+
+        with transaction.atomic():
+            Product.objects.bulk_create(created, batch_size=self.batch_size)
+            for fields, group in changes.items():
+                Product.objects.bulk_update(group, fields, batch_size=self.batch_size)
+            # Arama indeksi ve benzer ürünler yazılmayan alanların güncel değerlerini kullanmalı
+            updated = list(Product.objects.filter(pk__in=[product.pk for product in updated]).select_related(
+                'category', 'subcategory'
+            )) if updated else []
+            sync_attributes(created + updated)
+            get_search_backend().index_products(created + updated)
+
+        self.stats['created'] += len(created)
+        self.stats['updated'] += len(updated)
+        self.touched_categories.update(product.category_id for product in products)
+
+    def finish(self):
+        if not self.touched_categories:
+            return
+        refresh_related(self.touched_categories)
+        suggestion_index.reset()
+        bump_version(FACET_CACHE_NAMESPACE)
+
+
+def content_hash(price, specs, image_url):
+    """Taranan ürünün fiyat, özellik ve resim adresinden üretilen özet"""
+    payload = json.dumps([str(price), specs or {}, image_url or ''], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CatalogSync(CatalogImporter):
+    """
+    Taranan ürünleri kaynak URL'lerine göre eşitler.
+
+    Her parti için kayıtlı özetler tek sorguyla okunur; özeti değişmeyen aktif
+    ürünlere hiç dokunulmaz, değişenlerde yalnızca farklı olan alanlar bulk_update
+    ile yazılır. Akışta görünen pasif ürünler yeniden etkinleştirilir. Kaynak
+    URL'si olmayan eski kayıtlar ada göre eşleştirilir.
+    """
+
+    def __init__(self, batch_size=50, **kwargs):
+        super().__init__(batch_size=batch_size, **kwargs)
+        self.stats.update(unchanged=0, disappeared=0)
+        self.seen = set()
+
+    def build(self, row):
+        url = (row.get('url') or '').strip()
+        if not url:
+            raise CatalogRowError('Kaynak URL\'si boş')
+        self.seen.add(url)
+        product = super().build(row)
+        product.source_url = url
+        product.source_image_url = row.get('image_url') or ''
+        product.source_hash = content_hash(product.price, product.specs, product.source_image_url)
+        return product
+
+    def write(self, products):
+        """Partiyi eşitler; kaynak URL -> (ürün, resim değişti mi) eşlemesini döndürür"""
+        products = {product.source_url: product for product in products}
+        stored = Product.objects.filter(
+            Q(source_url__in=list(products)) |
+            Q(source_url='', name__in=[product.name for product in products.values()])
+        ).only('name', 'slug', 'status', 'description', *SYNC_FIELDS)
+        by_url, by_name = {}, {}
+        for product in stored:
+            if product.source_url:
+                by_url[product.source_url] = product
+            else:
+                by_name[product.name] = product
+
+        now = timezone.now()
+        created, updated = [], []
+        changes = defaultdict(list)
+        result = {}
+        for url, product in products.items():
+            current = by_url.get(url) or by_name.get(product.name)
+            if current is None:
+                product.slug = self.slugs.allocate(product.name)
+                created.append(product)
+                result[url] = (product, True)
+            elif current.source_hash == product.source_hash and current.status == 'active':
+                self.stats['unchanged'] += 1
+                result[url] = (current, False)
+            else:
+                fields = tuple(
+                    field for field in SYNC_FIELDS
+                    if getattr(current, Product._meta.get_field(field).attname)
+                    != getattr(product, Product._meta.get_field(field).attname)
+                )
+                if current.status != 'active':
+                    # Kaybolduğu için pasife alınan ürün akışta yeniden görünürse özeti aynı olsa da etkinleştirilir
+                    product.status = 'active'
+                    fields += ('status',)
+                product.pk = current.pk
+                product.slug = current.slug
+                # Arama indeksi yazılmayan açıklamanın kayıtlı değerini kullanmalı
+                product.description = current.description
+                product.updated_at = now
+                updated.append(product)
+                # Aynı alanları değişen ürünler tek bulk_update ile yazılır
+                changes[fields + ('updated_at',)].append(product)
+                result[url] = (product, current.source_image_url != product.source_image_url)
+
+        with transaction.atomic():
+            Product.objects.bulk_create(created, batch_size=self.batch_size)
+            for fields, group in changes.items():
+                Product.objects.bulk_update(group, fields, batch_size=self.batch_size)
+            sync_attributes(created + updated)
+            get_search_backend().index_products(created + updated)
+
+        self.stats['created'] += len(created)
+        self.stats['updated'] += len(updated)
+        self.touched_categories.update(product.category_id for product in created + updated)
+        return result
+
+    def find_disappeared(self, subcategory_ids):
+        """Taranan alt kategorilerde olup bu taramada görülmeyen aktif ürünlerin id'leri"""
+        rows = Product.objects.filter(
+            subcategory_id__in=subcategory_ids,
+            status='active'
+        ).exclude(source_url='').values_list('pk', 'source_url', 'category_id')
+        missing = [(pk, category_id) for pk, url, category_id in rows if url not in self.seen]
+        self.stats['disappeared'] = len(missing)
+        return missing
+
+    def deactivate(self, missing):
+        Product.objects.filter(pk__in=[pk for pk, _ in missing]).update(status='inactive', updated_at=timezone.now())
+        self.touched_categories.update(category_id for _, category_id in missing)
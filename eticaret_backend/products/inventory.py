@@ -0,0 +1,88 @@
+from collections import Counter
+from decimal import Decimal
+
+from .models import Product, ProductVariant
+
+
+def sale_price(price, discounted_price, is_on_sale):
+    """Ürünün satış fiyatı: indirimdeyse indirimli fiyat, değilse liste fiyatı"""
+    if is_on_sale and discounted_price is not None:
+        return discounted_price
+    return price
+
+
+def check_availability(lines):
+    """
+    Sepet satırlarının [{product, variant_ids, quantity}] stok durumunu ve güncel fiyatını döndürür.
+
+    Tüm ürünler tek, istenen varyantlar tek sorguyla okunur. Aynı stoğu paylaşan
+    satırların (aynı ürün ya da aynı varyant) adetleri toplanarak karşılaştırılır.
+    Varyant seçilen satırda stok, seçilen varyantların en düşük stoğudur.
+    """
+    product_ids = {line['product'] for line in lines}
+    variant_ids = {variant_id for line in lines for variant_id in line.get('variant_ids', [])}
+
+    products = {
+        row[0]: row for row in Product.objects.filter(pk__in=product_ids, status='active').values_list(
+            'id', 'slug', 'name', 'price', 'discounted_price', 'is_on_sale', 'stock'
+        )
+    }
+    variants = {}
+    if variant_ids:
+        variants = {
+            row[0]: row for row in ProductVariant.objects.filter(
+                pk__in=variant_ids, product_id__in=products
+            ).values_list('id', 'product_id', 'stock', 'price_adjustment')
+        }
+
+    # Stok kaynağı başına toplam talep: ('product', id) ya da ('variant', id)
+    demand = Counter()
+    for line in lines:
+        for source in _stock_sources(line):
+            demand[source] += line.get('quantity', 1)
+
+    results = []
+    total = Decimal('0')
+    for line in lines:
+        quantity = line.get('quantity', 1)
+        result = {
+            'product': line['product'],
+            'variant_ids': list(dict.fromkeys(line.get('variant_ids', []))),
+            'quantity': quantity,
+        }
+        product = products.get(line['product'])
+        line_variants = [variants.get(variant_id) for variant_id in result['variant_ids']]
+        if product is None:
+            result.update(available=False, stock=0, error='Ürün bulunamadı')
+        elif any(variant is None or variant[1] != product[0] for variant in line_variants):
+            result.update(available=False, stock=0, error='Geçersiz varyant')
+        else:
+            _, slug, name, price, discounted_price, is_on_sale, product_stock = product
+            stock = min((variant[2] for variant in line_variants), default=product_stock)
+            stocks = {('variant', variant[0]): variant[2] for variant in line_variants} or {('product', product[0]): product_stock}
+            unit_price = sale_price(price, discounted_price, is_on_sale) + sum(
+                (variant[3] for variant in line_variants), Decimal('0')
+            )
+            result.update(
+                slug=slug,
+                name=name,
+                available=all(demand[source] <= source_stock for source, source_stock in stocks.items()),
+                stock=max(stock, 0),
+                price=price,
+                unit_price=unit_price,
+                total=unit_price * quantity,
+            )
+            total += result['total']
+        results.append(result)
+
+    return {
+        'available': all(result['available'] for result in results),
+        'total': total,
+        'lines': results,
+    }
+
+
+def _stock_sources(line):
+    if line.get('variant_ids'):
+        return [('variant', variant_id) for variant_id in set(line['variant_ids'])]
+    return [('product', line['product'])]
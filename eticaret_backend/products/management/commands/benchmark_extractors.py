@@ -0,0 +1,58 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from products.extractors import available_extractors, extract
+
+FIXTURES = Path(__file__).resolve().parents[2] / 'fixtures' / 'vatan'
+
+
+def load_pages(directory):
+    """Kaydedilmiş sayfalar; 'urun' dizinindekiler ürün, diğerleri kategori sayfasıdır"""
+    pages = []
+    for path in sorted(Path(directory).rglob('*.html')):
+        kind = 'detail' if path.parent.name == 'urun' else 'listing'
+        pages.append((kind, path.read_bytes(), f'https://www.vatanbilgisayar.com/{path.parent.name}/{path.name}'))
+    return pages
+
+
+class Command(BaseCommand):
+    help = 'HTML çözümleyicileri kaydedilmiş sayfalar üzerinde karşılaştırır (sayfa/sn)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fixtures', default=FIXTURES, help='Kaydedilmiş HTML sayfalarının dizini')
+        parser.add_argument('--repeat', type=int, default=200, help='Her sayfanın kaç kez çözümleneceği')
+        parser.add_argument('--workers', type=int, default=0, help='Süreç havuzu boyutu (0: tek süreç)')
+        parser.add_argument('--extractor', action='append', choices=available_extractors(), help='Yalnızca verilen çözümleyici(ler)')
+
+    def run(self, name, pages, workers):
+        jobs = [(name, kind, html, url) for kind, html, url in pages]
+        started = time.perf_counter()
+        if workers:
+            with ProcessPoolExecutor(workers, mp_context=get_context('spawn')) as pool:
+                # Süreç başlatma süresi ölçüme katılmasın
+                list(pool.map(extract, *zip(*jobs[:workers])))
+                started = time.perf_counter()
+                results = list(pool.map(extract, *zip(*jobs), chunksize=max(1, len(jobs) // (workers * 4))))
+        else:
+            results = [extract(*job) for job in jobs]
+        return time.perf_counter() - started, results
+
+    def handle(self, *args, **options):
+        pages = load_pages(options['fixtures'])
+        if not pages:
+            raise CommandError(f"HTML sayfası bulunamadı: {options['fixtures']}")
+        pages = pages * options['repeat']
+
+        reference = None
+        for name in options['extractor'] or available_extractors():
+            elapsed, results = self.run(name, pages, options['workers'])
+            rate = len(pages) / elapsed if elapsed else 0
+            self.stdout.write(f'{name}: {len(pages)} sayfa, {elapsed:.2f} sn, {rate:.0f} sayfa/sn')
+            # Tüm çözümleyiciler aynı çıktıyı üretmeli
+            if reference is None:
+                reference = (name, results)
+            elif results != reference[1]:
+                self.stdout.write(self.style.WARNING(f'{name} çıktısı {reference[0]} ile aynı değil'))
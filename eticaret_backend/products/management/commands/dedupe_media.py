@@ -0,0 +1,91 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Case, Value, When
+from django.utils import timezone
+from products.cache import invalidate_responses
+from products.models import ProductImage, Slider, SubCategory
+from products.storage import content_storage
+
+# İçerik adresli depoya taşınan resim alanları
+IMAGE_FIELDS = [(ProductImage, 'image'), (SubCategory, 'image'), (Slider, 'image')]
+
+
+def format_bytes(size):
+    for unit in ['B', 'KB', 'MB']:
+        if abs(size) < 1024:
+            return f'{size:.0f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GB'
+
+
+class Command(BaseCommand):
+    help = 'Mevcut resimleri SHA-256 adlı depoya taşır, aynı içerikli kopyaları tek dosyada birleştirir'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Değişiklik yapmadan kazanılacak alanı hesapla')
+        parser.add_argument('--keep-originals', action='store_true', help='Eski dosyaları silme')
+        parser.add_argument('--batch-size', type=int, default=500, help='Tek UPDATE ile yeniden adlandırılan dosya sayısı')
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        storage = content_storage
+        renamed = {}
+        # Bu çalıştırmada depoya eklenen (önceden olmayan) dosyalar
+        created = set()
+        stats = {'files': 0, 'missing': 0, 'already': 0, 'removed_bytes': 0, 'written_bytes': 0}
+
+        for model, field in IMAGE_FIELDS:
+            names = model.objects.exclude(**{field: ''}).exclude(
+                **{f'{field}__isnull': True}
+            ).order_by().values_list(field, flat=True).distinct()
+
+            model_renames = {}
+            for name in names.iterator():
+                if storage.is_hashed(name):
+                    stats['already'] += 1
+                    continue
+                if name not in renamed:
+                    if not storage.exists(name):
+                        stats['missing'] += 1
+                        self.stdout.write(self.style.WARNING(f'Dosya bulunamadı: {name}'))
+                        continue
+                    with storage.open(name) as handle:
+                        target = storage.hashed_name(name, handle)
+                        if target not in created and not storage.exists(target):
+                            created.add(target)
+                            stats['written_bytes'] += storage.size(name)
+                            if not dry_run:
+                                storage.save(name, handle)
+                    renamed[name] = target
+                    stats['files'] += 1
+                    stats['removed_bytes'] += storage.size(name)
+                model_renames[name] = renamed[name]
+
+            if model_renames and not dry_run:
+                self.rename(model, field, model_renames, options['batch_size'])
+
+        if not dry_run and not options['keep_originals']:
+            for name in renamed:
+                storage.delete(name)
+
+        removed = 0 if options['keep_originals'] and not dry_run else stats['removed_bytes']
+        reclaimed = removed - stats['written_bytes']
+        prefix = '(deneme) ' if dry_run else ''
+        self.stdout.write(
+            f"{prefix}{stats['files']} dosya taşındı, {len(created)} benzersiz içerik, "
+            f"{stats['already']} zaten içerik adresli, {stats['missing']} eksik"
+        )
+        self.stdout.write(self.style.SUCCESS(f'{prefix}Kazanılan alan: {format_bytes(reclaimed)}'))
+
+    def rename(self, model, field, renames, batch_size):
+        # Yeniden adlandırma toplu UPDATE ile yapılır; sinyaller çalışmadığı için önbellekler elle geçersiz kılınır
+        items = list(renames.items())
+        extra = {'updated_at': timezone.now()} if any(f.name == 'updated_at' for f in model._meta.fields) else {}
+        with transaction.atomic():
+            for start in range(0, len(items), batch_size):
+                batch = items[start:start + batch_size]
+                model.objects.filter(**{f'{field}__in': [old for old, _ in batch]}).update(
+                    **{field: Case(*[When(**{field: old}, then=Value(new)) for old, new in batch])},
+                    **extra
+                )
+            invalidate_responses(model)
@@ -0,0 +1,45 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from products.derivatives import derivatives_changed, generate_derivatives
+from products.models import ImageDerivative, ProductImage, Slider, SubCategory
+from products.storage import derivative_storage
+
+
+class Command(BaseCommand):
+    help = 'Türevi olmayan ürün, alt kategori ve slider resimleri için küçük boyutlu WebP/JPEG türevler üretir'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Eş zamanlı üretim sayısı')
+        parser.add_argument('--force', action='store_true', help='Mevcut türevleri silip yeniden üret')
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        sources = set()
+        for model in [ProductImage, SubCategory, Slider]:
+            sources.update(model.objects.exclude(image='').exclude(image__isnull=True).values_list('image', flat=True))
+
+        if options['force']:
+            for name in ImageDerivative.objects.filter(source__in=sources).values_list('image', flat=True):
+                derivative_storage.delete(name)
+            ImageDerivative.objects.filter(source__in=sources).delete()
+            # Yeniden üretilemeyen kaynaklar da süreç içi eşlemelerden düşsün
+            derivatives_changed(sources)
+        else:
+            sources -= set(ImageDerivative.objects.values_list('source', flat=True).distinct())
+
+        created = failed = 0
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as pool:
+            futures = {pool.submit(generate_derivatives, source): source for source in sorted(sources)}
+            for future, source in futures.items():
+                try:
+                    created += future.result()
+                except Exception as error:
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f'{source}: {error}'))
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(sources) - failed} resim için {created} türev üretildi, {failed} hata ({elapsed:.1f} sn)'
+        ))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from products.importing import CatalogImporter, read_rows
+
+
+class Command(BaseCommand):
+    help = 'JSON Lines, CSV veya JSON dizi dosyasından ürünleri toplu olarak içe aktarır'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='İçe aktarılacak dosya (ör. vatan_products.json)')
+        parser.add_argument('--format', choices=['jsonl', 'csv', 'json'], help='Dosya biçimi; verilmezse uzantıdan anlaşılır')
+        parser.add_argument('--batch-size', type=int, default=500, help='Tek işlemde yazılacak satır sayısı')
+        parser.add_argument('--create-categories', action='store_true', help='Bulunamayan kategori ve alt kategorileri oluştur')
+        parser.add_argument('--default-category', default='Elektronik', help='Yeni alt kategoriler için üst kategori')
+        parser.add_argument('--overwrite', action='store_true', help='Mevcut ürünlerin açıklama, stok ve durumunu da dosyadakiyle değiştir')
+
+    def handle(self, *args, **options):
+        importer = CatalogImporter(
+            batch_size=options['batch_size'],
+            create_categories=options['create_categories'],
+            default_category=options['default_category'],
+            overwrite=options['overwrite'],
+        )
+        try:
+            stats = importer.run(read_rows(options['path'], options['format']))
+        except (OSError, ValueError) as error:
+            raise CommandError(f'Dosya okunamadı: {error}')
+
+        for line, error in importer.errors[:20]:
+            self.stdout.write(self.style.WARNING(f'Satır {line}: {error}'))
+        rate = stats['read'] / stats['seconds'] if stats['seconds'] else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"{stats['read']} satır okundu: {stats['created']} eklendi, {stats['updated']} güncellendi, "
+            f"{stats['skipped']} atlandı ({stats['seconds']:.1f} sn, {rate:.0f} satır/sn)"
+        ))
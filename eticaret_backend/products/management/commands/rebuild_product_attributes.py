@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from products.attributes import sync_attributes
+from products.models import Product
+
+
+class Command(BaseCommand):
+    help = 'Ürün özellik tablosunu specs alanlarından yeniden oluşturur'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Tek seferde işlenecek ürün sayısı')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        products = Product.objects.only('specs').order_by('pk')
+        count = 0
+        batch = []
+        with transaction.atomic():
+            for product in products.iterator(chunk_size=batch_size):
+                batch.append(product)
+                if len(batch) >= batch_size:
+                    sync_attributes(batch)
+                    count += len(batch)
+                    batch = []
+            sync_attributes(batch)
+            count += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'{count} ürünün özellikleri yeniden oluşturuldu.'))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from products.models import Product, ProductRatingSummary
+
+
+class Command(BaseCommand):
+    help = 'Ürün puan özetlerini onaylı yorumlardan sıfırdan yeniden oluşturur'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Tek seferde işlenecek ürün sayısı')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        product_ids = list(Product.objects.order_by('pk').values_list('pk', flat=True))
+
+        with transaction.atomic():
+            ProductRatingSummary.objects.all().delete()
+            for start in range(0, len(product_ids), batch_size):
+                ProductRatingSummary.refresh(product_ids[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(f'{len(product_ids)} ürün için puan özeti yeniden oluşturuldu.'))
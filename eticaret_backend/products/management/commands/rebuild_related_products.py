@@ -0,0 +1,17 @@
+import time
+
+from django.core.management.base import BaseCommand
+from products.similarity import refresh_related
+
+
+class Command(BaseCommand):
+    help = 'Benzer ürün listelerini içerik benzerliğine göre yeniden hesaplar'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--category', type=int, action='append', help='Yalnızca verilen kategori id(ler)i')
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        count = refresh_related(options['category'])
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f'{count} benzer ürün bağlantısı {elapsed:.1f} sn içinde yazıldı.'))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from products.sales import rebuild_sales_days
+
+
+class Command(BaseCommand):
+    help = 'Günlük satış satırlarını ve satış özetlerini sipariş kalemlerinden yeniden oluşturur'
+
+    def handle(self, *args, **options):
+        count = rebuild_sales_days()
+        self.stdout.write(self.style.SUCCESS(f'{count} günlük satış satırı oluşturuldu.'))
@@ -0,0 +1,21 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from products.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Ürün arama indeksini sıfırdan oluşturur'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Tek seferde indekslenecek ürün sayısı')
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        started = time.monotonic()
+        with transaction.atomic():
+            count = backend.rebuild(batch_size=options['batch_size'])
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'{type(backend).__name__}: {count} ürün {elapsed:.2f} saniyede indekslendi.'
+        ))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from products.sales import update_best_sellers
+
+
+class Command(BaseCommand):
+    help = 'Satış pencerelerini kaydırır ve her kategoride en çok satan ürünleri işaretler (günlük çalıştırılmalı)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, help='Kategori başına çok satan ürün sayısı')
+
+    def handle(self, *args, **options):
+        marked, changed = update_best_sellers(options['top'])
+        self.stdout.write(self.style.SUCCESS(f'{marked} ürün çok satan olarak işaretli, {changed} ürünün bayrağı değişti.'))
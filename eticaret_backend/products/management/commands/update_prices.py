@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+from products import pricing
+from products.models import Product
+
+
+class Command(BaseCommand):
+    help = 'Filtrelenen ürünlerin fiyatlarını ve indirimlerini toplu UPDATE ile değiştirir'
+
+    def add_arguments(self, parser):
+        operation = parser.add_mutually_exclusive_group(required=True)
+        operation.add_argument('--price', metavar='DEĞER', help='Fiyat değişikliği; yüzde modunda ör. 10 ya da -5, tutar modunda TL')
+        operation.add_argument('--discount', metavar='DEĞER', help='Güncel fiyat üzerinden indirim, ör. 15')
+        operation.add_argument('--clear-discount', action='store_true', help='İndirimleri kaldır')
+        parser.add_argument('--mode', choices=pricing.PRICE_MODES, default='percent', help='Değer yüzde mi tutar mı')
+        parser.add_argument('--category', action='append', help='Kategori slug(ları)')
+        parser.add_argument('--subcategory', action='append', help='Alt kategori slug(ları)')
+        parser.add_argument('--status', choices=[choice for choice, _ in Product.STATUS_CHOICES], help='Yalnızca bu durumdaki ürünler')
+        parser.add_argument('--min-price', type=float, help='Fiyatı en az bu olan ürünler')
+        parser.add_argument('--max-price', type=float, help='Fiyatı en fazla bu olan ürünler')
+        parser.add_argument('--dry-run', action='store_true', help='Değişiklik yapmadan etkilenecek ürün sayısını göster')
+
+    def handle(self, *args, **options):
+        products = Product.objects.all()
+        if options['category']:
+            products = products.filter(category__slug__in=options['category'])
+        if options['subcategory']:
+            products = products.filter(subcategory__slug__in=options['subcategory'])
+        if options['status']:
+            products = products.filter(status=options['status'])
+        if options['min_price'] is not None:
+            products = products.filter(price__gte=options['min_price'])
+        if options['max_price'] is not None:
+            products = products.filter(price__lte=options['max_price'])
+
+        dry_run = options['dry_run']
+        try:
+            if options['price'] is not None:
+                count = pricing.change_prices(products, options['mode'], options['price'], dry_run=dry_run)
+            elif options['discount'] is not None:
+                count = pricing.apply_discounts(products, options['mode'], options['discount'], dry_run=dry_run)
+            else:
+                count = pricing.clear_discounts(products, dry_run=dry_run)
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        if dry_run:
+            self.stdout.write(f'(deneme) {count} ürün etkilenecek')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{count} ürün güncellendi'))
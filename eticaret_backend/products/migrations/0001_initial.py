@@ -1,130 +1,130 @@
-# Generated by Django 5.1.2 on 2024-12-18 16:22
-
-import django.core.validators
-import django.db.models.deletion
-from django.conf import settings
-from django.db import migrations, models
-
-
-class Migration(migrations.Migration):
-
-    initial = True
-
-    dependencies = [
-        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
-    ]
-
-    operations = [
-        migrations.CreateModel(
-            name='Category',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=100, verbose_name='Kategori Adı')),
-                ('slug', models.SlugField(max_length=250, unique=True)),
-            ],
-            options={
-                'verbose_name': 'Kategori',
-                'verbose_name_plural': 'Kategoriler',
-            },
-        ),
-        migrations.CreateModel(
-            name='Product',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=200, verbose_name='Ürün Adı')),
-                ('slug', models.SlugField(default='', unique=True, verbose_name='URL')),
-                ('description', models.TextField(verbose_name='Açıklama')),
-                ('price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Fiyat')),
-                ('specs', models.JSONField(blank=True, default=dict, null=True, verbose_name='Özellikler')),
-                ('stock', models.IntegerField(default=0, verbose_name='Stok')),
-                ('status', models.CharField(choices=[('active', 'Aktif'), ('inactive', 'Pasif')], default='active', max_length=10, verbose_name='Durum')),
-                ('is_best_seller', models.BooleanField(default=False, verbose_name='Çok Satan')),
-                ('is_featured', models.BooleanField(default=False, verbose_name='Öne Çıkan')),
-                ('is_on_sale', models.BooleanField(default=False, verbose_name='İndirimde')),
-                ('discounted_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='İndirimli Fiyat')),
-                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
-                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi')),
-                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.category', verbose_name='Kategori')),
-            ],
-            options={
-                'verbose_name': 'Ürün',
-                'verbose_name_plural': 'Ürünler',
-                'ordering': ['-created_at'],
-            },
-        ),
-        migrations.CreateModel(
-            name='ProductImage',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('image', models.ImageField(upload_to='products/', verbose_name='Ürün Resmi')),
-                ('is_primary', models.BooleanField(default=False, verbose_name='Ana Resim')),
-                ('order', models.IntegerField(default=0, verbose_name='Sıralama')),
-                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='products.product')),
-            ],
-            options={
-                'verbose_name': 'Ürün Resmi',
-                'verbose_name_plural': 'Ürün Resimleri',
-                'ordering': ['order'],
-            },
-        ),
-        migrations.CreateModel(
-            name='SubCategory',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=100, verbose_name='Alt Kategori Adı')),
-                ('slug', models.SlugField(max_length=250, unique=True)),
-                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subcategories', to='products.category', verbose_name='Kategori')),
-            ],
-            options={
-                'verbose_name': 'Alt Kategori',
-                'verbose_name_plural': 'Alt Kategoriler',
-            },
-        ),
-        migrations.AddField(
-            model_name='product',
-            name='subcategory',
-            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.subcategory', verbose_name='Alt Kategori'),
-        ),
-        migrations.CreateModel(
-            name='ProductVariant',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('variant_type', models.CharField(choices=[('color', 'Renk'), ('storage', 'Depolama'), ('size', 'Boyut')], max_length=20, verbose_name='Özellik Tipi')),
-                ('name', models.CharField(max_length=100, verbose_name='Özellik Değeri')),
-                ('sku', models.CharField(blank=True, max_length=100, null=True, verbose_name='Stok Kodu')),
-                ('stock', models.IntegerField(default=0, verbose_name='Stok')),
-                ('price_adjustment', models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Fiyat Farkı')),
-                ('is_default', models.BooleanField(default=False, verbose_name='Varsayılan Seçenek')),
-                ('created_at', models.DateTimeField(auto_now_add=True)),
-                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='variants', to='products.product', verbose_name='Ürün')),
-            ],
-            options={
-                'verbose_name': 'Ürün Varyantı',
-                'verbose_name_plural': 'Ürün Varyantları',
-                'ordering': ['variant_type', 'name'],
-                'unique_together': {('product', 'variant_type', 'name')},
-            },
-        ),
-        migrations.CreateModel(
-            name='Review',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('rating', models.IntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)], verbose_name='Puan')),
-                ('comment', models.TextField(verbose_name='Yorum')),
-                ('pros', models.TextField(blank=True, null=True, verbose_name='Artıları')),
-                ('cons', models.TextField(blank=True, null=True, verbose_name='Eksileri')),
-                ('is_verified_purchase', models.BooleanField(default=False, verbose_name='Doğrulanmış Alışveriş')),
-                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
-                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi')),
-                ('is_approved', models.BooleanField(default=False, verbose_name='Onaylı')),
-                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='products.product', verbose_name='Ürün')),
-                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='Kullanıcı')),
-            ],
-            options={
-                'verbose_name': 'Ürün Yorumu',
-                'verbose_name_plural': 'Ürün Yorumları',
-                'ordering': ['-created_at'],
-                'unique_together': {('product', 'user')},
-            },
-        ),
-    ]
+# Generated by Django 5.1.2 on 2024-12-18 16:22
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Kategori Adı')),
+                ('slug', models.SlugField(max_length=250, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Kategori',
+                'verbose_name_plural': 'Kategoriler',
+            },
+        ),
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200, verbose_name='Ürün Adı')),
+                ('slug', models.SlugField(default='', unique=True, verbose_name='URL')),
+                ('description', models.TextField(verbose_name='Açıklama')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Fiyat')),
+                ('specs', models.JSONField(blank=True, default=dict, null=True, verbose_name='Özellikler')),
+                ('stock', models.IntegerField(default=0, verbose_name='Stok')),
+                ('status', models.CharField(choices=[('active', 'Aktif'), ('inactive', 'Pasif')], default='active', max_length=10, verbose_name='Durum')),
+                ('is_best_seller', models.BooleanField(default=False, verbose_name='Çok Satan')),
+                ('is_featured', models.BooleanField(default=False, verbose_name='Öne Çıkan')),
+                ('is_on_sale', models.BooleanField(default=False, verbose_name='İndirimde')),
+                ('discounted_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='İndirimli Fiyat')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.category', verbose_name='Kategori')),
+            ],
+            options={
+                'verbose_name': 'Ürün',
+                'verbose_name_plural': 'Ürünler',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='products/', verbose_name='Ürün Resmi')),
+                ('is_primary', models.BooleanField(default=False, verbose_name='Ana Resim')),
+                ('order', models.IntegerField(default=0, verbose_name='Sıralama')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='products.product')),
+            ],
+            options={
+                'verbose_name': 'Ürün Resmi',
+                'verbose_name_plural': 'Ürün Resimleri',
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SubCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Alt Kategori Adı')),
+                ('slug', models.SlugField(max_length=250, unique=True)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subcategories', to='products.category', verbose_name='Kategori')),
+            ],
+            options={
+                'verbose_name': 'Alt Kategori',
+                'verbose_name_plural': 'Alt Kategoriler',
+            },
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='subcategory',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.subcategory', verbose_name='Alt Kategori'),
+        ),
+        migrations.CreateModel(
+            name='ProductVariant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('variant_type', models.CharField(choices=[('color', 'Renk'), ('storage', 'Depolama'), ('size', 'Boyut')], max_length=20, verbose_name='Özellik Tipi')),
+                ('name', models.CharField(max_length=100, verbose_name='Özellik Değeri')),
+                ('sku', models.CharField(blank=True, max_length=100, null=True, verbose_name='Stok Kodu')),
+                ('stock', models.IntegerField(default=0, verbose_name='Stok')),
+                ('price_adjustment', models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Fiyat Farkı')),
+                ('is_default', models.BooleanField(default=False, verbose_name='Varsayılan Seçenek')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='variants', to='products.product', verbose_name='Ürün')),
+            ],
+            options={
+                'verbose_name': 'Ürün Varyantı',
+                'verbose_name_plural': 'Ürün Varyantları',
+                'ordering': ['variant_type', 'name'],
+                'unique_together': {('product', 'variant_type', 'name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.IntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)], verbose_name='Puan')),
+                ('comment', models.TextField(verbose_name='Yorum')),
+                ('pros', models.TextField(blank=True, null=True, verbose_name='Artıları')),
+                ('cons', models.TextField(blank=True, null=True, verbose_name='Eksileri')),
+                ('is_verified_purchase', models.BooleanField(default=False, verbose_name='Doğrulanmış Alışveriş')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi')),
+                ('is_approved', models.BooleanField(default=False, verbose_name='Onaylı')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='products.product', verbose_name='Ürün')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='Kullanıcı')),
+            ],
+            options={
+                'verbose_name': 'Ürün Yorumu',
+                'verbose_name_plural': 'Ürün Yorumları',
+                'ordering': ['-created_at'],
+                'unique_together': {('product', 'user')},
+            },
+        ),
+    ]
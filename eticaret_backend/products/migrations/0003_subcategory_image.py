@@ -1,18 +1,18 @@
-# Generated by Django 5.1.2 on 2024-12-18 18:52
-
-from django.db import migrations, models
-
-
-class Migration(migrations.Migration):
-
-    dependencies = [
-        ('products', '0002_slider_alter_product_description'),
-    ]
-
-    operations = [
-        migrations.AddField(
-            model_name='subcategory',
-            name='image',
-            field=models.ImageField(blank=True, null=True, upload_to='subcategories/', verbose_name='Görsel'),
-        ),
-    ]
+# Generated by Django 5.1.2 on 2024-12-18 18:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_slider_alter_product_description'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subcategory',
+            name='image',
+            field=models.ImageField(blank=True, null=True, upload_to='subcategories/', verbose_name='Görsel'),
+        ),
+    ]
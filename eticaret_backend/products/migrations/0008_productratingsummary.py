@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def populate_summaries(apps, schema_editor):
+    Review = apps.get_model('products', 'Review')
+    ProductRatingSummary = apps.get_model('products', 'ProductRatingSummary')
+    rows = Review.objects.filter(is_approved=True).order_by().values('product_id').annotate(
+        review_count=Count('id'),
+        rating_sum=Sum('rating'),
+        **{f'rating_{star}': Count('id', filter=Q(rating=star)) for star in range(1, 6)}
+    )
+    ProductRatingSummary.objects.bulk_create(
+        [ProductRatingSummary(**row) for row in rows],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_product_product_status_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductRatingSummary',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_summary', serialize=False, to='products.product', verbose_name='Ürün')),
+                ('review_count', models.PositiveIntegerField(default=0, verbose_name='Onaylı Yorum Sayısı')),
+                ('rating_sum', models.PositiveIntegerField(default=0, verbose_name='Puan Toplamı')),
+                ('rating_1', models.PositiveIntegerField(default=0, verbose_name='1 Yıldız')),
+                ('rating_2', models.PositiveIntegerField(default=0, verbose_name='2 Yıldız')),
+                ('rating_3', models.PositiveIntegerField(default=0, verbose_name='3 Yıldız')),
+                ('rating_4', models.PositiveIntegerField(default=0, verbose_name='4 Yıldız')),
+                ('rating_5', models.PositiveIntegerField(default=0, verbose_name='5 Yıldız')),
+            ],
+            options={
+                'verbose_name': 'Puan Özeti',
+                'verbose_name_plural': 'Puan Özetleri',
+            },
+        ),
+        migrations.RunPython(populate_summaries, migrations.RunPython.noop),
+    ]
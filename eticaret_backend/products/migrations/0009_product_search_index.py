@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:42
+
+from django.db import migrations
+
+
+def create_fts_table(apps, schema_editor):
+    # FTS5 sanal tablosu yalnızca SQLite'ta oluşturulur; mevcut ürünler
+    # 0019_populate_search_and_attributes ile indekslenir
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS products_product_fts USING fts5("
+        "name, body, specs, category, tokenize='unicode61 remove_diacritics 2')"
+    )
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute('DROP TABLE IF EXISTS products_product_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_productratingsummary'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_product_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductAttribute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=50, verbose_name='Özellik')),
+                ('value', models.CharField(max_length=255, verbose_name='Değer')),
+                ('numeric_value', models.FloatField(blank=True, null=True, verbose_name='Sayısal Değer')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attributes', to='products.product', verbose_name='Ürün')),
+            ],
+            options={
+                'verbose_name': 'Ürün Özelliği',
+                'verbose_name_plural': 'Ürün Özellikleri',
+                'indexes': [models.Index(fields=['key', 'numeric_value'], name='attribute_key_numeric_idx'), models.Index(fields=['key', 'value'], name='attribute_key_value_idx')],
+                'unique_together': {('product', 'key')},
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0012_relatedproduct'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSalesSummary',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sales_summary', serialize=False, to='products.product', verbose_name='Ürün')),
+                ('units_7d', models.IntegerField(default=0, verbose_name='7 Günlük Satış')),
+                ('units_30d', models.IntegerField(default=0, verbose_name='30 Günlük Satış')),
+                ('revenue_7d', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='7 Günlük Ciro')),
+                ('revenue_30d', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='30 Günlük Ciro')),
+            ],
+            options={
+                'verbose_name': 'Satış Özeti',
+                'verbose_name_plural': 'Satış Özetleri',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductSalesDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Gün')),
+                ('units', models.IntegerField(default=0, verbose_name='Satış Adedi')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Ciro')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales_days', to='products.product', verbose_name='Ürün')),
+            ],
+            options={
+                'verbose_name': 'Günlük Satış',
+                'verbose_name_plural': 'Günlük Satışlar',
+                'indexes': [models.Index(fields=['day', 'product'], name='sales_day_product_idx')],
+                'unique_together': {('product', 'day')},
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0013_product_sales'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='source_hash',
+            field=models.CharField(blank=True, default='', max_length=64, verbose_name='Kaynak İçerik Özeti'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='source_image_url',
+            field=models.URLField(blank=True, default='', max_length=500, verbose_name='Kaynak Resim URL'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='source_url',
+            field=models.URLField(blank=True, db_index=True, default='', max_length=500, verbose_name='Kaynak URL'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:07
+
+import products.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0014_product_source'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='productimage',
+            name='image',
+            field=models.ImageField(storage=products.storage.ContentAddressedStorage(), upload_to='products/', verbose_name='Ürün Resmi'),
+        ),
+        migrations.AlterField(
+            model_name='slider',
+            name='image',
+            field=models.ImageField(storage=products.storage.ContentAddressedStorage(), upload_to='sliders/', verbose_name='Görsel'),
+        ),
+        migrations.AlterField(
+            model_name='subcategory',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=products.storage.ContentAddressedStorage(), upload_to='subcategories/', verbose_name='Görsel'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:09
+
+import django.core.files.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0015_content_addressed_images'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageDerivative',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(db_index=True, max_length=255, verbose_name='Orijinal')),
+                ('format', models.CharField(choices=[('webp', 'WebP'), ('jpeg', 'JPEG')], max_length=10, verbose_name='Biçim')),
+                ('width', models.PositiveIntegerField(verbose_name='Genişlik')),
+                ('height', models.PositiveIntegerField(verbose_name='Yükseklik')),
+                ('image', models.ImageField(max_length=255, storage=django.core.files.storage.FileSystemStorage(allow_overwrite=True), upload_to='', verbose_name='Dosya')),
+                ('size', models.PositiveIntegerField(default=0, verbose_name='Boyut (bayt)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Resim Türevi',
+                'verbose_name_plural': 'Resim Türevleri',
+                'unique_together': {('source', 'format', 'width')},
+            },
+        ),
+    ]
@@ -0,0 +1,173 @@
+import re
+import unicodedata
+from html import unescape
+
+from django.db import migrations
+from django.utils.html import strip_tags
+
+# Bu göçün yazıldığı andaki yardımcıların dondurulmuş kopyaları. Uygulama kodu
+# (products.attributes, products.search) sonradan değişse de geçmiş göç aynı kalır.
+
+BATCH_SIZE = 500
+
+TR_CHAR_MAP = str.maketrans({'ı': 'i', 'İ': 'I'})
+
+KEY_ALIASES = {
+    'ram': 'ram',
+    'bellek': 'ram',
+    'ram bellek': 'ram',
+    'ram kapasitesi': 'ram',
+    'depolama': 'depolama',
+    'disk kapasitesi': 'depolama',
+    'ssd kapasitesi': 'depolama',
+    'dahili hafiza': 'depolama',
+    'ekran': 'ekran',
+    'ekran boyutu': 'ekran',
+    'ekran buyuklugu': 'ekran',
+    'islemci': 'islemci',
+    'islemci modeli': 'islemci',
+    'ekran karti': 'ekran_karti',
+    'ekran karti modeli': 'ekran_karti',
+    'isletim sistemi': 'isletim_sistemi',
+    'yenileme hizi': 'yenileme_hizi',
+    'ekran yenileme hizi': 'yenileme_hizi',
+}
+
+NUMBER = r'(\d+(?:[.,]\d+)?)'
+SIZE_RE = re.compile(NUMBER + r'\s*(tb|gb|mb)\b')
+INCH_RE = re.compile(NUMBER + r'\s*(?:"|\'\'|inch|inc)')
+HZ_RE = re.compile(NUMBER + r'\s*hz\b')
+PLAIN_NUMBER_RE = re.compile(r'^\s*' + NUMBER + r'\s*$')
+
+SIZE_FACTORS = {'tb': 1024, 'gb': 1, 'mb': 1 / 1024}
+
+
+def tr_normalize(text):
+    text = unicodedata.normalize('NFKD', (text or '').translate(TR_CHAR_MAP))
+    return text.encode('ASCII', 'ignore').decode('utf-8').lower()
+
+
+def _number(text):
+    return float(text.replace(',', '.'))
+
+
+def parse_plain(value):
+    match = PLAIN_NUMBER_RE.match(value)
+    return _number(match.group(1)) if match else None
+
+
+def parse_size_gb(value):
+    match = SIZE_RE.search(value)
+    if match:
+        return _number(match.group(1)) * SIZE_FACTORS[match.group(2)]
+    return parse_plain(value)
+
+
+def parse_inches(value):
+    match = INCH_RE.search(value)
+    if match:
+        return _number(match.group(1))
+    return parse_plain(value)
+
+
+def parse_hz(value):
+    match = HZ_RE.search(value)
+    return _number(match.group(1)) if match else None
+
+
+NUMERIC_PARSERS = {
+    'ram': parse_size_gb,
+    'depolama': parse_size_gb,
+    'ekran': parse_inches,
+    'yenileme_hizi': parse_hz,
+}
+
+
+def parse_specs(specs):
+    attributes = {}
+    if not isinstance(specs, dict):
+        return attributes
+    for key, raw_value in specs.items():
+        if raw_value in (None, ''):
+            continue
+        normalized = ' '.join(tr_normalize(str(key)).replace('_', ' ').split())
+        key = KEY_ALIASES.get(normalized, normalized.replace(' ', '_'))
+        if not key:
+            continue
+        value = ' '.join(tr_normalize(str(raw_value)).split())
+        parser = NUMERIC_PARSERS.get(key, parse_plain)
+        attributes.setdefault(key, (value, parser(value)))
+        if key == 'ekran':
+            refresh_rate = parse_hz(value)
+            if refresh_rate is not None:
+                attributes.setdefault('yenileme_hizi', (f'{refresh_rate:g}hz', refresh_rate))
+    return attributes
+
+
+def product_document(product):
+    specs = product.specs if isinstance(product.specs, dict) else {}
+    return {
+        'name': tr_normalize(product.name),
+        'body': tr_normalize(unescape(strip_tags(product.description or ''))),
+        'specs': tr_normalize(' '.join(str(value) for value in specs.values())),
+        'category': tr_normalize(f'{product.category.name} {product.subcategory.name}'),
+    }
+
+
+def _batches(queryset):
+    batch = []
+    for product in queryset.iterator(chunk_size=BATCH_SIZE):
+        batch.append(product)
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def populate_search_index(apps, schema_editor):
+    # 0009 boş FTS5 tablosu oluşturur; mevcut ürünler burada indekslenir
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    Product = apps.get_model('products', 'Product')
+    products = Product.objects.using(schema_editor.connection.alias).select_related(
+        'category', 'subcategory'
+    ).order_by('pk')
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('DELETE FROM products_product_fts')
+        for batch in _batches(products):
+            rows = []
+            for product in batch:
+                document = product_document(product)
+                rows.append((product.pk, document['name'], document['body'], document['specs'], document['category']))
+            cursor.executemany(
+                'INSERT INTO products_product_fts (rowid, name, body, specs, category) VALUES (%s, %s, %s, %s, %s)',
+                rows
+            )
+
+
+def populate_attributes(apps, schema_editor):
+    # 0010 tabloyu boş oluşturur; mevcut ürünlerin specs alanından özellik satırları üretilir
+    alias = schema_editor.connection.alias
+    Product = apps.get_model('products', 'Product')
+    ProductAttribute = apps.get_model('products', 'ProductAttribute')
+    ProductAttribute.objects.using(alias).all().delete()
+    products = Product.objects.using(alias).only('specs').order_by('pk')
+    for batch in _batches(products):
+        ProductAttribute.objects.using(alias).bulk_create([
+            ProductAttribute(product_id=product.pk, key=key[:50], value=value[:255], numeric_value=numeric_value)
+            for product in batch
+            for key, (value, numeric_value) in parse_specs(product.specs).items()
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0018_admin_changelist_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_search_index, migrations.RunPython.noop),
+        migrations.RunPython(populate_attributes, migrations.RunPython.noop),
+    ]
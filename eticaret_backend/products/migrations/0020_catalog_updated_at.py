@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0019_populate_search_and_attributes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi'),
+        ),
+        migrations.AddField(
+            model_name='productsalessummary',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi'),
+        ),
+        migrations.AddField(
+            model_name='subcategory',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0020_catalog_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='relatedproduct',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi'),
+        ),
+    ]
@@ -1,225 +1,544 @@
-from django.db import models
-from django.utils.text import slugify
-from django.utils.safestring import mark_safe
-from django.core.validators import MinValueValidator, MaxValueValidator
-from django.contrib.auth import get_user_model
-from django.utils.html import mark_safe
-from tinymce.models import HTMLField
-import unicodedata
-
-User = get_user_model()
-
-def tr_slugify(text):
-    text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('utf-8')
-    return slugify(text)
-
-
-class Category(models.Model):
-    name = models.CharField(max_length=100, verbose_name="Kategori Adı")
-    slug = models.SlugField(max_length=250, unique=True)
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = tr_slugify(self.name)
-        super().save(*args, **kwargs)
-
-    def __str__(self):
-        return self.name
-    
-    class Meta:
-        verbose_name = "Kategori"
-        verbose_name_plural = "Kategoriler"
-
-class SubCategory(models.Model):
-    category = models.ForeignKey(Category, related_name='subcategories', on_delete=models.CASCADE, verbose_name="Kategori")
-    name = models.CharField(max_length=100, verbose_name="Alt Kategori Adı")
-    slug = models.SlugField(max_length=250, unique=True)
-    image = models.ImageField(upload_to='subcategories/', verbose_name='Görsel', blank=True, null=True)
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = tr_slugify(self.name)
-        super().save(*args, **kwargs)
-    
-    def __str__(self):
-        return f"{self.category.name} - {self.name}"
-    
-    class Meta:
-        verbose_name = "Alt Kategori"
-        verbose_name_plural = "Alt Kategoriler"
-
-class Product(models.Model):
-    STATUS_CHOICES = [('active','Aktif'),('inactive','Pasif')]
-    category = models.ForeignKey('Category', on_delete=models.CASCADE, verbose_name="Kategori")
-    subcategory = models.ForeignKey('SubCategory', on_delete=models.CASCADE, verbose_name="Alt Kategori")
-    name = models.CharField(max_length=200, verbose_name="Ürün Adı")
-    slug = models.SlugField(unique=True, default='', verbose_name="URL")
-    description = HTMLField(verbose_name="Açıklama")
-    price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Fiyat")
-    specs = models.JSONField(default=dict, blank=True, null=True, verbose_name="Özellikler")
-    stock = models.IntegerField(default=0, verbose_name="Stok")
-    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='active', verbose_name="Durum")
-    is_best_seller = models.BooleanField(default=False, verbose_name="Çok Satan")
-    is_featured = models.BooleanField(default=False, verbose_name="Öne Çıkan")
-    is_on_sale = models.BooleanField(default=False, verbose_name="İndirimde")
-    discounted_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True, verbose_name="İndirimli Fiyat")
-    created_at = models.DateTimeField(auto_now_add=True,verbose_name="Oluşturulma Tarihi")
-    updated_at = models.DateTimeField(auto_now=True,verbose_name="Güncellenme Tarihi")
-    
-    class Meta:
-        verbose_name = "Ürün"
-        verbose_name_plural = "Ürünler"
-        ordering = ['-created_at']
-
-
-    def __str__(self):
-        return self.name
-
-    def save(self, *args, **kwargs):
-        # Slug oluşturma
-        if not self.slug:
-            self.slug = tr_slugify(self.name)
-            original_slug = self.slug
-            counter = 1
-            while Product.objects.filter(slug=self.slug).exists():
-                self.slug = f'{original_slug}-{counter}'
-                counter += 1
-    
-        # İndirimli fiyat kontrolleri
-        if self.discounted_price and self.discounted_price >= self.price:
-            self.discounted_price = None
-            self.is_on_sale = False
-        elif self.discounted_price:
-            self.is_on_sale = True
-        else:
-            self.is_on_sale = False
-    
-        super().save(*args, **kwargs)
-
-    def image_tag(self):
-        # İlk olarak primary image'i kontrol et
-        primary_image = self.images.filter(is_primary=True).first()
-        # Eğer primary image yoksa, herhangi bir image'i al
-        if not primary_image:
-            primary_image = self.images.first()
-        
-        if primary_image:
-            return mark_safe(f'<img src="{primary_image.image.url}" width="100" />')
-        return mark_safe('<img src="/static/admin/img/no-image.png" width="100" />')
-
-    image_tag.short_description = 'Resim'
-    image_tag.allow_tags = True
-
-    def formatted_price(self):
-        return "{:,.2f}".format(self.price).replace(",", ".")
-    
-    def formatted_discounted_price(self):
-        return "{:,.2f}".format(self.discounted_price).replace(",", ".")
-    
-class ProductImage(models.Model):
-    product = models.ForeignKey(Product, related_name='images', on_delete=models.CASCADE)
-    image = models.ImageField(upload_to='products/', verbose_name="Ürün Resmi")
-    is_primary = models.BooleanField(default=False, verbose_name="Ana Resim")
-    order = models.IntegerField(default=0, verbose_name="Sıralama")
-
-    class Meta:
-        verbose_name = "Ürün Resmi"
-        verbose_name_plural = "Ürün Resimleri"
-        ordering = ['order']
-
-    def __str__(self):
-        return f"{self.product.name} - {'Ana Resim' if self.is_primary else 'Diğer Resim'}"
-
-    def image_tag(self):
-        if self.image:
-            return mark_safe(f'<img src="{self.image.url}" width="100" />')
-        return ""
-    image_tag.short_description = 'Önizleme'
-
-    def save(self, *args, **kwargs):
-        if self.is_primary:
-            # Aynı ürünün diğer resimlerinin primary özelliğini kaldır
-            ProductImage.objects.filter(
-                product=self.product,
-                is_primary=True
-            ).exclude(id=self.id).update(is_primary=False)
-        super().save(*args, **kwargs)
-        
-class ProductVariant(models.Model):
-    VARIANT_TYPES = [('color','Renk'),('storage', 'Depolama'), ('size', 'Boyut')]
-    product = models.ForeignKey(Product, related_name='variants', on_delete=models.CASCADE, verbose_name="Ürün")
-    variant_type = models.CharField(max_length=20, choices=VARIANT_TYPES, verbose_name="Özellik Tipi")
-    name = models.CharField(max_length=100, verbose_name="Özellik Değeri")
-    sku = models.CharField(max_length=100, blank=True, null=True, verbose_name="Stok Kodu")
-    stock = models.IntegerField(default=0, verbose_name="Stok")
-    price_adjustment = models.DecimalField(
-        max_digits=10, 
-        decimal_places=2, 
-        default=0, 
-        verbose_name="Fiyat Farkı"
-    )
-    is_default = models.BooleanField(default=False, verbose_name="Varsayılan Seçenek")
-    created_at = models.DateTimeField(auto_now_add=True)
-
-    class Meta:
-        verbose_name = "Ürün Varyantı"
-        verbose_name_plural = "Ürün Varyantları"
-        unique_together = ['product', 'variant_type', 'name']
-        ordering = ['variant_type', 'name']
-
-    def __str__(self):
-        return f"{self.product.name} - {self.get_variant_type_display()}: {self.name}"
-
-    def save(self, *args, **kwargs):
-        if self.is_default:
-            # Aynı ürün ve varyant tipi için diğer varsayılan seçenekleri kaldır
-            ProductVariant.objects.filter(
-                product=self.product,
-                variant_type=self.variant_type,
-                is_default=True
-            ).update(is_default=False)
-        super().save(*args, **kwargs)
-
-class Review(models.Model):
-    product = models.ForeignKey(Product, related_name='reviews', on_delete=models.CASCADE, verbose_name="Ürün")
-    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="Kullanıcı")
-    rating = models.IntegerField(
-        validators=[MinValueValidator(1), MaxValueValidator(5)],
-        verbose_name="Puan"
-    )
-    comment = models.TextField(verbose_name="Yorum")
-    pros = models.TextField(blank=True, null=True, verbose_name="Artıları")
-    cons = models.TextField(blank=True, null=True, verbose_name="Eksileri")
-    is_verified_purchase = models.BooleanField(default=False, verbose_name="Doğrulanmış Alışveriş")
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Oluşturulma Tarihi")
-    updated_at = models.DateTimeField(auto_now=True, verbose_name="Güncellenme Tarihi")
-    is_approved = models.BooleanField(default=False, verbose_name="Onaylı")
-
-    class Meta:
-        verbose_name = "Ürün Yorumu"
-        verbose_name_plural = "Ürün Yorumları"
-        ordering = ['-created_at']
-        unique_together = ['product', 'user']
-
-    def __str__(self):
-        return f"{self.product.name} - {self.user.username} - {self.rating}★"
-    
-
-class Slider(models.Model):
-    title = models.CharField(max_length=200, verbose_name='Başlık',blank=True,null=True)
-    description = models.TextField(blank=True, null=True, verbose_name='Açıklama')
-    image = models.ImageField(upload_to='sliders/', verbose_name='Görsel')
-    url = models.CharField(max_length=200, verbose_name='Yönlendirme URL')
-    button_text = models.CharField(max_length=50, default='İncele', verbose_name='Buton Metni')
-    order = models.IntegerField(default=0, verbose_name='Sıralama')
-    is_active = models.BooleanField(default=True, verbose_name='Aktif')
-
-    class Meta:
-        ordering = ['order']
-        verbose_name = 'Tanıtım Resmi'
-        verbose_name_plural = 'Tanıtım Resimleri'
-
-    def __str__(self):
-        return self.title or 'Slider' #title boş girip Slider döndürüyoruz 
-
-   
\ No newline at end of file
+from datetime import timedelta
+
+from django.db import connection, models
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.utils import timezone
+from django.utils.text import slugify
+from django.utils.safestring import mark_safe
+from django.core.validators import MinValueValidator, MaxValueValidator
+from django.contrib.auth import get_user_model
+from django.utils.html import mark_safe
+from tinymce.models import HTMLField
+import unicodedata
+
+from .storage import content_storage, derivative_storage
+
+User = get_user_model()
+
+# NFKD ayrıştırması noktasız ı harfini karşılıksız bıraktığı için önce elle eşlenir
+TR_CHAR_MAP = str.maketrans({'ı': 'i', 'İ': 'I'})
+
+def tr_fold(text):
+    """Türkçe karakterleri ASCII karşılıklarına indirger (ş->s, ğ->g, ı->i ...)"""
+    text = unicodedata.normalize('NFKD', text.translate(TR_CHAR_MAP))
+    return text.encode('ASCII', 'ignore').decode('utf-8')
+
+def tr_normalize(text):
+    """Arama ve karşılaştırma için katlanmış, küçük harfli metin"""
+    return tr_fold(text or '').lower()
+
+def tr_slugify(text):
+    return slugify(tr_fold(text))
+
+
+class SlugAllocator:
+    """
+    Benzersiz slug ayırıcı: `kök`, `kök-1`, `kök-2`, ...
+
+    Her kök için kullanılan slug'lar tek bir önek sorgusuyla yüklenir; aynı
+    kökten sonraki slug'lar veritabanına gitmeden bellekte ayrılır.
+    """
+
+    def __init__(self, model, field='slug'):
+        self.model = model
+        self.field = field
+        self._taken = {}
+        self._next = {}
+
+    def _load(self, stem):
+        if stem not in self._taken:
+            self._taken[stem] = set(
+                self.model._default_manager.filter(
+                    **{f'{self.field}__startswith': stem}
+                ).values_list(self.field, flat=True)
+            )
+        return self._taken[stem]
+
+    def allocate(self, name):
+        stem = tr_slugify(name)
+        taken = self._load(stem)
+        slug = stem
+        counter = self._next.get(stem, 1)
+        while slug in taken:
+            slug = f'{stem}-{counter}'
+            counter += 1
+        self._next[stem] = counter
+        taken.add(slug)
+        return slug
+
+
+class Category(models.Model):
+    name = models.CharField(max_length=100, verbose_name="Kategori Adı")
+    slug = models.SlugField(max_length=250, unique=True)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Güncellenme Tarihi")
+
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            self.slug = tr_slugify(self.name)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.name
+    
+    class Meta:
+        verbose_name = "Kategori"
+        verbose_name_plural = "Kategoriler"
+
+class SubCategory(models.Model):
+    category = models.ForeignKey(Category, related_name='subcategories', on_delete=models.CASCADE, verbose_name="Kategori")
+    name = models.CharField(max_length=100, verbose_name="Alt Kategori Adı")
+    slug = models.SlugField(max_length=250, unique=True)
+    image = models.ImageField(upload_to='subcategories/', storage=content_storage, verbose_name='Görsel', blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Güncellenme Tarihi")
+
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            self.slug = tr_slugify(self.name)
+        super().save(*args, **kwargs)
+    
+    def __str__(self):
+        return f"{self.category.name} - {self.name}"
+    
+    class Meta:
+        verbose_name = "Alt Kategori"
+        verbose_name_plural = "Alt Kategoriler"
+
+class Product(models.Model):
+    STATUS_CHOICES = [('active','Aktif'),('inactive','Pasif')]
+    category = models.ForeignKey('Category', on_delete=models.CASCADE, verbose_name="Kategori")
+    subcategory = models.ForeignKey('SubCategory', on_delete=models.CASCADE, verbose_name="Alt Kategori")
+    name = models.CharField(max_length=200, verbose_name="Ürün Adı")
+    slug = models.SlugField(unique=True, default='', verbose_name="URL")
+    description = HTMLField(verbose_name="Açıklama")
+    price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Fiyat")
+    specs = models.JSONField(default=dict, blank=True, null=True, verbose_name="Özellikler")
+    stock = models.IntegerField(default=0, verbose_name="Stok")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='active', verbose_name="Durum")
+    is_best_seller = models.BooleanField(default=False, verbose_name="Çok Satan")
+    is_featured = models.BooleanField(default=False, verbose_name="Öne Çıkan")
+    is_on_sale = models.BooleanField(default=False, verbose_name="İndirimde")
+    discounted_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True, verbose_name="İndirimli Fiyat")
+    # Tarayıcıyla eklenen ürünlerin kaynağı; eşitlemede değişiklik tespiti için kullanılır
+    source_url = models.URLField(max_length=500, blank=True, default='', db_index=True, verbose_name="Kaynak URL")
+    source_image_url = models.URLField(max_length=500, blank=True, default='', verbose_name="Kaynak Resim URL")
+    source_hash = models.CharField(max_length=64, blank=True, default='', verbose_name="Kaynak İçerik Özeti")
+    # Ana resim (yoksa sıradaki ilk resim); ProductImage kaydedilip silindikçe sinyallerle güncellenir
+    primary_image = models.ForeignKey('ProductImage', on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name='+', verbose_name="Ana Resim")
+    created_at = models.DateTimeField(auto_now_add=True,verbose_name="Oluşturulma Tarihi")
+    updated_at = models.DateTimeField(auto_now=True,verbose_name="Güncellenme Tarihi")
+    
+    class Meta:
+        verbose_name = "Ürün"
+        verbose_name_plural = "Ürünler"
+        ordering = ['-created_at']
+        # Cursor sayfalamadaki sıralama anahtarları için
+        indexes = [
+            models.Index(fields=['status', '-created_at', '-id'], name='product_status_created_idx'),
+            models.Index(fields=['status', 'price', 'id'], name='product_status_price_idx'),
+            models.Index(fields=['status', 'name', 'id'], name='product_status_name_idx'),
+            # Admin listesinin varsayılan sıralaması ve tarih filtresi için
+            models.Index(fields=['-created_at', '-id'], name='product_created_idx'),
+        ]
+
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Benzer ürün listeleri yalnızca ilgili alanlar değişince yenilendiği için yüklenen değerler saklanır
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using, fields, from_queryset)
+        # Ertelenmiş alanlar erişildiğinde buradan yüklenir; yeniden okunan değerler de saklanır
+        if hasattr(self, '_loaded_values'):
+            names = fields if fields is not None else [field.attname for field in self._meta.concrete_fields]
+            for name in names:
+                attname = self._meta.get_field(name).attname
+                if attname in self.__dict__:
+                    self._loaded_values[attname] = self.__dict__[attname]
+
+    def save(self, *args, **kwargs):
+        # Slug oluşturma
+        if not self.slug:
+            self.slug = SlugAllocator(Product).allocate(self.name)
+    
+        # İndirimli fiyat kontrolleri
+        if self.discounted_price and self.discounted_price >= self.price:
+            self.discounted_price = None
+            self.is_on_sale = False
+        elif self.discounted_price:
+            self.is_on_sale = True
+        else:
+            self.is_on_sale = False
+    
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def update_primary_images(cls, product_ids=None):
+        """primary_image alanını ana resme, ana resim yoksa sıradaki ilk resme tek UPDATE ile bağlar"""
+        first_image = ProductImage.objects.filter(
+            product=OuterRef('pk')
+        ).order_by('-is_primary', 'order', 'pk').values('pk')[:1]
+        products = cls.objects.all() if product_ids is None else cls.objects.filter(pk__in=product_ids)
+        return products.update(primary_image=Subquery(first_image))
+
+    def image_tag(self):
+        # Admin listesinde primary_image select_related ile yüklenir, ek sorgu atılmaz
+        if self.primary_image:
+            return mark_safe(f'<img src="{self.primary_image.image.url}" width="100" />')
+        return mark_safe('<img src="/static/admin/img/no-image.png" width="100" />')
+
+    image_tag.short_description = 'Resim'
+    image_tag.allow_tags = True
+
+    def formatted_price(self):
+        return "{:,.2f}".format(self.price).replace(",", ".")
+    
+    def formatted_discounted_price(self):
+        return "{:,.2f}".format(self.discounted_price).replace(",", ".")
+    
+class ProductImage(models.Model):
+    product = models.ForeignKey(Product, related_name='images', on_delete=models.CASCADE)
+    image = models.ImageField(upload_to='products/', storage=content_storage, verbose_name="Ürün Resmi")
+    is_primary = models.BooleanField(default=False, verbose_name="Ana Resim")
+    order = models.IntegerField(default=0, verbose_name="Sıralama")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Güncellenme Tarihi")
+
+    class Meta:
+        verbose_name = "Ürün Resmi"
+        verbose_name_plural = "Ürün Resimleri"
+        ordering = ['order']
+
+    def __str__(self):
+        return f"{self.product.name} - {'Ana Resim' if self.is_primary else 'Diğer Resim'}"
+
+    def image_tag(self):
+        if self.image:
+            return mark_safe(f'<img src="{self.image.url}" width="100" />')
+        return ""
+    image_tag.short_description = 'Önizleme'
+
+    def save(self, *args, **kwargs):
+        if self.is_primary:
+            # Aynı ürünün diğer resimlerinin primary özelliğini kaldır
+            ProductImage.objects.filter(
+                product=self.product,
+                is_primary=True
+            ).exclude(id=self.id).update(is_primary=False)
+        super().save(*args, **kwargs)
+        
+class ProductAttribute(models.Model):
+    """Product.specs alanından türetilen, ortak anahtarlı ve indeksli özellik satırları"""
+    product = models.ForeignKey(Product, related_name='attributes', on_delete=models.CASCADE, verbose_name="Ürün")
+    key = models.CharField(max_length=50, verbose_name="Özellik")
+    value = models.CharField(max_length=255, verbose_name="Değer")
+    numeric_value = models.FloatField(blank=True, null=True, verbose_name="Sayısal Değer")
+
+    class Meta:
+        verbose_name = "Ürün Özelliği"
+        verbose_name_plural = "Ürün Özellikleri"
+        unique_together = ['product', 'key']
+        indexes = [
+            models.Index(fields=['key', 'numeric_value'], name='attribute_key_numeric_idx'),
+            models.Index(fields=['key', 'value'], name='attribute_key_value_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} - {self.key}: {self.value}"
+
+class ProductVariant(models.Model):
+    VARIANT_TYPES = [('color','Renk'),('storage', 'Depolama'), ('size', 'Boyut')]
+    product = models.ForeignKey(Product, related_name='variants', on_delete=models.CASCADE, verbose_name="Ürün")
+    variant_type = models.CharField(max_length=20, choices=VARIANT_TYPES, verbose_name="Özellik Tipi")
+    name = models.CharField(max_length=100, verbose_name="Özellik Değeri")
+    sku = models.CharField(max_length=100, blank=True, null=True, verbose_name="Stok Kodu")
+    stock = models.IntegerField(default=0, verbose_name="Stok")
+    price_adjustment = models.DecimalField(
+        max_digits=10, 
+        decimal_places=2, 
+        default=0, 
+        verbose_name="Fiyat Farkı"
+    )
+    is_default = models.BooleanField(default=False, verbose_name="Varsayılan Seçenek")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Güncellenme Tarihi")
+
+    class Meta:
+        verbose_name = "Ürün Varyantı"
+        verbose_name_plural = "Ürün Varyantları"
+        unique_together = ['product', 'variant_type', 'name']
+        ordering = ['variant_type', 'name']
+
+    def __str__(self):
+        return f"{self.product.name} - {self.get_variant_type_display()}: {self.name}"
+
+    def save(self, *args, **kwargs):
+        if self.is_default:
+            # Aynı ürün ve varyant tipi için diğer varsayılan seçenekleri kaldır
+            ProductVariant.objects.filter(
+                product=self.product,
+                variant_type=self.variant_type,
+                is_default=True
+            ).update(is_default=False)
+        super().save(*args, **kwargs)
+
+class Review(models.Model):
+    product = models.ForeignKey(Product, related_name='reviews', on_delete=models.CASCADE, verbose_name="Ürün")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="Kullanıcı")
+    rating = models.IntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(5)],
+        verbose_name="Puan"
+    )
+    comment = models.TextField(verbose_name="Yorum")
+    pros = models.TextField(blank=True, null=True, verbose_name="Artıları")
+    cons = models.TextField(blank=True, null=True, verbose_name="Eksileri")
+    is_verified_purchase = models.BooleanField(default=False, verbose_name="Doğrulanmış Alışveriş")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Oluşturulma Tarihi")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Güncellenme Tarihi")
+    is_approved = models.BooleanField(default=False, verbose_name="Onaylı")
+
+    class Meta:
+        verbose_name = "Ürün Yorumu"
+        verbose_name_plural = "Ürün Yorumları"
+        ordering = ['-created_at']
+        unique_together = ['product', 'user']
+        # Admin listesindeki filtreler varsayılan sıralamayla birlikte indeksten okunur
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='review_created_idx'),
+            models.Index(fields=['is_approved', '-created_at'], name='review_approved_created_idx'),
+            models.Index(fields=['is_verified_purchase', '-created_at'], name='review_verified_created_idx'),
+            models.Index(fields=['rating', '-created_at'], name='review_rating_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.product.name} - {self.user.username} - {self.rating}★"
+
+
+class RelatedProduct(models.Model):
+    """İçerik benzerliğine göre önceden hesaplanmış benzer ürünler (bkz. products.similarity)"""
+    product = models.ForeignKey(Product, related_name='related_links', on_delete=models.CASCADE, verbose_name="Ürün")
+    related = models.ForeignKey(Product, related_name='related_from', on_delete=models.CASCADE, verbose_name="Benzer Ürün")
+    score = models.FloatField(verbose_name="Benzerlik")
+    rank = models.PositiveSmallIntegerField(verbose_name="Sıra")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Güncellenme Tarihi")
+
+    class Meta:
+        verbose_name = "Benzer Ürün"
+        verbose_name_plural = "Benzer Ürünler"
+        unique_together = ['product', 'related']
+        ordering = ['product', 'rank']
+        indexes = [
+            models.Index(fields=['product', 'rank'], name='related_product_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} -> {self.related_id} ({self.score:.3f})"
+
+
+class ProductRatingSummary(models.Model):
+    """Onaylı yorumların ürün bazında özeti. Review kayıtları değiştikçe güncellenir."""
+    product = models.OneToOneField(Product, primary_key=True, related_name='rating_summary', on_delete=models.CASCADE, verbose_name="Ürün")
+    review_count = models.PositiveIntegerField(default=0, verbose_name="Onaylı Yorum Sayısı")
+    rating_sum = models.PositiveIntegerField(default=0, verbose_name="Puan Toplamı")
+    rating_1 = models.PositiveIntegerField(default=0, verbose_name="1 Yıldız")
+    rating_2 = models.PositiveIntegerField(default=0, verbose_name="2 Yıldız")
+    rating_3 = models.PositiveIntegerField(default=0, verbose_name="3 Yıldız")
+    rating_4 = models.PositiveIntegerField(default=0, verbose_name="4 Yıldız")
+    rating_5 = models.PositiveIntegerField(default=0, verbose_name="5 Yıldız")
+
+    COUNTER_FIELDS = ['review_count', 'rating_sum', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5']
+
+    class Meta:
+        verbose_name = "Puan Özeti"
+        verbose_name_plural = "Puan Özetleri"
+
+    def __str__(self):
+        return f"{self.product} - {self.average_rating or '-'}★ ({self.review_count})"
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 1)
+
+    @property
+    def histogram(self):
+        return {star: getattr(self, f'rating_{star}') for star in range(1, 6)}
+
+    @classmethod
+    def refresh(cls, product_ids):
+        """Verilen ürünlerin özetlerini tek bir gruplu sorgu ve tek bir upsert ile yeniden hesaplar"""
+        product_ids = set(product_ids)
+        if not product_ids:
+            return
+
+        rows = Review.objects.filter(
+            product_id__in=product_ids,
+            is_approved=True
+        ).order_by().values('product_id').annotate(
+            review_count=Count('id'),
+            rating_sum=Sum('rating'),
+            **{f'rating_{star}': Count('id', filter=Q(rating=star)) for star in range(1, 6)}
+        )
+        totals = {row.pop('product_id'): row for row in rows}
+
+        cls.objects.bulk_create(
+            [cls(product_id=product_id, **totals.get(product_id, {})) for product_id in product_ids],
+            update_conflicts=True,
+            unique_fields=['product'],
+            update_fields=cls.COUNTER_FIELDS,
+        )
+
+
+class ProductSalesDay(models.Model):
+    """Onaylanan siparişlerden ürün bazında günlük satış adedi ve cirosu (sipariş tarihine göre)"""
+    product = models.ForeignKey(Product, related_name='sales_days', on_delete=models.CASCADE, verbose_name="Ürün")
+    day = models.DateField(verbose_name="Gün")
+    units = models.IntegerField(default=0, verbose_name="Satış Adedi")
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name="Ciro")
+
+    class Meta:
+        verbose_name = "Günlük Satış"
+        verbose_name_plural = "Günlük Satışlar"
+        unique_together = ['product', 'day']
+        indexes = [
+            models.Index(fields=['day', 'product'], name='sales_day_product_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} - {self.day}: {self.units}"
+
+    @classmethod
+    def record(cls, day, totals, sign=1):
+        """
+        {ürün_id: (adet, ciro)} toplamlarını günün satırlarına ekler (sign=-1 ise düşer).
+
+        Tüm ürünler tek bir INSERT ... ON CONFLICT (MySQL'de ON DUPLICATE KEY) ile
+        yazılır; eksik satır oluşturulur, mevcut satırın sayaçları artırılır.
+        """
+        if not totals:
+            return
+        ops = connection.ops
+        table = ops.quote_name(cls._meta.db_table)
+        params = []
+        for product_id, (units, revenue) in totals.items():
+            params += [product_id, ops.adapt_datefield_value(day), sign * units,
+                       ops.adapt_decimalfield_value(sign * revenue, 12, 2)]
+        if connection.vendor == 'mysql':
+            conflict = 'ON DUPLICATE KEY UPDATE units = units + VALUES(units), revenue = revenue + VALUES(revenue)'
+        else:
+            conflict = (
+                f'ON CONFLICT (product_id, day) DO UPDATE SET '
+                f'units = {table}.units + excluded.units, revenue = {table}.revenue + excluded.revenue'
+            )
+        values = ', '.join(['(%s, %s, %s, %s)'] * len(totals))
+        with connection.cursor() as cursor:
+            cursor.execute(f'INSERT INTO {table} (product_id, day, units, revenue) VALUES {values} {conflict}', params)
+
+
+class ProductSalesSummary(models.Model):
+    """Son 7 ve 30 günün satış toplamları. ProductSalesDay satırlarından türetilir."""
+    product = models.OneToOneField(Product, primary_key=True, related_name='sales_summary', on_delete=models.CASCADE, verbose_name="Ürün")
+    units_7d = models.IntegerField(default=0, verbose_name="7 Günlük Satış")
+    units_30d = models.IntegerField(default=0, verbose_name="30 Günlük Satış")
+    revenue_7d = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name="7 Günlük Ciro")
+    revenue_30d = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name="30 Günlük Ciro")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Güncellenme Tarihi")
+
+    COUNTER_FIELDS = ['units_7d', 'units_30d', 'revenue_7d', 'revenue_30d']
+
+    class Meta:
+        verbose_name = "Satış Özeti"
+        verbose_name_plural = "Satış Özetleri"
+
+    def __str__(self):
+        return f"{self.product} - {self.units_30d} adet / 30 gün"
+
+    @classmethod
+    def refresh(cls, product_ids=None, today=None):
+        """
+        Verilen ürünlerin (None ise tümünün) pencerelerini en fazla 30 günlük satırdan yeniden hesaplar.
+
+        Pencereler gün geçtikçe kaydığı için tüm ürünlerle günde bir kez çağrılmalıdır
+        (bkz. update_best_sellers komutu).
+        """
+        today = today or timezone.localdate()
+        week_start = today - timedelta(days=6)
+        days = ProductSalesDay.objects.filter(day__gt=today - timedelta(days=30), day__lte=today)
+        if product_ids is not None:
+            product_ids = set(product_ids)
+            if not product_ids:
+                return
+            days = days.filter(product_id__in=product_ids)
+
+        rows = days.order_by().values('product_id').annotate(
+            units_30d=Sum('units'),
+            revenue_30d=Sum('revenue'),
+            units_7d=Sum('units', filter=Q(day__gte=week_start)),
+            revenue_7d=Sum('revenue', filter=Q(day__gte=week_start)),
+        )
+        totals = {row.pop('product_id'): {key: value or 0 for key, value in row.items()} for row in rows}
+
+        if product_ids is None:
+            # Penceresinden satış çıkan ürünlerin sayaçları da sıfırlanmalı
+            product_ids = set(totals) | set(
+                cls.objects.exclude(units_30d=0, revenue_30d=0).values_list('product_id', flat=True)
+            )
+
+        cls.objects.bulk_create(
+            [cls(product_id=product_id, **totals.get(product_id, {})) for product_id in product_ids],
+            update_conflicts=True,
+            unique_fields=['product'],
+            # updated_at ürün listelerinin ETag'ine girer (bkz. products.conditional)
+            update_fields=cls.COUNTER_FIELDS + ['updated_at'],
+            batch_size=500,
+        )
+
+
+class Slider(models.Model):
+    title = models.CharField(max_length=200, verbose_name='Başlık',blank=True,null=True)
+    description = models.TextField(blank=True, null=True, verbose_name='Açıklama')
+    image = models.ImageField(upload_to='sliders/', storage=content_storage, verbose_name='Görsel')
+    url = models.CharField(max_length=200, verbose_name='Yönlendirme URL')
+    button_text = models.CharField(max_length=50, default='İncele', verbose_name='Buton Metni')
+    order = models.IntegerField(default=0, verbose_name='Sıralama')
+    is_active = models.BooleanField(default=True, verbose_name='Aktif')
+
+    class Meta:
+        ordering = ['order']
+        verbose_name = 'Tanıtım Resmi'
+        verbose_name_plural = 'Tanıtım Resimleri'
+
+    def __str__(self):
+        return self.title or 'Slider' #title boş girip Slider döndürüyoruz 
+
+   
+
+class ImageDerivative(models.Model):
+    """
+    Bir orijinal resmin küçültülmüş ve yeniden kodlanmış kopyası.
+
+    Orijinaller içerik adresli saklandığı için türevler dosya adına bağlanır;
+    aynı resmi kullanan ürün resimleri, alt kategoriler ve slider'lar türevleri paylaşır.
+    """
+    FORMAT_CHOICES = [('webp', 'WebP'), ('jpeg', 'JPEG')]
+
+    source = models.CharField(max_length=255, db_index=True, verbose_name='Orijinal')
+    format = models.CharField(max_length=10, choices=FORMAT_CHOICES, verbose_name='Biçim')
+    width = models.PositiveIntegerField(verbose_name='Genişlik')
+    height = models.PositiveIntegerField(verbose_name='Yükseklik')
+    image = models.ImageField(max_length=255, storage=derivative_storage, verbose_name='Dosya')
+    size = models.PositiveIntegerField(default=0, verbose_name='Boyut (bayt)')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')
+
+    class Meta:
+        verbose_name = 'Resim Türevi'
+        verbose_name_plural = 'Resim Türevleri'
+        unique_together = ('source', 'format', 'width')
+
+    def __str__(self):
+        return f'{self.source} ({self.format}, {self.width}px)'
@@ -0,0 +1,263 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Sıralama anahtarları üzerinden (ör. created_at, id) çalışan cursor sayfalama.
+
+    OFFSET kullanmadığı için derin sayfalar da ilk sayfa kadar ucuzdur. Her
+    sıralama benzersiz olması için `id` ile sonlanmalıdır. Yalnızca istekte
+    `cursor` veya `page_size` parametresi varsa devreye girer; aksi halde
+    liste eskisi gibi tek parça döner.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    ordering_query_param = 'ordering'
+    page_size = 24
+    max_page_size = 100
+    orderings = {}
+    default_ordering = None
+    invalid_cursor_message = 'Geçersiz cursor'
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_ordering_key(self, request):
+        key = request.query_params.get(self.ordering_query_param)
+        if key in self.orderings:
+            return key
+        return self.get_default_ordering(request)
+
+    def get_default_ordering(self, request):
+        return self.default_ordering
+
+    def get_ordering(self, request):
+        return self.orderings[self.get_ordering_key(request)]
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering_key = self.get_ordering_key(request)
+        self.ordering = self.orderings[self.ordering_key]
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor.get('r'))
+        ordering = self._invert(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            try:
+                queryset = queryset.filter(self._keyset_filter(ordering, cursor['v']))
+            except (TypeError, ValueError, ValidationError):
+                # Değerleri sıralama alanlarının tipine uymayan (elle değiştirilmiş) cursor
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_previous, self.has_next = has_more, True
+        else:
+            self.has_previous, self.has_next = cursor is not None, has_more
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def _link(self, obj, reverse):
+        values = [self._encode_value(getattr(obj, field.lstrip('-'))) for field in self.ordering]
+        return replace_query_param(
+            self.base_url,
+            self.cursor_query_param,
+            self.encode_cursor({'o': self.ordering_key, 'v': values, 'r': int(reverse)}),
+        )
+
+    def encode_cursor(self, cursor):
+        raw = json.dumps(cursor, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            # validate=True: alfabe dışı karakterler sessizce atlanmaz
+            cursor = json.loads(base64.b64decode(padded.encode('ascii'), altchars=b'-_', validate=True))
+            values = cursor['v']
+            valid = (
+                cursor['o'] == self.ordering_key
+                and isinstance(values, list)
+                and len(values) == len(self.ordering)
+            )
+        except (TypeError, ValueError, KeyError, binascii.Error, UnicodeEncodeError):
+            valid = False
+        if not valid:
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def _encode_value(self, value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
+
+    def _invert(self, ordering):
+        return tuple(field[1:] if field.startswith('-') else f'-{field}' for field in ordering)
+
+    def _keyset_filter(self, ordering, values):
+        # (a, b, id) > (va, vb, vid) ifadesini sıralama yönlerine göre açar:
+        # a > va OR (a = va AND b > vb) OR (a = va AND b = vb AND id > vid)
+        condition = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            branch = Q(**{f'{name}__{lookup}': values[index]})
+            for previous, value in zip(ordering[:index], values):
+                branch &= Q(**{previous.lstrip('-'): value})
+            condition |= branch
+        return condition
+
+
+class ProductCursorPagination(KeysetPagination):
+    orderings = {
+        '-created_at': ('-created_at', '-id'),
+        'created_at': ('created_at', 'id'),
+        'price': ('price', 'id'),
+        '-price': ('-price', '-id'),
+        'name': ('name', 'id'),
+        '-name': ('-name', '-id'),
+        # Arama altyapısının eklediği search_rank annotasyonu üzerinden
+        'relevance': ('search_rank', 'id'),
+        # Görünüm son 30 günün satış adedini sales_units olarak ekler
+        'best_selling': ('-sales_units', '-id'),
+    }
+    default_ordering = '-created_at'
+
+    def _is_search(self, request):
+        return bool(request.query_params.get('search'))
+
+    def get_ordering_key(self, request):
+        key = request.query_params.get(self.ordering_query_param)
+        if key == 'relevance' and not self._is_search(request):
+            return self.default_ordering
+        return super().get_ordering_key(request)
+
+    def get_default_ordering(self, request):
+        # Arama yapılırken varsayılan sıralama alaka düzeyidir
+        return 'relevance' if self._is_search(request) else self.default_ordering
+
+
+def estimate_row_count(model, using='default'):
+    """
+    Tablonun satır sayısını veritabanı istatistiklerinden okur; istatistik yoksa None.
+
+    PostgreSQL'de pg_class.reltuples, MySQL'de information_schema, SQLite'ta
+    ANALYZE sonrası sqlite_stat1 kullanılır. Değer yaklaşıktır.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)', [table])
+        elif connection.vendor == 'mysql':
+            cursor.execute(
+                'SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = %s',
+                [table]
+            )
+        elif connection.vendor == 'sqlite':
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                return None
+            # Her satırdaki stat metninin ilk sayısı tablonun satır sayısıdır
+            cursor.execute('SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1', [table])
+            row = cursor.fetchone()
+            return int(row[0].split()[0]) if row else None
+        else:
+            return None
+        row = cursor.fetchone()
+    # Hiç analiz edilmemiş tabloda PostgreSQL -1 döndürür
+    return int(row[0]) if row and row[0] is not None and row[0] >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Büyük tablolarda tam COUNT(*) çalıştırmayan admin sayfalayıcısı.
+
+    Filtresiz listede satır sayısı veritabanı istatistiklerinden okunur; tablo
+    `estimate_threshold` satırdan küçükse ya da istatistik yoksa sayım yapılır.
+    Sayım en fazla `count_limit` satıra kadar yürür; daha derindeki kayıtlara
+    filtre ya da arama ile ulaşılır.
+    """
+    estimate_threshold = 10000
+    count_limit = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not hasattr(queryset, 'query'):
+            return super().count
+        if not queryset.query.where:
+            estimate = estimate_row_count(queryset.model, using=queryset.db)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return queryset.order_by()[:self.count_limit].count()
@@ -0,0 +1,120 @@
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.db.models import BooleanField, Case, DecimalField, F, Q, Value, When
+from django.db.models.functions import Round
+from django.db.models.lookups import GreaterThan, GreaterThanOrEqual, LessThan
+from django.utils import timezone
+
+from .facets import invalidate_facets
+
+# Yüzde ya da sabit tutar (TL) olarak uygulanan değişiklikler
+PRICE_MODES = {'percent': 'Yüzde (%)', 'amount': 'Tutar (TL)'}
+
+PRICE_FIELD = DecimalField(max_digits=10, decimal_places=2)
+FACTOR_FIELD = DecimalField(max_digits=12, decimal_places=6)
+
+
+def _decimal(value):
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        raise ValueError(f'Geçersiz değer: {value}')
+
+
+def _rounded(expression):
+    return Round(expression, 2, output_field=PRICE_FIELD)
+
+
+def _price_expression(mode, value):
+    """Yeni fiyat: yüzde modunda price * (1 + value/100), tutar modunda price + value"""
+    if mode == 'percent':
+        if value <= -100:
+            raise ValueError('Fiyat en fazla %100\'den az olacak şekilde düşürülebilir')
+        return _rounded(F('price') * Value(1 + value / 100, output_field=FACTOR_FIELD))
+    if mode == 'amount':
+        return _rounded(F('price') + Value(value, output_field=PRICE_FIELD))
+    raise ValueError(f'Bilinmeyen mod: {mode}')
+
+
+def _discount_expression(mode, value):
+    """İndirimli fiyat: yüzde modunda price * (1 - value/100), tutar modunda price - value"""
+    if value <= 0:
+        raise ValueError('İndirim sıfırdan büyük olmalı')
+    if mode == 'percent':
+        if value >= 100:
+            raise ValueError('İndirim %100\'den küçük olmalı')
+        return _rounded(F('price') * Value(1 - value / 100, output_field=FACTOR_FIELD))
+    if mode == 'amount':
+        return _rounded(F('price') - Value(value, output_field=PRICE_FIELD))
+    raise ValueError(f'Bilinmeyen mod: {mode}')
+
+
+def _apply(queryset, assignments, dry_run):
+    """
+    Atamaları tek UPDATE ile uygular; etkilenen (deneme modunda etkilenecek) satır sayısını döndürür.
+
+    update() sinyal tetiklemediği için Product.save sonrası yapılan işler burada
+    yapılır: updated_at ETag'ler için ilerletilir ve fasetler yenilenir. Benzer
+    ürün listeleri istek içinde yeniden hesaplanmaz; fiyat bandındaki kaymalar
+    bir sonraki rebuild_related_products çalıştırmasında yansır.
+    """
+    if dry_run:
+        return queryset.count()
+    with transaction.atomic():
+        count = queryset.update(**assignments, updated_at=timezone.now())
+        invalidate_facets()
+    return count
+
+
+def change_prices(queryset, mode, value, dry_run=False):
+    """
+    Fiyatları yüzde ya da tutar olarak değiştirir.
+
+    Product.save'deki kural SQL'de uygulanır: yeni fiyata eşit ya da ondan büyük
+    kalan indirimli fiyat kaldırılır ve ürün indirimden çıkar; sıfır indirimli
+    fiyat indirim sayılmaz. Fiyatı sıfıra ya da altına düşecek ürünlere dokunulmaz.
+    """
+    value = _decimal(value)
+    new_price = _price_expression(mode, value)
+    if mode == 'amount' and value < 0:
+        queryset = queryset.filter(price__gt=-value)
+    # Atama sırası önemli: price en sona yazılır, böylece SET ifadelerini soldan
+    # sağa değerlendiren veritabanlarında da (MySQL) diğer sütunlar eski fiyatı görür
+    assignments = {
+        'discounted_price': Case(
+            When(GreaterThanOrEqual(F('discounted_price'), new_price), then=Value(None, output_field=PRICE_FIELD)),
+            default=F('discounted_price'),
+            output_field=PRICE_FIELD,
+        ),
+        'is_on_sale': Case(
+            When(Q(discounted_price__gt=0) & LessThan(F('discounted_price'), new_price), then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        ),
+        'price': new_price,
+    }
+    return _apply(queryset, assignments, dry_run)
+
+
+def apply_discounts(queryset, mode, value, dry_run=False):
+    """
+    Güncel fiyat üzerinden yüzde ya da tutar olarak indirim uygular.
+
+    Fiyata eşit ya da sıfırdan küçük/eşit çıkan indirimli fiyat yazılmaz;
+    o ürünler indirimsiz kalır.
+    """
+    discounted = _discount_expression(mode, _decimal(value))
+    valid = LessThan(discounted, F('price')) & GreaterThan(discounted, Value(0, output_field=PRICE_FIELD))
+    assignments = {
+        'discounted_price': Case(
+            When(valid, then=discounted), default=Value(None, output_field=PRICE_FIELD), output_field=PRICE_FIELD
+        ),
+        'is_on_sale': Case(When(valid, then=Value(True)), default=Value(False), output_field=BooleanField()),
+    }
+    return _apply(queryset, assignments, dry_run)
+
+
+def clear_discounts(queryset, dry_run=False):
+    """İndirimleri kaldırır"""
+    return _apply(queryset, {'discounted_price': None, 'is_on_sale': False}, dry_run)
@@ -0,0 +1,115 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import BooleanField, Case, Exists, ExpressionWrapper, F, OuterRef, Q, Sum, Value, When, Window
+from django.db.models.functions import RowNumber, TruncDate
+from django.utils import timezone
+from orders.models import Order, OrderItem
+
+from .cache import bump_version
+from .facets import FACET_CACHE_NAMESPACE
+from .models import Product, ProductSalesDay, ProductSalesSummary
+
+SALES_CACHE_NAMESPACE = 'product-sales'
+
+# Satış sayılan sipariş durumları; iptal edilen ya da onay bekleyen siparişler sayılmaz
+SALES_STATUSES = ('confirmed', 'shipped', 'delivered')
+
+# Çok satan sıralamasının kullandığı pencere
+RANKING_FIELD = 'units_30d'
+
+
+def _order_totals(order):
+    totals = defaultdict(lambda: [0, Decimal('0')])
+    items = order.items.filter(product__isnull=False).values_list('product_id', 'quantity', 'total')
+    for product_id, quantity, total in items:
+        totals[product_id][0] += quantity
+        totals[product_id][1] += total
+    return totals
+
+
+def record_order_sales(order, sign):
+    """Siparişin kalemlerini sipariş gününün satış satırlarına ekler (sign=-1 ise geri alır); kalem yoksa False döner"""
+    totals = _order_totals(order)
+    if not totals:
+        return False
+    with transaction.atomic():
+        ProductSalesDay.record(timezone.localdate(order.created_at), totals, sign)
+        ProductSalesSummary.refresh(totals)
+    bump_version(SALES_CACHE_NAMESPACE)
+    return True
+
+
+def sync_order_sales(order):
+    """
+    Siparişin satış sayaçlarındaki kaydını durumuyla eşitler.
+
+    Satış sayılan durumdaki sipariş bir kez eklenir, bu durumdan çıkınca ya da
+    silinince yalnızca eklenmişse geri alınır. Satış durumunda oluşturulan
+    siparişin kalemleri henüz yazılmamışsa ekleme kalemler kaydedilince yapılır
+    (bkz. OrderAdmin.save_related).
+    """
+    counted = order.status in SALES_STATUSES
+    if counted == order.sales_recorded:
+        return
+    with transaction.atomic():
+        if not record_order_sales(order, 1 if counted else -1) and counted:
+            return
+        type(order).objects.filter(pk=order.pk).update(sales_recorded=counted)
+    order.sales_recorded = counted
+
+
+def rebuild_sales_days():
+    """Günlük satış satırlarını sipariş kalemlerinden baştan üretir (ilk kurulum ve onarım için)"""
+    rows = OrderItem.objects.filter(
+        order__status__in=SALES_STATUSES,
+        product__isnull=False
+    ).annotate(
+        day=TruncDate('order__created_at')
+    ).order_by().values('product_id', 'day').annotate(
+        units=Sum('quantity'),
+        revenue=Sum('total')
+    )
+    counted = Q(status__in=SALES_STATUSES) & Exists(OrderItem.objects.filter(order=OuterRef('pk'), product__isnull=False))
+    with transaction.atomic():
+        ProductSalesDay.objects.all().delete()
+        ProductSalesDay.objects.bulk_create([ProductSalesDay(**row) for row in rows], batch_size=1000)
+        Order.objects.update(sales_recorded=ExpressionWrapper(counted, output_field=BooleanField()))
+        ProductSalesSummary.objects.all().delete()
+        ProductSalesSummary.refresh()
+    bump_version(SALES_CACHE_NAMESPACE)
+    return ProductSalesDay.objects.count()
+
+
+def update_best_sellers(top=None):
+    """
+    Pencereleri kaydırır ve her kategoride en çok satan `top` ürünü işaretler.
+
+    Bayraklar yalnızca değişen satırlara tek bir UPDATE ile yazılır.
+    (işaretlenen, değişen) ürün sayılarını döndürür.
+    """
+    top = top or getattr(settings, 'PRODUCT_BEST_SELLER_COUNT', 10)
+    with transaction.atomic():
+        ProductSalesSummary.refresh()
+        top_ids = list(
+            ProductSalesSummary.objects.filter(
+                product__status='active',
+                **{f'{RANKING_FIELD}__gt': 0}
+            ).annotate(
+                position=Window(
+                    RowNumber(),
+                    partition_by=F('product__category_id'),
+                    order_by=[F(RANKING_FIELD).desc(), F('product_id').asc()]
+                )
+            ).filter(position__lte=top).values_list('product_id', flat=True)
+        )
+        changed = Product.objects.filter(
+            Q(is_best_seller=False, pk__in=top_ids) | (Q(is_best_seller=True) & ~Q(pk__in=top_ids))
+        ).update(
+            is_best_seller=Case(When(pk__in=top_ids, then=Value(True)), default=Value(False)),
+            updated_at=timezone.now()
+        )
+    bump_version(SALES_CACHE_NAMESPACE, FACET_CACHE_NAMESPACE)
+    return len(top_ids), changed
@@ -0,0 +1,320 @@
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing import get_context
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .extractors import DEFAULT_EXTRACTOR, extract
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Bu yanıtlarda istek geri çekilerek yeniden denenir
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Saniyede `rate` istek; boşta biriken en fazla `burst` istek bekletilmeden geçer"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Jeton eksiye düşebilir: istek sırasını ayırır, beklemeyi kilit dışında yapar
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+
+
+class HostRateLimiter:
+    """Her host için ayrı bir TokenBucket; rate <= 0 ise sınır uygulanmaz"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url):
+        if self.rate <= 0:
+            return
+        host = urlsplit(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+        bucket.acquire()
+
+
+class Page:
+    """İndirilen ya da önbellekten doğrulanan bir yanıtın gövdesi"""
+
+    def __init__(self, url, content, from_cache=False):
+        self.url = url
+        self.content = content
+        self.from_cache = from_cache
+
+
+class HTTPCache:
+    """
+    URL anahtarlı disk önbelleği.
+
+    Her kayıt gövdeyi ve ETag/Last-Modified doğrulayıcılarını saklar; sonraki
+    istekler koşullu gönderilir ve 304 gelirse gövde diskten okunur.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def _path(self, url):
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / digest[:2] / digest
+
+    def load(self, url):
+        path = self._path(url)
+        try:
+            meta = json.loads(path.with_suffix('.json').read_text(encoding='utf-8'))
+            meta['content'] = path.with_suffix('.body').read_bytes()
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def store(self, url, response):
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        if not any(validators.values()):
+            return
+        path = self._path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Yarım kalan yazmalar okunmasın diye önce geçici dosyaya yazılıp taşınır;
+        # gövde önce yazılır, meta dosyası kaydın tamamlandığını gösterir
+        self._write(path.with_suffix('.body'), response.content)
+        self._write(path.with_suffix('.json'), json.dumps(dict(validators, url=url)).encode('utf-8'))
+
+    def _write(self, path, data):
+        handle, temp_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(handle, 'wb') as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def conditional_headers(entry):
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+
+class Checkpoint:
+    """
+    Tamamlanan (alt kategori, ürün URL'si) çiftlerini satır satır dosyaya yazar.
+
+    Yarıda kalan tarama aynı dosyayla yeniden başlatılınca bu ürünler atlanır;
+    tarama tamamlanınca dosya silinir.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.completed = set()
+        if self.path.exists():
+            with self.path.open(encoding='utf-8') as handle:
+                for line in handle:
+                    try:
+                        self.completed.add(tuple(json.loads(line)))
+                    except ValueError:
+                        # Çökme anında yarım yazılmış son satır
+                        continue
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = self.path.open('a', encoding='utf-8')
+
+    def __contains__(self, key):
+        return key in self.completed
+
+    def __len__(self):
+        return len(self.completed)
+
+    def add(self, subcategory, url):
+        self.completed.add((subcategory, url))
+        self.handle.write(json.dumps([subcategory, url], ensure_ascii=False) + '\n')
+        self.handle.flush()
+
+    def close(self, finished=False):
+        self.handle.close()
+        if finished:
+            self.path.unlink(missing_ok=True)
+
+
+class Fetcher:
+    """
+    Bağlantı havuzlu, host başına hız sınırlı ve yeniden denemeli HTTP istemcisi.
+
+    Tek bir requests.Session iş parçacıkları arasında paylaşılır; havuz boyutu
+    işçi sayısına göre ayarlandığı için keep-alive bağlantıları yeniden kullanılır.
+    """
+
+    def __init__(self, pool_size=8, rate=2.0, burst=2, retries=3, backoff=0.5, timeout=20, headers=None, cache=None):
+        self.limiter = HostRateLimiter(rate, burst)
+        self.cache = cache
+        self.stats = {'requests': 0, 'not_modified': 0}
+        self.stats_lock = threading.Lock()
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _delay(self, attempt, response=None):
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return int(retry_after)
+        # Üstel geri çekilme; aynı anda düşen isteklerin birlikte dönmemesi için rastgele pay eklenir
+        return self.backoff * (2 ** attempt) + random.uniform(0, self.backoff)
+
+    def _count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def get(self, url):
+        """Sayfayı indirir; önbellekte kopyası varsa koşullu istek gönderip 304'te diskten okur"""
+        entry = self.cache.load(url) if self.cache else None
+        headers = HTTPCache.conditional_headers(entry) if entry else {}
+        response = self._request(url, headers)
+        if response.status_code == 304 and entry:
+            self._count('not_modified')
+            return Page(url, entry['content'], from_cache=True)
+        if self.cache:
+            self.cache.store(url, response)
+        return Page(response.url, response.content)
+
+    def _request(self, url, headers):
+        attempt = 0
+        while True:
+            self.limiter.acquire(url)
+            self._count('requests')
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.retries:
+                    raise
+                time.sleep(self._delay(attempt))
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                    response.raise_for_status()
+                    return response
+                time.sleep(self._delay(attempt, response))
+            attempt += 1
+
+    def close(self):
+        self.session.close()
+
+
+class Crawler:
+    """
+    Kategori sayfası -> ürün sayfası -> resim aşamalarını eş zamanlı yürütür.
+
+    İndirmeler bir iş parçacığı havuzunda, HTML çözümleme ise `parse_workers`
+    süreçli bir havuzda yapılır (0 ise indirme iş parçacıklarında). `crawl`
+    tamamlanan ürünleri düz sözlükler olarak geldikçe döndürür; çağıran taraf
+    (veritabanı yazıcısı) bunları partiler halinde yazarken tarama sürer.
+    """
+
+    def __init__(self, fetcher, workers=8, limit=10, on_error=None, checkpoint=None,
+                 extractor=DEFAULT_EXTRACTOR, parse_workers=0, known_images=None):
+        self.fetcher = fetcher
+        self.workers = workers
+        self.limit = limit
+        self.on_error = on_error or (lambda message: None)
+        self.checkpoint = checkpoint if checkpoint is not None else set()
+        self.extractor = extractor
+        self.parse_workers = parse_workers
+        # Ürün URL'si -> kayıtlı resim URL'si; resmi değişmeyen ürünlerde resim indirilmez
+        self.known_images = known_images or {}
+        # Alt kategori -> kategori sayfasında görülen tüm ürün URL'leri (limit ve kontrol noktasından önce)
+        self.listed = {}
+
+    def fetch_image(self, item):
+        try:
+            return self.fetcher.get(item['image_url']).content
+        except requests.RequestException as error:
+            self.on_error(f"Resim indirme hatası: {item['name']} - {error}")
+            return None
+
+    def crawl(self, sources):
+        # spawn: çatallanan süreç, ana süreçteki iş parçacıklarının kilitlerini devralmasın
+        parsers = ProcessPoolExecutor(self.parse_workers, mp_context=get_context('spawn')) if self.parse_workers else None
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        parser = parsers or pool
+        pending = {}
+
+        def submit(executor, stage, context, function, *args):
+            pending[executor.submit(function, *args)] = (stage, context)
+
+        try:
+            for category, subcategory, url in sources:
+                submit(pool, 'listing-page', {'category': category, 'subcategory': subcategory, 'url': url},
+                       self.fetcher.get, url)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, context = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        self.on_error(f"{context['url']}: {error}")
+                        continue
+
+                    if stage == 'listing-page':
+                        submit(parser, 'listing', context, extract, self.extractor, 'listing', result.content, result.url)
+                    elif stage == 'listing':
+                        self.listed.setdefault(context['subcategory'], set()).update(item['url'] for item in result)
+                        for item in result[:self.limit]:
+                            # Önceki yarım kalan taramada tamamlanan ürünler yeniden işlenmez
+                            if (context['subcategory'], item['url']) in self.checkpoint:
+                                continue
+                            item = dict(item, category=context['category'], subcategory=context['subcategory'])
+                            submit(pool, 'detail-page', item, self.fetcher.get, item['url'])
+                    elif stage == 'detail-page':
+                        submit(parser, 'detail', context, extract, self.extractor, 'detail', result.content, result.url)
+                    elif stage == 'detail':
+                        # Resim öncelikle kategori sayfasından, yoksa detay sayfasından alınır
+                        item = dict(context, specs=result['specs'], image_url=context['image_url'] or result['image_url'])
+                        if item['image_url'] and self.known_images.get(item['url']) == item['image_url']:
+                            yield dict(item, image=None, image_unchanged=True)
+                        elif item['image_url']:
+                            submit(pool, 'image', item, self.fetch_image, item)
+                        else:
+                            yield dict(item, image=None)
+                    else:
+                        yield dict(context, image=result)
+        finally:
+            # Tüketici erken bırakırsa bekleyen işler iptal edilir
+            pool.shutdown(cancel_futures=True)
+            if parsers:
+                parsers.shutdown(cancel_futures=True)
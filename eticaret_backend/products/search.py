@@ -0,0 +1,153 @@
+import re
+from functools import lru_cache
+from html import unescape
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.utils.html import strip_tags
+from django.utils.module_loading import import_string
+
+from .models import Product, tr_normalize
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def product_document(product):
+    """Ürünün aranabilir alanlarını normalize edilmiş düz metin olarak döndürür"""
+    specs = product.specs if isinstance(product.specs, dict) else {}
+    return {
+        'name': tr_normalize(product.name),
+        'body': tr_normalize(unescape(strip_tags(product.description or ''))),
+        'specs': tr_normalize(' '.join(str(value) for value in specs.values())),
+        'category': tr_normalize(f'{product.category.name} {product.subcategory.name}'),
+    }
+
+
+def query_tokens(query):
+    return TOKEN_RE.findall(tr_normalize(query))
+
+
+class BaseSearchBackend:
+    """
+    Ürün arama altyapısı için ortak arayüz.
+
+    `search` verilen queryset'i filtreler ve sonuçlara `search_rank`
+    (küçük değer daha alakalı) ekler; indeks metotları kayıt değiştikçe çağrılır.
+    """
+    vendor = None
+
+    def search(self, queryset, query):
+        raise NotImplementedError
+
+    def empty(self, queryset):
+        # Sıralama search_rank'e dayanabileceği için boş sonuçta da annotasyon korunur
+        return queryset.none().annotate(search_rank=Value(0, output_field=IntegerField()))
+
+    def index_products(self, products):
+        pass
+
+    def remove_products(self, product_ids):
+        pass
+
+    def rebuild(self, batch_size=500):
+        return 0
+
+
+class BasicSearchBackend(BaseSearchBackend):
+    """İndeks tutmayan, icontains ile arayan yedek altyapı"""
+
+    def search(self, queryset, query):
+        condition = Q()
+        for token in query.split():
+            condition &= Q(name__icontains=token) | Q(description__icontains=token)
+        return queryset.filter(condition).annotate(
+            search_rank=Case(
+                When(name__icontains=query, then=Value(0)),
+                default=Value(1),
+                output_field=IntegerField()
+            )
+        )
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    """SQLite FTS5 sanal tablosu üzerinde BM25 sıralamalı arama"""
+    vendor = 'sqlite'
+    table = 'products_product_fts'
+    # name, body, specs, category sütunlarının BM25 ağırlıkları
+    weights = (10.0, 1.0, 3.0, 2.0)
+
+    def search(self, queryset, query):
+        tokens = query_tokens(query)
+        if not tokens:
+            return self.empty(queryset)
+
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        weights = ', '.join(str(weight) for weight in self.weights)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s '
+                f'ORDER BY bm25({self.table}, {weights}) LIMIT %s',
+                [match, getattr(settings, 'PRODUCT_SEARCH_MAX_RESULTS', 1000)]
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+        if not ids:
+            return self.empty(queryset)
+
+        return queryset.filter(pk__in=ids).annotate(
+            search_rank=Case(
+                *[When(pk=pk, then=Value(rank)) for rank, pk in enumerate(ids)],
+                output_field=IntegerField()
+            )
+        )
+
+    def index_products(self, products):
+        rows = []
+        for product in products:
+            document = product_document(product)
+            rows.append((product.pk, document['name'], document['body'], document['specs'], document['category']))
+        if not rows:
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {self.table} WHERE rowid = %s', [(row[0],) for row in rows])
+            cursor.executemany(
+                f'INSERT INTO {self.table} (rowid, name, body, specs, category) VALUES (%s, %s, %s, %s, %s)',
+                rows
+            )
+
+    def remove_products(self, product_ids):
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {self.table} WHERE rowid = %s', [(pk,) for pk in product_ids])
+
+    def rebuild(self, batch_size=500):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {self.table}')
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE {self.table} USING fts5('
+                "name, body, specs, category, tokenize='unicode61 remove_diacritics 2')"
+            )
+
+        products = Product.objects.select_related('category', 'subcategory').only(
+            'name', 'description', 'specs', 'category__name', 'subcategory__name'
+        ).order_by('pk')
+        count = 0
+        batch = []
+        for product in products.iterator(chunk_size=batch_size):
+            batch.append(product)
+            if len(batch) >= batch_size:
+                self.index_products(batch)
+                count += len(batch)
+                batch = []
+        self.index_products(batch)
+        return count + len(batch)
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    backend_class = import_string(
+        getattr(settings, 'PRODUCT_SEARCH_BACKEND', 'products.search.SQLiteFTSBackend')
+    )
+    # FTS5 yalnızca SQLite'ta bulunur; başka veritabanında yedek altyapıya düşülür
+    if backend_class.vendor and backend_class.vendor != connection.vendor:
+        backend_class = BasicSearchBackend
+    return backend_class()
@@ -1,183 +1,310 @@
-from rest_framework import serializers
-from .models import Category, SubCategory, Product, ProductImage, ProductVariant, Review, Slider
-from django.db import models
-
-class SubCategorySerializer(serializers.ModelSerializer):
-    image_url = serializers.SerializerMethodField()
-
-    class Meta:
-        model = SubCategory
-        fields = ['id', 'name', 'slug', 'image_url']
-
-    def get_image_url(self, obj):
-        if obj.image:
-            request = self.context.get('request')
-            return request.build_absolute_uri(obj.image.url)
-        return None
-
-class CategorySerializer(serializers.ModelSerializer):
-    subcategories = SubCategorySerializer(many=True, read_only=True)
-
-    class Meta:
-        model = Category
-        fields = ['id', 'name', 'slug', 'subcategories']
-
-
-class ProductImageSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
-    
-    class Meta:
-        model = ProductImage
-        fields = ['id', 'image', 'is_primary', 'order']
-    
-    def get_image(self, obj):
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
-        return None
-
-class ProductVariantSerializer(serializers.ModelSerializer):
-    variant_type_display = serializers.CharField(source='get_variant_type_display', read_only=True)
-    final_price = serializers.SerializerMethodField()
-    
-    class Meta:
-        model = ProductVariant
-        fields = [
-            'id', 'variant_type', 'variant_type_display', 
-            'name', 'sku', 'stock', 'price_adjustment', 
-            'is_default', 'final_price'
-        ]
-
-    def get_final_price(self, obj):
-        base_price = obj.product.price
-        return float(base_price) + float(obj.price_adjustment)
-
-class ReviewSerializer(serializers.ModelSerializer):
-    user = serializers.StringRelatedField()
-    user_id = serializers.IntegerField(source='user.id', read_only=True)
-    created_at_formatted = serializers.SerializerMethodField()
-    
-    class Meta:
-        model = Review
-        fields = [
-            'id', 'user', 'user_id', 'rating', 
-            'comment', 'pros', 'cons', 
-            'is_verified_purchase', 'created_at',
-            'created_at_formatted'
-        ]
-        read_only_fields = ['user', 'is_verified_purchase']
-
-    def get_created_at_formatted(self, obj):
-        return obj.created_at.strftime("%d.%m.%Y %H:%M")
-
-    def create(self, validated_data):
-        validated_data['user'] = self.context['request'].user
-        return super().create(validated_data)
-
-class ProductSerializer(serializers.ModelSerializer):
-    category = CategorySerializer(read_only=True)
-    subcategory = SubCategorySerializer(read_only=True)
-    images = ProductImageSerializer(many=True, read_only=True)
-    variants = ProductVariantSerializer(many=True, read_only=True)
-    reviews = serializers.SerializerMethodField()
-    primary_image_url = serializers.SerializerMethodField()
-    average_rating = serializers.SerializerMethodField()
-    review_count = serializers.SerializerMethodField()
-    variant_types = serializers.SerializerMethodField()
-    specs = serializers.JSONField(required=False)
-    discount_percentage = serializers.SerializerMethodField()
-
-
-    class Meta:
-        model = Product
-        fields = [
-            'id', 'name', 'slug', 'description', 'price',
-            'category', 'subcategory', 'specs', 'stock',
-            'status', 'is_best_seller', 'is_featured', 
-            'discounted_price','is_on_sale', 'created_at', 'updated_at',
-            'images', 'primary_image_url', 'variants',
-            'reviews', 'average_rating', 'review_count',
-            'variant_types', 'discount_percentage'
-        ]
-
-    def get_primary_image_url(self, obj):
-        primary_image = obj.images.filter(is_primary=True).first()
-        if primary_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(primary_image.image.url)
-            return primary_image.image.url
-        return None
-
-    def get_reviews(self, obj):
-        # Sadece onaylanmış yorumları getir
-        reviews = obj.reviews.filter(is_approved=True)
-        return ReviewSerializer(reviews, many=True, context=self.context).data
-
-    def get_average_rating(self, obj):
-        reviews = obj.reviews.filter(is_approved=True)
-        if reviews.exists():
-            return round(reviews.aggregate(avg=models.Avg('rating'))['avg'], 1)
-        return None
-
-    def get_review_count(self, obj):
-        return obj.reviews.filter(is_approved=True).count()
-
-    def get_variant_types(self, obj):
-        try:
-            variant_types = obj.variants.values_list('variant_type', flat=True).distinct()
-            variant_types_dict = dict(ProductVariant.VARIANT_TYPES)
-            
-            return [
-                {
-                    'type': v_type,
-                    'display_name': variant_types_dict.get(v_type, v_type),  # Güvenli bir şekilde almak için
-                    'values': list(obj.variants.filter(variant_type=v_type).values(
-                    'id', 'name', 'price_adjustment', 'is_default'
-                ))
-            }
-            for v_type in variant_types
-            ]
-        except Exception as e:
-            print(f"Variant types error: {str(e)}")  # Hata ayıklama içim
-            return [] 
-
-    def get_discount_percentage(self, obj):
-        if obj.is_on_sale and obj.discounted_price:
-            discount = ((obj.price - obj.discounted_price) / obj.price) * 100
-            return round(discount)
-        return None
-
-class ProductDetailSerializer(ProductSerializer):
-    """Ürün detay sayfası için genişletilmiş serializer"""
-    related_products = serializers.SerializerMethodField()
-
-    class Meta(ProductSerializer.Meta):
-        fields = ProductSerializer.Meta.fields + ['related_products']
-
-    def get_related_products(self, obj):
-        # Aynı kategorideki benzer ürünleri getir
-        related = Product.objects.filter(
-            category=obj.category,
-            status='active'
-        ).exclude(
-            id=obj.id
-        )[:4]
-        return ProductSerializer(related, many=True, context=self.context).data
-    
-class SliderSerializer(serializers.ModelSerializer):
-    image_url = serializers.SerializerMethodField()
-
-    class Meta:
-        model = Slider
-        fields = ['id', 'title', 'description', 'image_url', 'url', 'button_text']
-
-    def get_image_url(self, obj):
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
+from rest_framework import serializers
+from django.db.models import Prefetch
+from .derivatives import image_srcset
+from .models import Category, SubCategory, Product, ProductImage, ProductVariant, ProductRatingSummary, Review, Slider
+
+class DynamicFieldsMixin:
+    """
+    `fields` ve `expand` argümanlarıyla döndürülecek alanları seçmeye izin verir.
+
+    Meta.expandable_fields içindeki ağır alanlar varsayılan olarak dönmez;
+    `expand` ile ya da `fields` içinde açıkça istenirse eklenir.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        expand = kwargs.pop('expand', None)
+        super().__init__(*args, **kwargs)
+
+        selected = self.select_fields(fields, expand)
+        for name in list(self.fields):
+            if name not in selected:
+                self.fields.pop(name)
+
+    @classmethod
+    def select_fields(cls, fields=None, expand=None):
+        declared = set(cls.Meta.fields)
+        expandable = set(getattr(cls.Meta, 'expandable_fields', []))
+        selected = set(fields) & declared if fields else declared - expandable
+        if expand:
+            selected |= set(expand) & expandable
+        return selected
+
+
+class SubCategorySerializer(serializers.ModelSerializer):
+    image_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
+
+    class Meta:
+        model = SubCategory
+        fields = ['id', 'name', 'slug', 'image_url', 'image_srcset']
+
+    def get_image_url(self, obj):
+        if obj.image:
+            request = self.context.get('request')
+            return request.build_absolute_uri(obj.image.url)
+        return None
+
+    def get_image_srcset(self, obj):
+        return image_srcset(obj.image, self.context.get('request'))
+
+class CategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    subcategories = SubCategorySerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Category
+        fields = ['id', 'name', 'slug', 'subcategories']
+
+
+class CategorySummarySerializer(serializers.ModelSerializer):
+    """Ürün listelerinde kullanılan, alt kategorileri içermeyen kategori özeti"""
+
+    class Meta:
+        model = Category
+        fields = ['id', 'name', 'slug']
+
+
+class ProductImageSerializer(serializers.ModelSerializer):
+    image = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ProductImage
+        fields = ['id', 'image', 'srcset', 'is_primary', 'order']
+    
+    def get_image(self, obj):
+        if obj.image:
+            request = self.context.get('request')
+            if request:
+                return request.build_absolute_uri(obj.image.url)
+            return obj.image.url
+        return None
+
+    def get_srcset(self, obj):
+        return image_srcset(obj.image, self.context.get('request'))
+
+class ProductVariantSerializer(serializers.ModelSerializer):
+    variant_type_display = serializers.CharField(source='get_variant_type_display', read_only=True)
+    final_price = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ProductVariant
+        fields = [
+            'id', 'variant_type', 'variant_type_display', 
+            'name', 'sku', 'stock', 'price_adjustment', 
+            'is_default', 'final_price'
+        ]
+
+    def get_final_price(self, obj):
+        base_price = obj.product.price
+        return float(base_price) + float(obj.price_adjustment)
+
+class ReviewSerializer(serializers.ModelSerializer):
+    user = serializers.StringRelatedField()
+    user_id = serializers.IntegerField(source='user.id', read_only=True)
+    created_at_formatted = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = Review
+        fields = [
+            'id', 'user', 'user_id', 'rating', 
+            'comment', 'pros', 'cons', 
+            'is_verified_purchase', 'created_at',
+            'created_at_formatted'
+        ]
+        read_only_fields = ['user', 'is_verified_purchase']
+
+    def get_created_at_formatted(self, obj):
+        return obj.created_at.strftime("%d.%m.%Y %H:%M")
+
+    def create(self, validated_data):
+        validated_data['user'] = self.context['request'].user
+        return super().create(validated_data)
+
+class CartLineSerializer(serializers.Serializer):
+    """Sepet satırı: stok kontrolü ve sipariş oluşturma aynı biçimi kullanır"""
+    product = serializers.IntegerField()
+    variant_ids = serializers.ListField(child=serializers.IntegerField(), required=False, default=list)
+    quantity = serializers.IntegerField(min_value=1, default=1)
+
+class StockCheckSerializer(serializers.Serializer):
+    # Tek istekte kontrol edilebilecek sepet satırı sayısı sınırlıdır
+    lines = CartLineSerializer(many=True, allow_empty=False, max_length=100)
+
+class StockCheckResultLineSerializer(serializers.Serializer):
+    # Bulunamayan ürün ya da geçersiz varyant satırlarında fiyat alanları yerine error döner
+    product = serializers.IntegerField()
+    variant_ids = serializers.ListField(child=serializers.IntegerField())
+    quantity = serializers.IntegerField()
+    available = serializers.BooleanField()
+    stock = serializers.IntegerField()
+    slug = serializers.CharField(required=False)
+    name = serializers.CharField(required=False)
+    price = serializers.DecimalField(max_digits=10, decimal_places=2, required=False)
+    unit_price = serializers.DecimalField(max_digits=10, decimal_places=2, required=False)
+    total = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    error = serializers.CharField(required=False)
+
+class StockCheckResultSerializer(serializers.Serializer):
+    available = serializers.BooleanField()
+    total = serializers.DecimalField(max_digits=12, decimal_places=2)
+    lines = StockCheckResultLineSerializer(many=True)
+
+def approved_reviews_prefetch():
+    """Onaylı yorumları kullanıcılarıyla birlikte `approved_reviews` listesine yükler"""
+    return Prefetch(
+        'reviews',
+        queryset=Review.objects.filter(is_approved=True).select_related('user'),
+        to_attr='approved_reviews'
+    )
+
+class ProductSerializer(serializers.ModelSerializer):
+    category = CategorySerializer(read_only=True)
+    subcategory = SubCategorySerializer(read_only=True)
+    images = ProductImageSerializer(many=True, read_only=True)
+    variants = ProductVariantSerializer(many=True, read_only=True)
+    reviews = serializers.SerializerMethodField()
+    primary_image_url = serializers.SerializerMethodField()
+    average_rating = serializers.SerializerMethodField()
+    review_count = serializers.SerializerMethodField()
+    variant_types = serializers.SerializerMethodField()
+    specs = serializers.JSONField(required=False)
+    discount_percentage = serializers.SerializerMethodField()
+
+
+    class Meta:
+        model = Product
+        fields = [
+            'id', 'name', 'slug', 'description', 'price',
+            'category', 'subcategory', 'specs', 'stock',
+            'status', 'is_best_seller', 'is_featured', 
+            'discounted_price','is_on_sale', 'created_at', 'updated_at',
+            'images', 'primary_image_url', 'variants',
+            'reviews', 'average_rating', 'review_count',
+            'variant_types', 'discount_percentage'
+        ]
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Tam ürün temsili için gereken tüm ilişkileri önceden yükler"""
+        return queryset.select_related(
+            'category',
+            'subcategory',
+            'rating_summary',
+            'primary_image'
+        ).prefetch_related(
+            'category__subcategories',
+            'images',
+            'variants',
+            approved_reviews_prefetch()
+        )
+
+    def get_primary_image_url(self, obj):
+        # primary_image select_related ile yüklendiğinde ek sorgu atılmaz
+        primary_image = obj.primary_image
+        if primary_image:
+            request = self.context.get('request')
+            if request:
+                return request.build_absolute_uri(primary_image.image.url)
+            return primary_image.image.url
+        return None
+
+    def get_reviews(self, obj):
+        # Sadece onaylanmış yorumları getir
+        reviews = getattr(obj, 'approved_reviews', None)
+        if reviews is None:
+            reviews = obj.reviews.filter(is_approved=True).select_related('user')
+        return ReviewSerializer(reviews, many=True, context=self.context).data
+
+    def _rating_summary(self, obj):
+        # Queryset'te select_related('rating_summary') yapıldığında ek sorgu atılmaz
+        try:
+            return obj.rating_summary
+        except ProductRatingSummary.DoesNotExist:
+            return None
+
+    def get_average_rating(self, obj):
+        summary = self._rating_summary(obj)
+        return summary.average_rating if summary else None
+
+    def get_review_count(self, obj):
+        summary = self._rating_summary(obj)
+        return summary.review_count if summary else 0
+
+    def get_variant_types(self, obj):
+        try:
+            # Önceden yüklenmiş varyantlar tipine göre Python tarafında gruplanır
+            grouped = {}
+            for variant in obj.variants.all():
+                grouped.setdefault(variant.variant_type, []).append({
+                    'id': variant.id,
+                    'name': variant.name,
+                    'price_adjustment': variant.price_adjustment,
+                    'is_default': variant.is_default
+                })
+            variant_types_dict = dict(ProductVariant.VARIANT_TYPES)
+            
+            return [
+                {
+                    'type': v_type,
+                    'display_name': variant_types_dict.get(v_type, v_type),  # Güvenli bir şekilde almak için
+                    'values': values
+                }
+                for v_type, values in grouped.items()
+            ]
+        except Exception as e:
+            print(f"Variant types error: {str(e)}")  # Hata ayıklama içim
+            return [] 
+
+    def get_discount_percentage(self, obj):
+        if obj.is_on_sale and obj.discounted_price:
+            discount = ((obj.price - obj.discounted_price) / obj.price) * 100
+            return round(discount)
+        return None
+
+class ProductListSerializer(DynamicFieldsMixin, ProductSerializer):
+    """Kategori ızgaraları için hafif ürün temsili; ağır alanlar `?expand=` ile eklenir"""
+    category = CategorySummarySerializer(read_only=True)
+
+    class Meta(ProductSerializer.Meta):
+        expandable_fields = ['description', 'specs', 'images', 'variants', 'reviews', 'variant_types']
+
+class ProductDetailSerializer(DynamicFieldsMixin, ProductSerializer):
+    """Ürün detay sayfası için genişletilmiş serializer; `?fields=` ile alanlar daraltılabilir"""
+    related_products = serializers.SerializerMethodField()
+
+    class Meta(ProductSerializer.Meta):
+        fields = ProductSerializer.Meta.fields + ['related_products']
+
+    def get_related_products(self, obj):
+        # Önceden hesaplanmış benzer ürünler (bkz. products.similarity); liste henüz
+        # hesaplanmamışsa aynı kategorideki ürünlere düşülür
+        products = Product.objects.select_related(
+            'category',
+            'subcategory',
+            'rating_summary',
+            'primary_image'
+        ).defer('description', 'specs').filter(status='active')
+        related = list(products.filter(related_from__product=obj).order_by('related_from__rank')[:4])
+        if not related:
+            related = list(products.filter(category_id=obj.category_id).exclude(id=obj.id)[:4])
+        return ProductListSerializer(related, many=True, context=self.context).data
+    
+class SliderSerializer(serializers.ModelSerializer):
+    image_url = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Slider
+        fields = ['id', 'title', 'description', 'image_url', 'image_srcset', 'url', 'button_text']
+
+    def get_image_srcset(self, obj):
+        return image_srcset(obj.image, self.context.get('request'))
+
+    def get_image_url(self, obj):
+        if obj.image:
+            request = self.context.get('request')
+            if request:
+                return request.build_absolute_uri(obj.image.url)
+            return obj.image.url
         return None
\ No newline at end of file
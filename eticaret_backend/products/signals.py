@@ -0,0 +1,123 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Category, Product, ProductImage, ProductRatingSummary, RelatedProduct, Review, Slider, SubCategory
+from .attributes import sync_attributes
+from .cache import invalidate_responses
+from .derivatives import derivative_worker
+from .facets import invalidate_facets
+from .search import get_search_backend
+from .similarity import SIMILARITY_FIELDS, refresh_related_for_product, similarity_changed
+from .suggest import suggestions_changed
+
+
+def _deleted_with_product(origin):
+    # Ürün silinirken yorumlar da cascade ile silinir; özet zaten kaldırılacağı için yeniden yazılmaz
+    return isinstance(origin, Product) or getattr(origin, 'model', None) is Product
+
+
+@receiver(post_save, sender=Review)
+def review_saved(sender, instance, **kwargs):
+    ProductRatingSummary.refresh([instance.product_id])
+
+
+@receiver(post_delete, sender=Review)
+def review_deleted(sender, instance, origin=None, **kwargs):
+    if _deleted_with_product(origin):
+        return
+    ProductRatingSummary.refresh([instance.product_id])
+
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance, **kwargs):
+    sync_attributes([instance])
+    get_search_backend().index_products([instance])
+    pk = instance.pk
+    transaction.on_commit(lambda: suggestions_changed('product', [pk]))
+    if similarity_changed(instance):
+        transaction.on_commit(lambda: refresh_related_for_product(pk))
+    # Sonraki kayıtlar bu değerlere göre karşılaştırılır
+    loaded = getattr(instance, '_loaded_values', {})
+    instance._loaded_values = {
+        **loaded, **{field: instance.__dict__[field] for field in SIMILARITY_FIELDS if field in instance.__dict__}
+    }
+    invalidate_facets()
+
+
+@receiver(pre_delete, sender=Product)
+def product_deleting(sender, instance, **kwargs):
+    # Ürünü listesinde tutan bağlantılar cascade ile silineceği için sahipleri önceden alınır
+    instance._related_holders = list(
+        RelatedProduct.objects.filter(related_id=instance.pk).values_list('product_id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Product)
+def product_deleted(sender, instance, **kwargs):
+    pk = instance.pk
+    holders = getattr(instance, '_related_holders', None)
+    get_search_backend().remove_products([pk])
+    transaction.on_commit(lambda: suggestions_changed('product', [pk]))
+    transaction.on_commit(lambda: refresh_related_for_product(pk, holders))
+    invalidate_facets()
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=SubCategory)
+def category_saved(sender, instance, created, **kwargs):
+    # Kategori adları da indekslendiği için bağlı ürünler yeniden indekslenir
+    if created:
+        return
+    invalidate_facets()
+    lookup = 'category' if sender is Category else 'subcategory'
+    products = Product.objects.select_related('category', 'subcategory').filter(**{lookup: instance})
+    get_search_backend().index_products(products.iterator())
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=SubCategory)
+def category_suggestion_saved(sender, instance, **kwargs):
+    kind = 'category' if sender is Category else 'subcategory'
+    pk = instance.pk
+    transaction.on_commit(lambda: suggestions_changed(kind, [pk]))
+
+
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=SubCategory)
+def category_suggestion_deleted(sender, instance, **kwargs):
+    kind = 'category' if sender is Category else 'subcategory'
+    # Silme sonrası instance.pk None yapılır; commit'te kullanılmak üzere önceden alınır
+    pk = instance.pk
+    transaction.on_commit(lambda: suggestions_changed(kind, [pk]))
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def product_image_changed(sender, instance, origin=None, **kwargs):
+    # Öneri küçük resmi ana resme bağlı olduğu için ürün kaydı tazelenir
+    if _deleted_with_product(origin):
+        return
+    product_id = instance.product_id
+    Product.update_primary_images([product_id])
+    # Bellekteki ürün (ör. admin formundaki) daha sonra kaydedilirse eski işaretçiyi yazmasın
+    product = instance._state.fields_cache.get('product')
+    if product is not None:
+        product.refresh_from_db(fields=['primary_image'])
+    transaction.on_commit(lambda: suggestions_changed('product', [product_id]))
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=SubCategory)
+@receiver([post_save, post_delete], sender=Slider)
+def reference_data_changed(sender, **kwargs):
+    invalidate_responses(sender)
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_save, sender=SubCategory)
+@receiver(post_save, sender=Slider)
+def image_saved(sender, instance, **kwargs):
+    # Türevler (küçük boyutlar, WebP) yükleme isteğini bekletmeden arka planda üretilir
+    if instance.image:
+        derivative_worker.schedule(instance.image.name)
@@ -0,0 +1,280 @@
+import math
+from collections import defaultdict
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+
+from .models import Product, ProductAttribute, RelatedProduct
+from .search import query_tokens
+
+# Özellik gruplarının ağırlıkları (IDF ile çarpılmadan önce)
+NAME_WEIGHT = 1.0
+SUBCATEGORY_WEIGHT = 2.0
+PRICE_WEIGHT = 1.0
+SPEC_WEIGHT = 1.5
+
+# Fiyat bantları logaritmiktir; her bant bir öncekinin 1.5 katı genişliğindedir
+PRICE_BAND_RATIO = 1.5
+
+# Benzerlik matrisi bu kadar satırlık bloklar halinde hesaplanır
+BLOCK_SIZE = 512
+
+# Benzerliği etkileyen ürün alanları; yalnızca bunlar değişince benzer ürün listeleri yenilenir
+SIMILARITY_FIELDS = ('name', 'price', 'category_id', 'subcategory_id', 'status', 'specs')
+
+
+def related_count():
+    return getattr(settings, 'PRODUCT_RELATED_COUNT', 8)
+
+
+def price_band(price):
+    if not price or price <= 0:
+        return None
+    return math.floor(math.log(float(price), PRICE_BAND_RATIO))
+
+
+def product_features(product, attributes):
+    """Ürünün ad, alt kategori, fiyat bandı ve normalize özelliklerinden oluşan ağırlıklı özellik kümesi"""
+    features = {f'w:{token}': NAME_WEIGHT for token in query_tokens(product.name)}
+    features[f'sub:{product.subcategory_id}'] = SUBCATEGORY_WEIGHT
+    band = price_band(product.price)
+    if band is not None:
+        # Komşu bantlar yarım ağırlıkla eklenir, böylece bant sınırındaki ürünler de benzeşir
+        features[f'price:{band - 1}'] = PRICE_WEIGHT / 2
+        features[f'price:{band + 1}'] = PRICE_WEIGHT / 2
+        features[f'price:{band}'] = PRICE_WEIGHT
+    for key, value in attributes:
+        features[f'spec:{key}={value}'] = SPEC_WEIGHT
+    return features
+
+
+def _idf(vectors):
+    document_frequency = defaultdict(int)
+    for features in vectors:
+        for feature in features:
+            document_frequency[feature] += 1
+    count = len(vectors)
+    idf = {
+        feature: math.log((1 + count) / (1 + frequency)) + 1
+        for feature, frequency in document_frequency.items()
+    }
+    return document_frequency, idf
+
+
+def top_neighbours(vectors, k):
+    """
+    Özellik kümeleri listesi için TF-IDF kosinüs benzerliğine göre en yakın k komşuyu bulur.
+
+    Her satır için [(indeks, skor), ...] döner; skoru 0 olan komşular atlanır.
+    """
+    count = len(vectors)
+    k = min(k, count - 1)
+    if k <= 0:
+        return [[] for _ in vectors]
+
+    document_frequency, idf = _idf(vectors)
+    # Yalnızca tek üründe geçen özellikler hiçbir skora katkı vermez; sütun olarak
+    # tutulmaz, yalnızca satır normuna dahil edilir
+    vocabulary = {}
+    for feature, frequency in document_frequency.items():
+        if frequency > 1:
+            vocabulary[feature] = len(vocabulary)
+
+    rows, columns, values = [], [], []
+    norms = np.zeros(count)
+    for row, features in enumerate(vectors):
+        for feature, weight in features.items():
+            value = weight * idf[feature]
+            norms[row] += value * value
+            column = vocabulary.get(feature)
+            if column is not None:
+                rows.append(row)
+                columns.append(column)
+                values.append(value)
+
+    matrix = np.zeros((count, len(vocabulary)), dtype=np.float32)
+    matrix[rows, columns] = values
+    norms = np.sqrt(norms)
+    norms[norms == 0] = 1
+    matrix /= norms[:, None].astype(np.float32)
+
+    neighbours = []
+    for start in range(0, count, BLOCK_SIZE):
+        scores = matrix[start:start + BLOCK_SIZE] @ matrix.T
+        block = np.arange(scores.shape[0])
+        scores[block, block + start] = -1
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        for indexes, row_scores in zip(top, top_scores):
+            neighbours.append([
+                (int(index), float(score)) for index, score in zip(indexes, row_scores) if score > 0
+            ])
+    return neighbours
+
+
+def refresh_related(category_ids=None):
+    """
+    Verilen kategorilerdeki (None ise tüm) aktif ürünlerin benzer ürün listelerini yeniden hesaplar.
+
+    Benzerlik kategori içinde aranır; her kategori ayrı bir matris olarak işlenir.
+    Yazılan RelatedProduct satırı sayısını döndürür.
+    """
+    products = Product.objects.filter(status='active').only(
+        'name', 'price', 'category', 'subcategory'
+    ).order_by('pk')
+    attribute_rows = ProductAttribute.objects.filter(product__status='active')
+    stale = RelatedProduct.objects.all()
+    if category_ids is not None:
+        products = products.filter(category_id__in=category_ids)
+        attribute_rows = attribute_rows.filter(product__category_id__in=category_ids)
+        stale = stale.filter(product__category_id__in=category_ids)
+
+    members, attributes = _load_members(products, attribute_rows)
+
+    k = related_count()
+    links = []
+    for category_products in members.values():
+        vectors = [product_features(product, attributes[product.pk]) for product in category_products]
+        for product, neighbours in zip(category_products, top_neighbours(vectors, k)):
+            links.extend(
+                RelatedProduct(product_id=product.pk, related_id=category_products[index].pk, score=score, rank=rank)
+                for rank, (index, score) in enumerate(neighbours)
+            )
+
+    with transaction.atomic():
+        stale.delete()
+        RelatedProduct.objects.bulk_create(links, batch_size=1000)
+    return len(links)
+
+
+def _load_members(products, attribute_rows):
+    members = defaultdict(list)
+    for product in products.iterator(chunk_size=2000):
+        members[product.category_id].append(product)
+    attributes = defaultdict(list)
+    for product_id, key, value in attribute_rows.values_list('product_id', 'key', 'value').iterator(chunk_size=5000):
+        attributes[product_id].append((key, value))
+    return members, attributes
+
+
+class CategoryVectors:
+    """
+    Bir kategorinin aktif ürünleri için normalize TF-IDF vektörleri ve özellik -> ürün dizini.
+
+    Tek bir ürünün skorları yalnızca onun özelliklerini paylaşan ürünler
+    gezilerek hesaplanır; matris kurulmaz.
+    """
+
+    def __init__(self, category_id):
+        products = Product.objects.filter(status='active', category_id=category_id).only(
+            'name', 'price', 'category', 'subcategory'
+        ).order_by('pk')
+        attribute_rows = ProductAttribute.objects.filter(product__status='active', product__category_id=category_id)
+        members, attributes = _load_members(products, attribute_rows)
+        members = members[category_id]
+        features = [product_features(product, attributes[product.pk]) for product in members]
+        _, idf = _idf(features)
+
+        self.vectors = {}
+        self.postings = defaultdict(list)
+        for product, weights in zip(members, features):
+            vector = {feature: weight * idf[feature] for feature, weight in weights.items()}
+            norm = math.sqrt(sum(value * value for value in vector.values())) or 1
+            vector = {feature: value / norm for feature, value in vector.items()}
+            self.vectors[product.pk] = vector
+            for feature, value in vector.items():
+                self.postings[feature].append((product.pk, value))
+
+    def __contains__(self, product_id):
+        return product_id in self.vectors
+
+    def scores(self, product_id):
+        """Ürünün kategorideki diğer ürünlerle pozitif kosinüs skorları: {ürün_id: skor}"""
+        scores = defaultdict(float)
+        for feature, value in self.vectors[product_id].items():
+            for other_id, other_value in self.postings[feature]:
+                if other_id != product_id:
+                    scores[other_id] += value * other_value
+        return {other_id: score for other_id, score in scores.items() if score > 0}
+
+    def neighbours(self, product_id, k):
+        return _ranked(self.scores(product_id).items(), k)
+
+
+def _ranked(candidates, k):
+    return sorted(candidates, key=lambda candidate: (-candidate[1], candidate[0]))[:k]
+
+
+def refresh_related_for_product(product_id, holder_ids=None):
+    """
+    Tek bir ürün eklenince, değişince ya da silinince benzer ürün listelerini artımlı günceller.
+
+    Ürünün kendi listesi kategorisine karşı skorlanır; diğer ürünlerin listelerine
+    yalnızca ilk k'ya giriyorsa eklenir. Ürünü listesinde tutan ürünlerin (silinen
+    ürün için `holder_ids`, silme öncesi alınmalıdır) listeleri baştan skorlanır,
+    çünkü ürünün skoru düşmüş ya da ürün kategoriden çıkmış olabilir.
+    Kategorinin tamamı yeniden hesaplanmaz; IDF ağırlıklarındaki küçük kaymalar
+    rebuild_related_products komutuyla düzeltilir.
+    """
+    k = related_count()
+    product = Product.objects.filter(pk=product_id, status='active').only('category').first()
+    holders = Product.objects.filter(
+        pk__in=holder_ids if holder_ids is not None else RelatedProduct.objects.filter(
+            related_id=product_id
+        ).values('product_id')
+    ).exclude(pk=product_id).values_list('pk', 'category_id')
+
+    by_category = {}
+    for holder_id, category_id in holders:
+        by_category.setdefault(category_id, set()).add(holder_id)
+    if product is not None:
+        by_category.setdefault(product.category_id, set())
+
+    lists = {product_id: []}
+    for category_id, category_holders in by_category.items():
+        index = CategoryVectors(category_id)
+        for holder_id in category_holders:
+            lists[holder_id] = index.neighbours(holder_id, k) if holder_id in index else []
+        if product is None or product.category_id != category_id:
+            continue
+
+        scores = index.scores(product_id)
+        lists[product_id] = _ranked(scores.items(), k)
+        current = defaultdict(list)
+        rows = RelatedProduct.objects.filter(product__category_id=category_id).exclude(product_id__in=lists)
+        for holder_id, related_id, score in rows.values_list('product_id', 'related_id', 'score'):
+            current[holder_id].append((related_id, score))
+        for other_id, score in scores.items():
+            if other_id in lists:
+                continue
+            ranked = _ranked(current[other_id] + [(product_id, score)], k)
+            if any(related_id == product_id for related_id, _ in ranked):
+                lists[other_id] = ranked
+
+    links = [
+        RelatedProduct(product_id=owner_id, related_id=related_id, score=score, rank=rank)
+        for owner_id, neighbours in lists.items()
+        for rank, (related_id, score) in enumerate(neighbours)
+    ]
+    with transaction.atomic():
+        RelatedProduct.objects.filter(product_id__in=lists).delete()
+        RelatedProduct.objects.bulk_create(links, batch_size=1000)
+    return len(links)
+
+
+def similarity_changed(product):
+    """Ürünün benzerliği etkileyen alanları yüklendiğinden (bkz. Product.from_db) beri değişti mi"""
+    loaded = getattr(product, '_loaded_values', None)
+    if loaded is None:
+        return True
+    for field in SIMILARITY_FIELDS:
+        # Ertelenmiş ve atanmamış alan değişmemiştir
+        if field not in product.__dict__:
+            continue
+        if field not in loaded or loaded[field] != product.__dict__[field]:
+            return True
+    return False
@@ -0,0 +1,73 @@
+import hashlib
+import os
+import posixpath
+import re
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+# İçerik adresli dosya yolu: <upload_to>/<özetin ilk 2 hanesi>/<sha256>.<uzantı>;
+# türevler orijinalin yanında <sha256>-w<genişlik>.<uzantı> olarak durur
+HASHED_PATH_PATTERN = r'(?:[\w-]+/)+[0-9a-f]{2}/[0-9a-f]{64}(?:-w\d+)?(?:\.\w+)?'
+HASHED_PATH_RE = re.compile(rf'^{HASHED_PATH_PATTERN}$')
+
+# Adı içerikle değişen dosyalar süresiz önbelleklenebilir
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+EXTENSION_ALIASES = {'.jpeg': '.jpg', '.jpe': '.jpg', '.tif': '.tiff'}
+
+
+def file_digest(content):
+    """Dosyanın SHA-256 özeti; okuma konumu başa alınır"""
+    digest = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Dosyaları içeriklerinin SHA-256 özetiyle adlandıran depolama.
+
+    Aynı içerik ikinci kez kaydedildiğinde dosya yeniden yazılmaz, mevcut ad
+    döndürülür; böylece aynı resmi kullanan ürünler tek dosyayı paylaşır ve
+    URL'ler içerik değişmedikçe sabit kalır. Dosyalar paylaşıldığı için
+    model silinirken dosya silinmemelidir.
+    """
+
+    def __init__(self, **kwargs):
+        # Aynı ada yazılan her şey aynı içeriktir; eşzamanlı yazmalarda üzerine yazmak güvenlidir
+        kwargs.setdefault('allow_overwrite', True)
+        super().__init__(**kwargs)
+
+    def hashed_name(self, name, content):
+        directory = posixpath.dirname(name.replace('\\', '/'))
+        extension = os.path.splitext(name)[1].lower()
+        extension = EXTENSION_ALIASES.get(extension, extension)
+        digest = file_digest(content)
+        return posixpath.join(directory, digest[:2], f'{digest}{extension}')
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        name = self.hashed_name(name, content)
+        if self.exists(name):
+            return name
+        return super().save(name, content, max_length=max_length)
+
+    @staticmethod
+    def is_hashed(name):
+        return bool(name and HASHED_PATH_RE.match(name))
+
+
+content_storage = ContentAddressedStorage()
+
+# Türev adları orijinalden türetildiği için aynı ada yeniden yazmak aynı içeriği üretir
+derivative_storage = FileSystemStorage(allow_overwrite=True)
@@ -0,0 +1,169 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from .cache import bump_version, changes_since, get_version, record_changes
+from .models import Category, Product, SubCategory, tr_normalize
+
+# Aynı önekle eşleşen sonuçlarda kategoriler ürünlerden önce gelir
+KIND_PRIORITY = {'category': 0, 'subcategory': 1, 'product': 2}
+
+SUGGESTION_CACHE_NAMESPACE = 'suggestions'
+
+
+def _normalize(text):
+    return ' '.join(tr_normalize(text).split())
+
+
+def _terms(normalized):
+    # Her kelimeden başlayan sonekler indekslenir: "samsung galaxy a55" "galaxy" ile de bulunur
+    words = normalized.split(' ')
+    return {' '.join(words[index:]) for index in range(len(words)) if words[index]}
+
+
+def _primary_image_url(product):
+    primary = product.primary_image if product.primary_image_id else None
+    return primary.image.url if primary and primary.image else None
+
+
+def _rows(kind, **filters):
+    """Türün indekslenecek kayıtları: (pk, ad, slug, küçük resim)"""
+    if kind == 'category':
+        for category in Category.objects.filter(**filters).only('name', 'slug'):
+            yield category.pk, category.name, category.slug, None
+    elif kind == 'subcategory':
+        for subcategory in SubCategory.objects.filter(**filters).only('name', 'slug', 'image'):
+            yield subcategory.pk, subcategory.name, subcategory.slug, subcategory.image.url if subcategory.image else None
+    else:
+        products = Product.objects.filter(status='active', **filters).select_related('primary_image').only(
+            'name', 'slug', 'primary_image', 'primary_image__image'
+        )
+        for product in products.iterator(chunk_size=1000):
+            yield product.pk, product.name, product.slug, _primary_image_url(product)
+
+
+def suggestions_changed(kind, pks):
+    """Kayıtlar değiştiğinde çağrılır; her süreçteki indeks bu kayıtları bir sonraki aramada yeniden okur"""
+    record_changes(SUGGESTION_CACHE_NAMESPACE, [(kind, pk) for pk in pks])
+
+
+class SuggestionIndex:
+    """
+    Ürün, alt kategori ve kategori adları üzerinde süreç içi önek indeksi.
+
+    Her tür için terimler ayrı sıralı listede tutulur ve bisect ile aranır;
+    böylece çok sayıda ürün eşleşmesi kategori eşleşmelerini dışarıda
+    bırakamaz. Kayıtlar normalize edilmiş adlarıyla saklanır, aramada yeniden
+    normalize edilmez. İndeks ilk kullanımda bir kez kurulur; sürüm arttığında
+    yalnızca aradaki sürümlerde değişen kayıtlar veritabanından yeniden okunur,
+    böylece başka süreçte yapılan değişiklikler de görünür.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._version = None
+        self._keys = self._empty_keys()
+        # (tür, pk) -> (normalize edilmiş ad, öneri)
+        self._entries = {}
+
+    @staticmethod
+    def _empty_keys():
+        return {kind: [] for kind in KIND_PRIORITY}
+
+    def _sync(self):
+        version = get_version(SUGGESTION_CACHE_NAMESPACE)
+        if version == self._version:
+            return
+        with self._lock:
+            if version == self._version:
+                return
+            changed = changes_since(SUGGESTION_CACHE_NAMESPACE, self._version, version)
+            if changed is None:
+                self._build()
+            else:
+                self._reload(changed)
+            self._version = version
+
+    def _build(self):
+        self._keys = self._empty_keys()
+        self._entries = {}
+        for kind in KIND_PRIORITY:
+            for row in _rows(kind):
+                self._add(kind, *row, sort=False)
+        # Terimler tek tek insort ile eklenseydi kurulum karesel olurdu; listeler bir kez sıralanır
+        for keys in self._keys.values():
+            keys.sort()
+
+    def _reload(self, changed):
+        by_kind = defaultdict(set)
+        for kind, pk in changed:
+            by_kind[kind].add(pk)
+        for kind, pks in by_kind.items():
+            for pk in pks:
+                self._remove(kind, pk)
+            # Silinen ya da pasife alınan kayıtlar sorgudan dönmez, indekste de kalmaz
+            for row in _rows(kind, pk__in=pks):
+                self._add(kind, *row)
+
+    def _add(self, kind, pk, name, slug, thumbnail, sort=True):
+        normalized = _normalize(name)
+        self._entries[(kind, pk)] = (normalized, {'type': kind, 'name': name, 'slug': slug, 'thumbnail': thumbnail})
+        keys = self._keys[kind]
+        for term in _terms(normalized):
+            if sort:
+                insort(keys, (term, pk))
+            else:
+                keys.append((term, pk))
+
+    def _remove(self, kind, pk):
+        entry = self._entries.pop((kind, pk), None)
+        if entry is None:
+            return
+        keys = self._keys[kind]
+        for term in _terms(entry[0]):
+            index = bisect_left(keys, (term, pk))
+            if index < len(keys) and keys[index] == (term, pk):
+                del keys[index]
+
+    def _matches(self, kind, query):
+        """Türün önekle eşleşen tüm kayıtları: {pk: (adı önekle başlamıyor mu, ad uzunluğu)}"""
+        keys = self._keys[kind]
+        index = bisect_left(keys, (query,))
+        matches = {}
+        while index < len(keys) and keys[index][0].startswith(query):
+            pk = keys[index][1]
+            if pk not in matches:
+                normalized, entry = self._entries[(kind, pk)]
+                # Adın tamamı önekle başlıyorsa daha üstte gösterilir
+                matches[pk] = (not normalized.startswith(query), len(entry['name']))
+            index += 1
+        return matches
+
+    def suggest(self, query, limit=8):
+        query = _normalize(query)
+        if not query:
+            return []
+        self._sync()
+
+        results = []
+        with self._lock:
+            for kind in sorted(KIND_PRIORITY, key=KIND_PRIORITY.get):
+                if len(results) >= limit:
+                    break
+                matches = self._matches(kind, query)
+                for pk in heapq.nsmallest(limit - len(results), matches, key=lambda pk: (*matches[pk], pk)):
+                    results.append(dict(self._entries[(kind, pk)][1]))
+        return results
+
+    def reset(self):
+        """Tüm süreçlerdeki indeksin bir sonraki aramada baştan kurulmasını sağlar (ör. toplu içe aktarmadan sonra)"""
+        # Değişiklik kaydı yazılmadan artan sürüm, diğer süreçlerde de baştan kurulum demektir
+        bump_version(SUGGESTION_CACHE_NAMESPACE)
+        with self._lock:
+            self._version = None
+            self._keys = self._empty_keys()
+            self._entries = {}
+
+
+suggestion_index = SuggestionIndex()
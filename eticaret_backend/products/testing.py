@@ -0,0 +1,131 @@
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from .models import Category, SubCategory, Product, ProductImage, ProductVariant, Review
+
+User = get_user_model()
+
+
+class QueryBudgetMixin:
+    """
+    API uç noktalarının sorgu sayısını sabit bir üst sınırla denetleyen test yardımcısı.
+
+    `assertQueryBudget` isteği iki kez çalıştırır: mevcut verilerle ve `grow`
+    ile veri büyütüldükten sonra. Sorgu sayısı sonuç boyutuyla artıyorsa
+    (N+1) ya da bütçeyi aşıyorsa test başarısız olur.
+    """
+
+    def assertQueryBudget(self, budget, path, grow=None, client=None, method='get', **kwargs):
+        client = client or self.client
+        baseline = self._count_queries(client, method, path, **kwargs)
+        if grow is not None:
+            grow()
+            grown = self._count_queries(client, method, path, **kwargs)
+            self.assertEqual(
+                baseline, grown,
+                f'{path} sorgu sayısı veriyle birlikte artıyor: {baseline} -> {grown}\n'
+                + '\n'.join(self._last_queries)
+            )
+        self.assertLessEqual(
+            baseline, budget,
+            f'{path} {baseline} sorgu çalıştırdı, bütçe {budget}\n' + '\n'.join(self._last_queries)
+        )
+        return baseline
+
+    def _count_queries(self, client, method, path, **kwargs):
+        # Önbellekten dönen yanıt bütçeyi ölçmez; her istek soğuk önbellekle çalıştırılır
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(client, method)(path, **kwargs)
+        self.assertLess(response.status_code, 400, f'{path} -> {response.status_code}')
+        self._last_queries = [query['sql'] for query in context.captured_queries]
+        return len(context.captured_queries)
+
+
+class CatalogFactory:
+    """Testler için kategori, ürün, resim, varyant ve yorum üretir"""
+
+    def __init__(self):
+        self.counter = 0
+        self.category = Category.objects.create(name='Elektronik')
+        self.subcategory = SubCategory.objects.create(category=self.category, name='Laptop')
+
+    def user(self):
+        self.counter += 1
+        return User.objects.create(email=f'kullanici{self.counter}@example.com')
+
+    def product(self, reviews=2, variants=2, images=2, **kwargs):
+        self.counter += 1
+        defaults = {
+            'category': self.category,
+            'subcategory': self.subcategory,
+            'name': f'Ürün {self.counter}',
+            'description': '<p>Açıklama</p>',
+            'price': 1000,
+            'stock': 10,
+            'specs': {'RAM': '16 GB'},
+        }
+        defaults.update(kwargs)
+        product = Product.objects.create(**defaults)
+        for index in range(images):
+            ProductImage.objects.create(
+                product=product,
+                image=f'products/{product.slug}-{index}.jpg',
+                is_primary=index == 0,
+                order=index
+            )
+        for index in range(variants):
+            ProductVariant.objects.create(
+                product=product,
+                variant_type='color' if index % 2 else 'storage',
+                name=f'Seçenek {index}',
+                stock=5
+            )
+        for index in range(reviews):
+            Review.objects.create(
+                product=product,
+                user=self.user(),
+                rating=4,
+                comment='Güzel',
+                is_approved=True
+            )
+        return product
+
+    def products(self, count, **kwargs):
+        return [self.product(**kwargs) for _ in range(count)]
+
+
+class _FixtureRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        self.server.requests.append((self.command, self.path))
+
+
+class FixtureServer:
+    """Kaydedilmiş HTML sayfalarını ve resimleri yerel bir HTTP sunucusundan sunar"""
+
+    def __init__(self, directory):
+        self.directory = str(directory)
+
+    def __enter__(self):
+        handler = partial(_FixtureRequestHandler, directory=self.directory)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.server.requests = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.server.server_address
+        self.url = f'http://{host}:{port}/'
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    @property
+    def requests(self):
+        return self.server.requests
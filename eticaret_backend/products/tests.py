@@ -1,3 +1,1223 @@
-from django.test import TestCase
-
-# Create your tests here.
+import importlib
+import os
+import shutil
+import tempfile
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import TestCase, override_settings
+from PIL import Image
+from .extractors import available_extractors, get_extractor
+from .models import (
+    Category, ImageDerivative, Product, ProductAttribute, ProductImage, ProductRatingSummary, ProductSalesSummary,
+    RelatedProduct, Review, Slider, SubCategory
+)
+from . import pricing
+from .cache import get_version
+from .derivatives import derivative_index, derivatives_changed
+from .facets import FACET_CACHE_NAMESPACE
+from .importing import CatalogImporter, CatalogSync
+from .pagination import EstimatedCountPaginator, ProductCursorPagination
+from .similarity import refresh_related
+from .suggest import SuggestionIndex, _normalize, suggestion_index
+from .testing import CatalogFactory, FixtureServer, QueryBudgetMixin
+
+VATAN_FIXTURES = Path(__file__).resolve().parent / 'fixtures' / 'vatan'
+
+
+class ProductQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """Ürün uç noktalarının sorgu sayısı sonuç boyutundan bağımsız olmalı"""
+
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.catalog.products(3)
+
+    def grow(self):
+        self.catalog.products(10)
+
+    def test_product_list(self):
+        self.assertQueryBudget(2, '/api/products/', grow=self.grow)
+
+    def test_product_list_expanded(self):
+        # +1: resim türevleri eşlemesi (önbellek temizlendiği için) bir kez yüklenir
+        self.assertQueryBudget(
+            6, '/api/products/?expand=images,variants,variant_types,reviews,description', grow=self.grow
+        )
+
+    def test_product_list_page(self):
+        self.assertQueryBudget(2, '/api/products/?page_size=5', grow=self.grow)
+
+    def test_product_detail(self):
+        product = self.catalog.product()
+        self.assertQueryBudget(9, f'/api/products/{product.slug}/', grow=self.grow)
+
+    def test_category_list(self):
+        self.assertQueryBudget(2, '/api/categories/', grow=self.grow)
+
+    def test_admin_product_changelist(self):
+        admin = get_user_model().objects.create_superuser(email='admin@example.com', password='parola')
+        self.client.force_login(admin)
+        self.assertQueryBudget(8, '/admin/products/product/', grow=self.grow)
+        # Arama açıklamada icontains yerine arama indeksinden yapılır
+        self.assertQueryBudget(8, '/admin/products/product/?q=urun', grow=self.grow)
+
+    def test_admin_review_changelist(self):
+        admin = get_user_model().objects.create_superuser(email='admin@example.com', password='parola')
+        self.client.force_login(admin)
+        self.assertQueryBudget(5, '/admin/products/review/?is_approved__exact=1', grow=self.grow)
+
+
+class ProductCursorPaginationTests(TestCase):
+    def setUp(self):
+        catalog = CatalogFactory()
+        products = catalog.products(7, images=0, variants=0, reviews=0)
+        # Sıralama anahtarları çakışan ürünler: aynı fiyat ve aynı oluşturulma zamanı
+        Product.objects.filter(pk__in=[product.pk for product in products[:4]]).update(
+            price=500, created_at=products[0].created_at
+        )
+        for index, product in enumerate(products[4:]):
+            Product.objects.filter(pk=product.pk).update(price=700 + index * 100, name=f'A Ürün {index}')
+
+    def walk(self, query, page_size=3):
+        """İleri sonra geri gezinip (ileri, geri) sıralarını döndürür"""
+        url = f'/api/products/?page_size={page_size}&{query}'
+        forward, pages = [], []
+        while url:
+            data = self.client.get(url).json()
+            pages.append(data)
+            forward += [item['slug'] for item in data['results']]
+            url = data['next']
+        self.assertIsNone(pages[0]['previous'])
+
+        backward = []
+        url = pages[-1]['previous']
+        while url:
+            data = self.client.get(url).json()
+            backward = [item['slug'] for item in data['results']] + backward
+            url = data['previous']
+        return forward, backward + [item['slug'] for item in pages[-1]['results']]
+
+    def test_every_ordering_matches_unpaginated_list(self):
+        for ordering in ProductCursorPagination.orderings:
+            query = f'ordering={ordering}' + ('&search=urun' if ordering == 'relevance' else '')
+            with self.subTest(ordering=ordering):
+                expected = [item['slug'] for item in self.client.get(f'/api/products/?{query}').json()]
+                forward, backward = self.walk(query)
+                self.assertEqual(len(expected), 7)
+                self.assertEqual(forward, expected)
+                self.assertEqual(backward, expected)
+
+    def test_ties_are_broken_by_id(self):
+        forward, _ = self.walk('ordering=price', page_size=2)
+        rows = list(Product.objects.order_by('price', 'id').values_list('slug', flat=True))
+        self.assertEqual(forward, rows)
+
+    def test_tampered_cursor(self):
+        data = self.client.get('/api/products/?page_size=2&ordering=price').json()
+        cursor = parse_qs(urlsplit(data['next']).query)['cursor'][0]
+        for bad in [cursor[:-3] + 'xyz', 'bm90LWpzb24', cursor + '!!']:
+            with self.subTest(cursor=bad):
+                response = self.client.get(f'/api/products/?ordering=price&cursor={bad}')
+                self.assertEqual(response.status_code, 404)
+        # Geçerli JSON ama alan tipine uymayan değer
+        forged = ProductCursorPagination().encode_cursor({'o': 'price', 'v': ['500.00', 'abc'], 'r': 0})
+        self.assertEqual(self.client.get(f'/api/products/?ordering=price&cursor={forged}').status_code, 404)
+        # Başka bir sıralama için üretilmiş cursor kabul edilmez
+        self.assertEqual(self.client.get(f'/api/products/?ordering=name&cursor={cursor}').status_code, 404)
+
+
+class RatingSummaryTests(TestCase):
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.product = self.catalog.product(images=0, variants=0, reviews=0)
+        self.review = Review.objects.create(product=self.product, user=self.catalog.user(), rating=2, comment='Fena değil')
+
+    def summary(self):
+        summary = ProductRatingSummary.objects.filter(product=self.product).first()
+        return (summary.review_count, summary.average_rating, summary.histogram[2], summary.histogram[5]) if summary else None
+
+    def test_follows_approval_edit_and_delete(self):
+        # Onaysız yorum özete girmez
+        self.assertIn(self.summary(), [None, (0, None, 0, 0)])
+        self.review.is_approved = True
+        self.review.save()
+        self.assertEqual(self.summary(), (1, 2.0, 1, 0))
+
+        Review.objects.create(product=self.product, user=self.catalog.user(), rating=5, comment='Harika', is_approved=True)
+        self.assertEqual(self.summary(), (2, 3.5, 1, 1))
+
+        self.review.rating = 5
+        self.review.save()
+        self.assertEqual(self.summary(), (2, 5.0, 0, 2))
+
+        self.review.is_approved = False
+        self.review.save()
+        self.assertEqual(self.summary(), (1, 5.0, 0, 1))
+
+        Review.objects.filter(product=self.product, is_approved=True).get().delete()
+        self.assertEqual(self.summary(), (0, None, 0, 0))
+
+    def test_admin_approval_action(self):
+        admin = get_user_model().objects.create_superuser(email='admin@example.com', password='parola')
+        self.client.force_login(admin)
+        self.client.post('/admin/products/review/', {
+            'action': 'approve_reviews', '_selected_action': [self.review.pk], 'index': 0,
+        })
+        self.assertEqual(self.summary(), (1, 2.0, 1, 0))
+
+    def test_cascade_delete_skips_rewrite(self):
+        with mock.patch.object(ProductRatingSummary, 'refresh') as refresh:
+            self.product.delete()
+        refresh.assert_not_called()
+        self.assertFalse(ProductRatingSummary.objects.exists())
+
+
+class SparseFieldsetTests(TestCase):
+    def setUp(self):
+        self.products = CatalogFactory().products(3)
+
+    def get(self, query):
+        with CaptureQueriesContext(connection) as context:
+            data = self.client.get(f'/api/products/?{query}').json()
+        return data, [query['sql'] for query in context.captured_queries]
+
+    def test_output_shape(self):
+        data, _ = self.get('fields=id,name')
+        self.assertEqual([set(item) for item in data], [{'id', 'name'}] * 3)
+        # Bilinmeyen alan adları yok sayılır
+        data, _ = self.get('fields=name,bogus')
+        self.assertEqual(set(data[0]), {'name'})
+
+        data, _ = self.get('')
+        self.assertNotIn('images', data[0])
+        self.assertNotIn('description', data[0])
+        data, _ = self.get('expand=images,description,bogus')
+        self.assertEqual(len(data[0]['images']), 2)
+        self.assertIn('description', data[0])
+        # fields içinde açıkça istenen genişletilebilir alan da döner
+        data, _ = self.get('fields=slug,variants')
+        self.assertEqual(set(data[0]), {'slug', 'variants'})
+
+    def test_unrequested_columns_and_relations_are_not_loaded(self):
+        _, narrow = self.get('fields=id,name')
+        _, wide = self.get('expand=images,variants,reviews,description,specs')
+
+        def product_query(queries):
+            return next(sql for sql in queries if sql.startswith('SELECT "products_product"."id"'))
+        self.assertNotIn('"products_product"."description"', product_query(narrow))
+        self.assertIn('"products_product"."description"', product_query(wide))
+        self.assertFalse(any(sql.startswith('SELECT "products_productimage"') for sql in narrow))
+        self.assertTrue(any(sql.startswith('SELECT "products_productimage"') for sql in wide))
+        self.assertLess(len(narrow), len(wide))
+
+    def test_detail_fields(self):
+        url = f'/api/products/{self.products[0].slug}/'
+        with CaptureQueriesContext(connection) as context:
+            data = self.client.get(f'{url}?fields=name,price').json()
+        self.assertEqual(set(data), {'name', 'price'})
+        queries = [query['sql'] for query in context.captured_queries]
+        # Benzer ürünler, resimler, varyantlar, yorumlar ve kategori ilişkileri yüklenmez
+        self.assertFalse(any(sql.startswith(('SELECT "products_productimage"', 'SELECT "products_productvariant"',
+                                             'SELECT "products_review"', 'SELECT "products_subcategory"'))
+                             for sql in queries))
+        self.assertFalse(any('"products_relatedproduct"."product_id" =' in sql for sql in queries))
+        self.assertNotIn('"products_category"', next(sql for sql in queries if sql.startswith('SELECT "products_product"."id"')))
+
+        data = self.client.get(url).json()
+        self.assertIn('related_products', data)
+        self.assertEqual(len(data['category']['subcategories']), 1)
+
+
+class SearchIndexTests(TestCase):
+    def setUp(self):
+        self.catalog = CatalogFactory()
+
+    def search(self, query):
+        return [item['name'] for item in self.client.get(f'/api/products/?search={query}&ordering=relevance').json()]
+
+    def test_turkish_folding(self):
+        self.catalog.product(name='Işıklı Çanta Şarjı', images=0, variants=0, reviews=0)
+        for query in ['isikli', 'IŞIKLI', 'ışıklı', 'CANTA', 'sarj', 'Şarjı']:
+            self.assertEqual(self.search(query), ['Işıklı Çanta Şarjı'], query)
+
+    def test_name_matches_rank_first(self):
+        self.catalog.product(name='Çanta', description='<p>Oyuncu laptop için</p>', images=0, variants=0, reviews=0)
+        self.catalog.product(name='Oyuncu Laptop', images=0, variants=0, reviews=0)
+        self.assertEqual(self.search('oyuncu laptop'), ['Oyuncu Laptop', 'Çanta'])
+
+    def test_index_follows_save_and_delete(self):
+        product = self.catalog.product(name='Kulaklık', images=0, variants=0, reviews=0)
+        product.name = 'Hoparlör'
+        product.save()
+        self.assertEqual(self.search('kulaklik'), [])
+        self.assertEqual(self.search('hoparlor'), ['Hoparlör'])
+        product.delete()
+        self.assertEqual(self.search('hoparlor'), [])
+
+    def test_migration_populates_existing_products(self):
+        self.catalog.product(name='Monitör', specs={'Ekran Boyutu': '27"'}, images=0, variants=0, reviews=0)
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM products_product_fts')
+        ProductAttribute.objects.all().delete()
+        self.assertEqual(self.search('monitor'), [])
+
+        migration = importlib.import_module('products.migrations.0019_populate_search_and_attributes')
+        schema_editor = SimpleNamespace(connection=connection)
+        migration.populate_search_index(apps, schema_editor)
+        migration.populate_attributes(apps, schema_editor)
+        self.assertEqual(self.search('monitor'), ['Monitör'])
+        self.assertEqual(list(ProductAttribute.objects.values_list('key', 'numeric_value')), [('ekran', 27.0)])
+
+
+class FacetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.catalog = CatalogFactory()
+        self.phones = Category.objects.create(name='Telefon')
+        self.phone_sub = self.phones.subcategories.create(name='Akıllı Telefon')
+        self.catalog.product(price=500, specs={'RAM': '8 GB'}, images=0, variants=0, reviews=0)
+        self.catalog.product(price=3000, discounted_price=2500, specs={'ram': '16gb'}, images=0, variants=0, reviews=0)
+        self.catalog.product(
+            category=self.phones, subcategory=self.phone_sub, price=20000, specs={'Bellek': '8GB'},
+            images=0, variants=0, reviews=0
+        )
+
+    def facets(self, query=''):
+        return self.client.get(f'/api/products/facets/?{query}').json()
+
+    def test_counts(self):
+        data = self.facets()
+        self.assertEqual(data['total'], 3)
+        self.assertEqual({item['slug']: item['count'] for item in data['categories']}, {'elektronik': 2, 'telefon': 1})
+        self.assertEqual([(item['min'], item['count']) for item in data['price_ranges']], [(0, 1), (1000, 1), (10000, 1)])
+        self.assertEqual(data['on_sale'], {'true': 1, 'false': 2})
+        # Farklı yazılmış anahtar ve değerler tek facet değerinde birleşir
+        self.assertEqual({item['value']: item['count'] for item in data['specs']['ram']['values']}, {'8 GB': 2, '16gb': 1})
+
+    def test_counts_follow_filters(self):
+        data = self.facets('category=elektronik')
+        self.assertEqual(data['total'], 2)
+        self.assertEqual([item['slug'] for item in data['categories']], ['elektronik'])
+        self.assertEqual(self.facets('on_sale=true')['total'], 1)
+        self.assertEqual(self.facets('max_price=5000')['on_sale'], {'true': 1, 'false': 1})
+        data = self.facets('spec.ram=8')
+        self.assertEqual(data['total'], 2)
+        self.assertEqual({item['slug'] for item in data['categories']}, {'elektronik', 'telefon'})
+        # Sayımı etkilemeyen parametreler aynı önbellek kaydını kullanır
+        self.assertEqual(self.facets('category=elektronik&ordering=-price&page_size=1')['total'], 2)
+
+    def test_product_save_invalidates(self):
+        self.assertEqual(self.facets()['total'], 3)
+        # update() sinyal tetiklemez; önbellekteki sayım döner
+        Product.objects.filter(category=self.phones).update(is_on_sale=True)
+        self.assertEqual(self.facets()['on_sale'], {'true': 1, 'false': 2})
+
+        version = get_version(FACET_CACHE_NAMESPACE)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.catalog.product(price=700, images=0, variants=0, reviews=0)
+            # Sürüm commit'ten önce artmaz; eş zamanlı istek eski veriyi yeni sürümle önbelleğe yazamaz
+            self.assertEqual(get_version(FACET_CACHE_NAMESPACE), version)
+        self.assertNotEqual(get_version(FACET_CACHE_NAMESPACE), version)
+        data = self.facets()
+        self.assertEqual(data['total'], 4)
+        self.assertEqual(data['on_sale'], {'true': 2, 'false': 2})
+
+        version = get_version(FACET_CACHE_NAMESPACE)
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.get(price=700).delete()
+        self.assertNotEqual(get_version(FACET_CACHE_NAMESPACE), version)
+        self.assertEqual(self.facets()['total'], 3)
+
+
+class SpecFilterTests(TestCase):
+    def setUp(self):
+        catalog = CatalogFactory()
+        for name, specs in [
+            ('A', {'RAM': '8 GB', 'Depolama': '512 GB SSD', 'İşlemci': 'Intel Core i5'}),
+            ('B', {'ram': '16gb', 'SSD Kapasitesi': '1 TB', 'işlemci': 'INTEL CORE İ7'}),
+            ('C', {'Bellek': '32 GB', 'Ekran Boyutu': '15.6" 165Hz', 'Renk': '9'}),
+        ]:
+            catalog.product(name=name, specs=specs, images=0, variants=0, reviews=0)
+
+    def names(self, query):
+        response = self.client.get(f'/api/products/?{query}&ordering=name')
+        self.assertEqual(response.status_code, 200, response.content)
+        return [item['name'] for item in response.json()]
+
+    def test_operators(self):
+        self.assertEqual(self.names('spec.ram=16'), ['B'])
+        self.assertEqual(self.names('spec.ram__exact=16'), ['B'])
+        self.assertEqual(self.names('spec.ram__gt=8'), ['B', 'C'])
+        self.assertEqual(self.names('spec.ram__gte=8'), ['A', 'B', 'C'])
+        self.assertEqual(self.names('spec.ram__lt=16'), ['A'])
+        self.assertEqual(self.names('spec.ram__lte=16'), ['A', 'B'])
+        self.assertEqual(self.names('spec.ram__in=8,32'), ['A', 'C'])
+        # Ayrı parametreler ve aynı parametrenin tekrarı birlikte uygulanır
+        self.assertEqual(self.names('spec.ram__gte=8&spec.ram__lte=16&spec.depolama__gte=1000'), ['B'])
+        self.assertEqual(self.names('spec.ram__gt=8&spec.ram__gt=16'), ['C'])
+
+    def test_numeric_and_text_comparison(self):
+        # Birimler ortak birime çevrilir: 1 TB = 1024 GB
+        self.assertEqual(self.names('spec.depolama__gt=512'), ['B'])
+        self.assertEqual(self.names('spec.depolama=1024'), ['B'])
+        self.assertEqual(self.names('spec.ekran__gte=15'), ['C'])
+        self.assertEqual(self.names('spec.yenileme_hizi__gte=144'), ['C'])
+        # Sayısal olmayan değerler Türkçe karakterler ve büyük/küçük harften bağımsız karşılaştırılır
+        self.assertEqual(self.names('spec.islemci=intel core i5'), ['A'])
+        self.assertEqual(self.names('spec.İşlemci=Intel Core İ7'), ['B'])
+        self.assertEqual(self.names('spec.islemci__in=intel core i5,intel core i7'), ['A', 'B'])
+        # Metin değeri sayısal karşılaştırmaya girmez
+        self.assertEqual(self.names('spec.islemci__gte=0'), [])
+        self.assertEqual(self.names('spec.renk__gt=5'), ['C'])
+
+    def test_malformed_filters_are_rejected(self):
+        for query in ['spec.ram__gte=cok', 'spec.ram__foo=8', 'spec.ram__gte__lt=8', 'spec.=8', 'spec.ram__=8']:
+            response = self.client.get(f'/api/products/?{query}')
+            self.assertEqual(response.status_code, 400, query)
+            self.assertIn(query.split('=')[0], response.json())
+        self.assertEqual(self.client.get('/api/products/facets/?spec.ram__foo=8').status_code, 400)
+
+
+class SuggestionIndexTests(TestCase):
+    def setUp(self):
+        suggestion_index.reset()
+        self.addCleanup(suggestion_index.reset)
+        self.catalog = CatalogFactory()
+
+    def product(self, name, **kwargs):
+        return self.catalog.product(name=name, images=0, variants=0, reviews=0, **kwargs)
+
+    def names(self, query, limit=8):
+        return [(item['type'], item['name']) for item in suggestion_index.suggest(query, limit)]
+
+    def test_build_sorts_once(self):
+        for index in range(20):
+            self.product(f'Kablo {20 - index}')
+        with mock.patch('products.suggest.insort') as insort:
+            self.assertEqual(len(self.names('kablo', 50)), 20)
+        insort.assert_not_called()
+        for keys in suggestion_index._keys.values():
+            self.assertEqual(keys, sorted(keys))
+
+    def test_categories_are_not_crowded_out(self):
+        # Sözlük sırasında kategoriden önce gelen çok sayıda ürün terimi olsa da kategori ilk sırada kalır
+        for index in range(40):
+            self.product(f'Laa {index}')
+        Category.objects.create(name='Lamba')
+        self.assertEqual(self.names('la', 3), [('category', 'Lamba'), ('subcategory', 'Laptop'), ('product', 'Laa 0')])
+
+    def test_ranking(self):
+        self.product('Samsung Galaxy')
+        self.product('Galaxy Kılıfı Deri Siyah')
+        self.product('Galaxy Şarj')
+        self.product('Pasif Ürün Galaxy', status='inactive')
+        # Adı önekle başlayanlar önce, kendi içlerinde kısa adlar önce; pasif ürünler önerilmez
+        self.assertEqual([name for _, name in self.names('GALAXY')], ['Galaxy Şarj', 'Galaxy Kılıfı Deri Siyah', 'Samsung Galaxy'])
+        self.assertEqual(self.names('sarj'), [('product', 'Galaxy Şarj')])
+        self.assertEqual(self.names('galaxy s'), [('product', 'Galaxy Şarj')])
+
+    def test_follows_saves_and_deletes(self):
+        product = self.product('Kulaklık')
+        self.assertEqual(self.names('kulak'), [('product', 'Kulaklık')])
+        with self.captureOnCommitCallbacks(execute=True):
+            product.name = 'Hoparlör'
+            product.save()
+        self.assertEqual(self.names('kulak'), [])
+        self.assertEqual(self.names('hopar'), [('product', 'Hoparlör')])
+        with self.captureOnCommitCallbacks(execute=True):
+            product.status = 'inactive'
+            product.save()
+        self.assertEqual(self.names('hopar'), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.catalog.category.name = 'Bilgisayar'
+            self.catalog.category.save()
+        self.assertEqual(self.names('bilgi'), [('category', 'Bilgisayar')])
+        other = self.product('Kulaklık')
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+            self.catalog.subcategory.delete()
+        self.assertEqual(self.names('kulak'), [])
+        self.assertEqual(self.names('lapt'), [])
+
+    def test_query_does_not_normalize_entries(self):
+        for index in range(20):
+            self.product(f'Kablo {index}')
+        self.names('k')
+        with mock.patch('products.suggest._normalize', wraps=_normalize) as normalize:
+            self.assertEqual(len(self.names('k', 50)), 20)
+        # Yalnızca sorgu normalize edilir; kayıtların normalize adları indekste saklıdır
+        normalize.assert_called_once_with('k')
+
+    def test_other_processes_reload_only_changed_entries(self):
+        # Başka bir süreçteki kopya: sinyaller yalnızca kaydı yapan süreçte çalışır
+        other = SuggestionIndex()
+        product = self.product('Kulaklık')
+        self.assertEqual([item['name'] for item in other.suggest('kulak')], ['Kulaklık'])
+        with self.captureOnCommitCallbacks(execute=True):
+            product.name = 'Hoparlör'
+            product.save()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual([item['name'] for item in other.suggest('hopar')], ['Hoparlör'])
+        self.assertEqual(len(queries), 1)
+        self.assertIn(f'IN ({product.pk})', queries[0]['sql'])
+        self.assertEqual(other.suggest('kulak'), [])
+
+        # Toplu içe aktarma sonrası sıfırlama diğer kopyaları baştan kurar
+        Product.objects.filter(pk=product.pk).update(name='Mikrofon')
+        suggestion_index.reset()
+        self.assertEqual([item['name'] for item in other.suggest('mikro')], ['Mikrofon'])
+
+    def test_endpoint(self):
+        product = self.product('Laptop Çantası')
+        ProductImage.objects.create(product=product, image='products/canta.jpg', is_primary=True)
+        data = self.client.get('/api/products/suggest/?q=LAPTOP').json()
+        self.assertEqual([(item['type'], item['name']) for item in data], [('subcategory', 'Laptop'), ('product', 'Laptop Çantası')])
+        self.assertEqual(data[1]['slug'], product.slug)
+        self.assertTrue(data[1]['thumbnail'].startswith('http://testserver/'))
+        self.assertEqual(len(self.client.get('/api/products/suggest/?q=laptop&limit=1').json()), 1)
+        self.assertEqual(len(self.client.get('/api/products/suggest/?q=laptop&limit=abc').json()), 2)
+        self.assertEqual(self.client.get('/api/products/suggest/?q=%20').json(), [])
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # Resim dosyaları olmadığı için türev üretimi başlatılmaz
+        patcher = mock.patch('products.signals.derivative_worker')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.catalog = CatalogFactory()
+        self.slider = Slider.objects.create(title='Kampanya', image='sliders/kampanya.jpg', url='/kampanya')
+
+    def get(self, path, **extra):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(path, **extra)
+        return response, len(context.captured_queries)
+
+    def test_cache_hit(self):
+        first, queries = self.get('/api/categories/')
+        self.assertGreater(queries, 0)
+        second, queries = self.get('/api/categories/')
+        self.assertEqual(queries, 0)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second['ETag'], first['ETag'])
+        response, queries = self.get('/api/categories/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual((response.status_code, queries), (304, 0))
+
+    def test_varies_by_query_string_and_renderer(self):
+        self.get('/api/categories/')
+        # update() sinyal tetiklemez; aynı URL önbellekten eski adı döndürür
+        Category.objects.filter(pk=self.catalog.category.pk).update(name='Bilgisayar')
+        self.assertEqual(self.get('/api/categories/')[0].json()[0]['name'], 'Elektronik')
+        self.assertEqual(self.get('/api/categories/?fields=name')[0].json(), [{'name': 'Bilgisayar'}])
+
+        json_response, _ = self.get('/api/sliders/', HTTP_ACCEPT='application/json')
+        html_response, queries = self.get('/api/sliders/', HTTP_ACCEPT='text/html')
+        self.assertGreater(queries, 0)
+        self.assertTrue(html_response['Content-Type'].startswith('text/html'))
+        self.assertNotEqual(html_response['ETag'], json_response['ETag'])
+        self.assertEqual(self.get('/api/sliders/', HTTP_ACCEPT='application/json')[1], 0)
+
+    def assertInvalidates(self, path, change):
+        self.get(path)
+        with self.captureOnCommitCallbacks(execute=True):
+            change()
+        response, queries = self.get(path)
+        self.assertGreater(queries, 0)
+        return response.json()
+
+    def test_category_and_subcategory_changes_invalidate(self):
+        def rename_category():
+            self.catalog.category.name = 'Bilgisayar'
+            self.catalog.category.save()
+        self.assertEqual(self.assertInvalidates('/api/categories/', rename_category)[0]['name'], 'Bilgisayar')
+
+        def add_subcategory():
+            SubCategory.objects.create(category=self.catalog.category, name='Tablet')
+        # Alt kategori değişikliği kategori listesini de geçersizleştirir
+        data = self.assertInvalidates('/api/categories/', add_subcategory)
+        self.assertEqual(len(data[0]['subcategories']), 2)
+        data = self.assertInvalidates('/api/subcategories/', lambda: SubCategory.objects.get(name='Tablet').delete())
+        self.assertEqual([item['name'] for item in data], ['Laptop'])
+
+        def delete_category():
+            self.catalog.product(images=0, variants=0, reviews=0).delete()
+            Category.objects.all().delete()
+        self.assertEqual(self.assertInvalidates('/api/categories/', delete_category), [])
+
+    def test_slider_changes_invalidate(self):
+        def rename_slider():
+            self.slider.title = 'Yeni Kampanya'
+            self.slider.save()
+        self.assertEqual(self.assertInvalidates('/api/sliders/', rename_slider)[0]['title'], 'Yeni Kampanya')
+        self.assertEqual(self.assertInvalidates('/api/sliders/', self.slider.delete), [])
+        # Slider değişikliği kategori yanıtlarını etkilemez
+        self.get('/api/categories/')
+        with self.captureOnCommitCallbacks(execute=True):
+            Slider.objects.create(title='Diğer', image='sliders/diger.jpg', url='/diger')
+        self.assertEqual(self.get('/api/categories/')[1], 0)
+
+
+class RelatedProductTests(TestCase):
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.gaming = self.product('Oyuncu Laptop RTX', price=40000, specs={'RAM': '32 GB', 'Ekran Kartı': 'RTX 4070'})
+        self.similar = self.product('Oyuncu Laptop RTX Pro', price=42000, specs={'RAM': '32 GB', 'Ekran Kartı': 'RTX 4070'})
+        self.office = self.product('Ofis Laptop', price=15000, specs={'RAM': '8 GB'})
+        self.budget = self.product('Ofis Laptop Ekonomik', price=12000, specs={'RAM': '8 GB'})
+        phones = Category.objects.create(name='Telefon')
+        self.phone = self.product(
+            'Oyuncu Laptop RTX', price=40000, specs={'RAM': '32 GB'},
+            category=phones, subcategory=phones.subcategories.create(name='Akıllı Telefon')
+        )
+
+    def product(self, name, **kwargs):
+        return self.catalog.product(name=name, images=0, variants=0, reviews=0, **kwargs)
+
+    def related(self, product):
+        return list(RelatedProduct.objects.filter(product=product).order_by('rank').values_list('related_id', flat=True))
+
+    def links(self):
+        links = {}
+        for product_id, related_id in RelatedProduct.objects.values_list('product_id', 'related_id'):
+            links.setdefault(product_id, set()).add(related_id)
+        return links
+
+    def test_ranking_within_category(self):
+        refresh_related()
+        self.assertEqual(self.related(self.gaming), [self.similar.pk, self.office.pk, self.budget.pk])
+        self.assertEqual(self.related(self.office)[0], self.budget.pk)
+        # Aynı adlı ürün başka kategoride olduğu için listeye girmez
+        self.assertFalse(RelatedProduct.objects.filter(related=self.phone).exists())
+        self.assertEqual(self.related(self.phone), [])
+        response = self.client.get(f'/api/products/{self.gaming.slug}/').json()
+        self.assertEqual([item['id'] for item in response['related_products']][:1], [self.similar.pk])
+
+    def test_incremental_refresh_on_save_and_delete(self):
+        refresh_related()
+        with self.captureOnCommitCallbacks(execute=True):
+            newcomer = self.product('Oyuncu Laptop RTX Ultra', price=41000, specs={'RAM': '32 GB', 'Ekran Kartı': 'RTX 4070'})
+        self.assertIn(newcomer.pk, self.related(self.gaming)[:2])
+        self.assertIn(self.gaming.pk, self.related(newcomer)[:2])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            newcomer.name = 'Ofis Laptop Plus'
+            newcomer.price = 14000
+            newcomer.specs = {'RAM': '8 GB'}
+            newcomer.save()
+        self.assertEqual(self.related(self.gaming)[0], self.similar.pk)
+        self.assertEqual(self.related(newcomer)[:2], [self.office.pk, self.budget.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.similar.delete()
+        self.assertNotIn(self.similar.pk, self.related(self.gaming))
+        # Silinen ürünün yeri kategorideki diğer ürünlerle doldurulur
+        self.assertEqual(len(self.related(self.gaming)), 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.budget.status = 'inactive'
+            self.budget.save()
+        self.assertEqual(self.related(self.budget), [])
+        self.assertFalse(RelatedProduct.objects.filter(related=self.budget).exists())
+
+        # Artımlı güncellemeler tam hesaplamayla aynı listeleri üretir
+        incremental = self.links()
+        refresh_related()
+        self.assertEqual(incremental, self.links())
+
+    def test_refresh_only_when_similarity_fields_change(self):
+        product = Product.objects.get(pk=self.office.pk)
+        with mock.patch('products.signals.refresh_related_for_product') as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                product.stock = 3
+                product.description = '<p>Yeni açıklama</p>'
+                product.save()
+                Product.objects.only('stock').get(pk=product.pk).save()
+            refresh.assert_not_called()
+            with self.captureOnCommitCallbacks(execute=True):
+                product.price = 16000
+                product.save()
+            refresh.assert_called_once_with(product.pk)
+            with self.captureOnCommitCallbacks(execute=True):
+                product.save()
+            refresh.assert_called_once()
+
+
+class CatalogImporterTests(TestCase):
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.rows = [
+            {'name': 'İthal Laptop', 'subcategory': 'laptop', 'price': '25000', 'discounted_price': '23000',
+             'specs': {'RAM': '16 GB'}, 'stock': 5, 'url': 'https://example.com/ithal-laptop'},
+            {'name': 'İthal Mouse', 'category': 'Elektronik', 'subcategory': 'Laptop', 'price': '500,50'},
+        ]
+
+    def run_import(self, rows, **kwargs):
+        importer = CatalogImporter(**kwargs)
+        stats = importer.run(rows)
+        return stats, importer
+
+    def state(self):
+        return list(Product.objects.order_by('name').values_list(
+            'name', 'slug', 'description', 'price', 'discounted_price', 'is_on_sale', 'specs', 'stock', 'status'
+        ))
+
+    def test_creates_products(self):
+        stats, _ = self.run_import(self.rows)
+        self.assertEqual((stats['created'], stats['updated'], stats['skipped']), (2, 0, 0))
+        laptop = Product.objects.get(name='İthal Laptop')
+        self.assertEqual((laptop.price, laptop.discounted_price, laptop.is_on_sale), (Decimal('25000.00'), Decimal('23000.00'), True))
+        self.assertEqual((laptop.stock, laptop.status, laptop.slug), (5, 'active', 'ithal-laptop'))
+        self.assertEqual(laptop.description, 'Detaylı bilgi için: https://example.com/ithal-laptop')
+        self.assertEqual(Product.objects.get(name='İthal Mouse').price, Decimal('500.50'))
+        # Toplu yazmada atlanan sinyallerin işleri yapılır
+        self.assertTrue(ProductAttribute.objects.filter(product=laptop, key='ram', numeric_value=16).exists())
+        self.assertEqual(
+            [item['name'] for item in self.client.get('/api/products/?search=mouse').json()], ['İthal Mouse']
+        )
+
+    def test_updates_only_columns_in_the_row(self):
+        self.run_import(self.rows)
+        # Mağazada düzenlenen açıklama, stok ve durum
+        Product.objects.filter(name='İthal Laptop').update(description='<p>Elle yazıldı</p>', stock=7, status='inactive')
+        stats, _ = self.run_import([
+            {'name': 'İthal Laptop', 'subcategory': 'laptop', 'price': '22000', 'stock': 50, 'status': 'active',
+             'url': 'https://example.com/ithal-laptop'},
+        ])
+        self.assertEqual((stats['created'], stats['updated']), (0, 1))
+        laptop = Product.objects.get(name='İthal Laptop')
+        self.assertEqual(laptop.price, Decimal('22000.00'))
+        self.assertEqual((laptop.description, laptop.stock, laptop.status), ('<p>Elle yazıldı</p>', 7, 'inactive'))
+        # Satırda olmayan specs korunur; yeni fiyatın üstünde kalan indirim kaldırılır
+        self.assertEqual(laptop.specs, {'RAM': '16 GB'})
+        self.assertTrue(ProductAttribute.objects.filter(product=laptop, key='ram').exists())
+        self.assertEqual((laptop.discounted_price, laptop.is_on_sale), (None, False))
+
+        self.run_import([
+            {'name': 'İthal Laptop', 'subcategory': 'laptop', 'price': '22000', 'stock': 50, 'status': 'active',
+             'description': '<p>Dosyadan</p>', 'discounted_price': '21000'},
+        ], overwrite=True)
+        laptop.refresh_from_db()
+        self.assertEqual((laptop.description, laptop.stock, laptop.status), ('<p>Dosyadan</p>', 50, 'active'))
+        self.assertEqual((laptop.discounted_price, laptop.is_on_sale), (Decimal('21000.00'), True))
+
+    def test_reimport_is_idempotent(self):
+        self.run_import(self.rows)
+        before = self.state()
+        stats, _ = self.run_import(self.rows)
+        self.assertEqual((stats['created'], stats['updated']), (0, 2))
+        self.assertEqual(self.state(), before)
+        self.assertEqual(Product.objects.count(), 2)
+
+    def test_unknown_categories_are_skipped(self):
+        rows = self.rows + [
+            {'name': 'Telefon', 'subcategory': 'akilli-telefon', 'price': '10000'},
+            {'name': 'Fiyatsız', 'subcategory': 'laptop'},
+            {'name': '', 'subcategory': 'laptop', 'price': '1'},
+        ]
+        stats, importer = self.run_import(rows)
+        self.assertEqual((stats['read'], stats['created'], stats['skipped']), (5, 2, 3))
+        self.assertEqual([line for line, _ in importer.errors], [3, 4, 5])
+        self.assertIn('akilli-telefon', importer.errors[0][1])
+
+        stats, _ = self.run_import(rows[2:3], create_categories=True, default_category='Telefon')
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(Product.objects.get(name='Telefon').category.name, 'Telefon')
+
+    def test_command_reads_csv(self):
+        self.run_import(self.rows)
+        Product.objects.filter(name='İthal Laptop').update(stock=7)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        path = Path(directory) / 'urunler.csv'
+        path.write_text(
+            'name,subcategory,price,discounted_price,stock,description\n'
+            'İthal Laptop,laptop,24000,,,\n'
+            'Yeni Ürün,laptop,100,,3,<p>Yeni</p>\n',
+            encoding='utf-8'
+        )
+        output = StringIO()
+        call_command('import_catalog', str(path), stdout=output)
+        self.assertIn('1 eklendi, 1 güncellendi', output.getvalue())
+        laptop = Product.objects.get(name='İthal Laptop')
+        # Boş indirim hücresi indirimi kaldırır, boş stok hücresi stoğa dokunmaz
+        self.assertEqual((laptop.price, laptop.discounted_price, laptop.stock), (Decimal('24000.00'), None, 7))
+        self.assertEqual(Product.objects.get(name='Yeni Ürün').stock, 3)
+
+    def test_sync_keeps_edited_description(self):
+        row = {'name': 'Taranan Laptop', 'subcategory': 'laptop', 'price': '1000', 'url': 'http://a/x1', 'specs': {}}
+        CatalogSync().run([row])
+        product = Product.objects.get(name='Taranan Laptop')
+        self.assertEqual(product.description, 'Detaylı bilgi için: http://a/x1')
+        Product.objects.filter(pk=product.pk).update(description='<p>Mağaza açıklaması</p>')
+
+        # Yalnızca fiyat değişir; mağazada düzenlenen açıklama ezilmez
+        stats = CatalogSync().run([dict(row, price='900')])
+        self.assertEqual(stats['updated'], 1)
+        product.refresh_from_db()
+        self.assertEqual((product.price, product.description), (Decimal('900.00'), '<p>Mağaza açıklaması</p>'))
+
+    def test_sync_skips_rows_without_url(self):
+        sync = CatalogSync()
+        stats = sync.run([
+            {'name': 'Adressiz', 'subcategory': 'laptop', 'price': '10'},
+            {'name': 'Adresli', 'subcategory': 'laptop', 'price': '10', 'url': 'http://a/x2'},
+        ])
+        self.assertEqual((stats['created'], stats['skipped']), (1, 1))
+        self.assertEqual(sync.errors, [(1, "Kaynak URL'si boş")])
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        CatalogFactory().products(3, images=0, variants=0, reviews=0)
+
+    def paginator(self, queryset, **attrs):
+        paginator_class = type('Paginator', (EstimatedCountPaginator,), attrs)
+        return paginator_class(queryset, 2)
+
+    def test_uses_table_statistics_for_unfiltered_lists(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        Product.objects.filter(pk=Product.objects.values('pk')[:1]).delete()
+        # İstatistik silmeden önceki 3 satırı gösterir; filtreli listeler gerçek sayıyı kullanır
+        self.assertEqual(self.paginator(Product.objects.all(), estimate_threshold=1).count, 3)
+        self.assertEqual(self.paginator(Product.objects.filter(price__gte=0), estimate_threshold=1).count, 2)
+        self.assertEqual(self.paginator(Product.objects.all()).count, 2)
+
+    def test_count_is_capped(self):
+        paginator = self.paginator(Product.objects.all(), count_limit=2)
+        self.assertEqual(paginator.count, 2)
+        self.assertEqual(paginator.num_pages, 1)
+
+
+class BulkPricingTests(TestCase):
+    def setUp(self):
+        catalog = CatalogFactory()
+        self.plain, self.sale = catalog.products(2, images=0, variants=0, reviews=0)
+        self.sale.discounted_price = 900
+        self.sale.save()
+
+    def prices(self):
+        return list(Product.objects.order_by('pk').values_list('price', 'discounted_price', 'is_on_sale'))
+
+    def test_price_change_keeps_discount_invariant(self):
+        self.assertEqual(pricing.change_prices(Product.objects.all(), 'percent', 10), 2)
+        self.assertEqual(self.prices(), [(Decimal('1100.00'), None, False), (Decimal('1100.00'), Decimal('900.00'), True)])
+        # İndirimli fiyatın altına düşen fiyatta indirim Product.save'deki gibi kalkar
+        pricing.change_prices(Product.objects.all(), 'amount', -250)
+        self.assertEqual(self.prices(), [(Decimal('850.00'), None, False), (Decimal('850.00'), None, False)])
+
+    def test_price_change_does_not_recompute_related_products(self):
+        with mock.patch('products.similarity.refresh_related') as refresh, \
+                mock.patch('products.similarity.refresh_related_for_product') as refresh_product:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                pricing.change_prices(Product.objects.all(), 'percent', 10)
+        # Yalnızca facet sürümü commit sonrası artırılır
+        self.assertEqual(len(callbacks), 1)
+        refresh.assert_not_called()
+        refresh_product.assert_not_called()
+
+    def test_zero_discounted_price_is_not_on_sale(self):
+        # Product.save'deki kural: yalnızca sıfırdan büyük ve fiyattan küçük indirimli fiyat indirim sayılır
+        Product.objects.filter(pk=self.plain.pk).update(discounted_price=0, is_on_sale=True)
+        pricing.change_prices(Product.objects.all(), 'percent', 10)
+        self.assertEqual(self.prices(), [(Decimal('1100.00'), Decimal('0.00'), False), (Decimal('1100.00'), Decimal('900.00'), True)])
+        self.plain.refresh_from_db()
+        self.plain.save()
+        self.assertEqual(self.prices()[0], (Decimal('1100.00'), Decimal('0.00'), False))
+
+    def test_discounts_and_dry_run(self):
+        self.assertEqual(pricing.apply_discounts(Product.objects.all(), 'percent', 15, dry_run=True), 2)
+        self.assertEqual(self.prices()[0], (Decimal('1000.00'), None, False))
+        pricing.apply_discounts(Product.objects.all(), 'percent', 15)
+        self.assertEqual(self.prices(), [(Decimal('1000.00'), Decimal('850.00'), True)] * 2)
+        # Fiyattan büyük tutar indirimi yazılmaz
+        pricing.apply_discounts(Product.objects.filter(pk=self.plain.pk), 'amount', 1000)
+        self.assertEqual(self.prices()[0], (Decimal('1000.00'), None, False))
+        with self.assertRaises(ValueError):
+            pricing.apply_discounts(Product.objects.all(), 'percent', 100)
+
+    def test_command_and_admin_action(self):
+        out = StringIO()
+        call_command('update_prices', '--clear-discount', '--dry-run', stdout=out)
+        self.assertIn('(deneme) 2 ürün etkilenecek', out.getvalue())
+        call_command('update_prices', '--price', '20', '--mode', 'amount', '--min-price', '1000', stdout=out)
+        self.assertEqual([price for price, _, _ in self.prices()], [Decimal('1020.00')] * 2)
+
+        admin = get_user_model().objects.create_superuser(email='admin@example.com', password='parola')
+        self.client.force_login(admin)
+        response = self.client.post('/admin/products/product/', {
+            'action': 'clear_discounts', '_selected_action': [self.sale.pk], 'index': 0,
+        }, follow=True)
+        self.assertContains(response, '1 ürün güncellendi')
+        self.assertEqual(self.prices()[1], (Decimal('1020.00'), None, False))
+
+
+class StockCheckTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.product = self.catalog.product(images=0, reviews=0, stock=3, discounted_price=900)
+        self.variant, self.other_variant = self.product.variants.order_by('pk')
+        self.other_variant.price_adjustment = 250
+        self.other_variant.save()
+
+    def post(self, lines):
+        return self.client.post('/api/products/stock-check/', lines, content_type='application/json')
+
+    def test_checks_whole_cart(self):
+        response = self.post({'lines': [
+            {'product': self.product.pk, 'quantity': 2},
+            {'product': self.product.pk, 'variant_ids': [self.other_variant.pk], 'quantity': 5},
+            {'product': 0},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        first, second, missing = data['lines']
+        self.assertEqual((first['available'], first['stock'], first['unit_price']), (True, 3, '900.00'))
+        self.assertEqual((second['available'], second['unit_price'], second['total']), (True, '1150.00', '5750.00'))
+        self.assertEqual((missing['available'], missing['error']), (False, 'Ürün bulunamadı'))
+        self.assertFalse(data['available'])
+
+        # Aynı stoğu paylaşan satırların adetleri toplanır
+        data = self.post([{'product': self.product.pk, 'quantity': 2}, {'product': self.product.pk, 'quantity': 2}]).json()
+        self.assertEqual([line['available'] for line in data['lines']], [False, False])
+        self.assertEqual(self.post({'lines': []}).status_code, 400)
+
+    def test_query_budget(self):
+        def lines():
+            return [
+                {'product': product.pk, 'variant_ids': list(product.variants.values_list('pk', flat=True)), 'quantity': 1}
+                for product in Product.objects.all()
+            ]
+        self.catalog.products(2, images=0, reviews=0)
+        baseline = self.assertQueryBudget(
+            2, '/api/products/stock-check/', method='post', data=lines(), content_type='application/json'
+        )
+        self.catalog.products(10, images=0, reviews=0)
+        self.assertQueryBudget(
+            baseline, '/api/products/stock-check/', method='post', data=lines(), content_type='application/json'
+        )
+
+
+class PrimaryImageTests(TestCase):
+    def setUp(self):
+        self.product = CatalogFactory().product(images=2)
+        self.first, self.second = self.product.images.order_by('order')
+
+    def primary_image_id(self):
+        return Product.objects.values_list('primary_image', flat=True).get(pk=self.product.pk)
+
+    def test_follows_primary_flag_and_deletes(self):
+        self.assertEqual(self.primary_image_id(), self.first.pk)
+        self.second.is_primary = True
+        self.second.save()
+        self.assertEqual(self.primary_image_id(), self.second.pk)
+        # Ana resim silinince sıradaki ilk resme düşülür
+        self.second.delete()
+        self.assertEqual(self.primary_image_id(), self.first.pk)
+        self.first.delete()
+        self.assertIsNone(self.primary_image_id())
+
+
+class ProductConditionalGetTests(TestCase):
+    def setUp(self):
+        self.catalog = CatalogFactory()
+        self.product = self.catalog.product()
+
+    def test_not_modified_skips_serialization(self):
+        url = f'/api/products/{self.product.slug}/'
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_review_change_updates_etag(self):
+        url = f'/api/products/{self.product.slug}/'
+        etag = self.client.get(url)['ETag']
+        self.product.reviews.first().delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_list_not_modified(self):
+        response = self.client.get('/api/products/')
+        # Liste için Last-Modified verilmez, detayda verilir
+        self.assertNotIn('Last-Modified', response)
+        self.assertIn('Last-Modified', self.client.get(f'/api/products/{self.product.slug}/'))
+        # ETag süreç içi önbellek sayaçlarına bağlı değildir; önbellek boşalsa da değişmez
+        cache.clear()
+        with self.assertNumQueries(1):
+            not_modified = self.client.get('/api/products/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertNotEqual(self.client.get('/api/products/?ordering=price')['ETag'], response['ETag'])
+
+    def assertInvalidates(self, change, path='/api/products/'):
+        etag = self.client.get(path)['ETag']
+        change()
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_list_invalidation(self):
+        older = self.catalog.product()
+        newest = self.catalog.product()
+        # En yeni ürünün silinmesi ya da pasife alınması updated_at üst sınırını geri götürür
+        self.assertInvalidates(newest.delete)
+        self.assertInvalidates(lambda: Product.objects.filter(pk=older.pk).update(status='inactive'))
+
+        def rename_category():
+            self.catalog.category.name = 'Bilgisayar'
+            self.catalog.category.save()
+        self.assertInvalidates(rename_category)
+        self.assertInvalidates(lambda: SubCategory.objects.create(category=self.catalog.category, name='Tablet'))
+        self.assertInvalidates(lambda: Review.objects.filter(product=self.product).update(is_approved=False))
+        self.assertInvalidates(lambda: self.product.variants.first().delete())
+        image = self.product.images.first()
+        self.assertInvalidates(lambda: ImageDerivative.objects.create(
+            source=image.image.name, format='webp', width=100, height=100, image='derivatives/a.webp'
+        ))
+
+    def test_related_refresh_invalidates_detail(self):
+        self.catalog.product()
+        refresh_related([self.catalog.category.pk])
+        path = f'/api/products/{self.product.slug}/'
+        # Benzer ürün listesi ürünlerin updated_at'ine dokunmadan yeniden hesaplanır
+        self.assertInvalidates(lambda: refresh_related([self.catalog.category.pk]), path=path)
+        self.assertInvalidates(lambda: RelatedProduct.objects.filter(product=self.product).delete(), path=path)
+
+    def test_sales_change_invalidates_best_selling_list(self):
+        self.assertInvalidates(
+            lambda: ProductSalesSummary.refresh([self.product.pk]), path='/api/products/?ordering=best_selling'
+        )
+
+
+class ExtractorTests(TestCase):
+    def test_backends_agree_on_fixtures(self):
+        listing = (VATAN_FIXTURES / 'notebook' / 'index.html').read_bytes()
+        detail = (VATAN_FIXTURES / 'urun' / 'asus-vivobook-15.html').read_bytes()
+        url = 'https://www.vatanbilgisayar.com/notebook/'
+        results = [
+            (get_extractor(name).listing(listing, url), get_extractor(name).detail(detail, url))
+            for name in available_extractors()
+        ]
+        self.assertEqual(len(results[0][0]), 3)
+        self.assertEqual(results[0][1]['specs']['Ram (Sistem Belleği)'], '16 GB')
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+
+    def test_benchmark_reports_pages_per_second(self):
+        output = StringIO()
+        call_command('benchmark_extractors', repeat=1, stdout=output)
+        for name in available_extractors():
+            self.assertIn(f'{name}: 4 sayfa', output.getvalue())
+        self.assertNotIn('aynı değil', output.getvalue())
+
+
+class FetchVatanProductsTests(TestCase):
+    """fetch_vatan_products komutu kaydedilmiş sayfaları sunan yerel sunucuya karşı çalıştırılır"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+    def fetch(self, server, **options):
+        output = StringIO()
+        with override_settings(MEDIA_ROOT=self.media_root):
+            call_command(
+                'fetch_vatan_products', base_url=server.url, category=['Laptop'], rate=0,
+                cache_dir=self.media_root + '/scraper', stdout=output, **options
+            )
+        return output.getvalue()
+
+    def test_fetches_listing_details_and_images(self):
+        with FixtureServer(VATAN_FIXTURES) as server:
+            self.fetch(server, workers=4, parse_workers=2, batch_size=2)
+
+        products = {product.name: product for product in Product.objects.prefetch_related('images')}
+        self.assertEqual(len(products), 3)
+        asus = products['Asus Vivobook 15 Core i7 1255U 16GB 512GB SSD 15.6"']
+        self.assertEqual(asus.price, Decimal('24499.90'))
+        self.assertEqual(asus.specs['Ram (Sistem Belleği)'], '16 GB')
+        # Resim kartta yoksa detay sayfasından alınır; inmeyen resim ürünü engellemez
+        self.assertEqual(len(asus.images.all()), 1)
+        self.assertEqual(len(products['HP Victus 16 Ryzen 7 7840HS 16GB 1TB SSD RTX 4060'].images.all()), 0)
+
+    def test_repeat_crawl_revalidates_from_cache(self):
+        with FixtureServer(VATAN_FIXTURES) as server:
+            self.fetch(server)
+            output = self.fetch(server)
+        # 1 liste + 3 detay sayfası 304 ile doğrulanır; kayıtlı resimler yeniden istenmez,
+        # yalnızca daha önce inmeyen (404) resim tekrar denenir
+        self.assertIn('5 istek, 4 tanesi değişmemiş', output)
+        self.assertIn('0 eklendi, 0 güncellendi, 3 değişmedi, 0 kayboldu', output)
+
+    def test_sync_updates_changed_and_reports_disappeared(self):
+        fixtures = Path(self.media_root) / 'site'
+        shutil.copytree(VATAN_FIXTURES, fixtures)
+        with FixtureServer(fixtures) as server:
+            self.fetch(server)
+            listing = fixtures / 'notebook' / 'index.html'
+            html = listing.read_text(encoding='utf-8').replace('24.499,90', '23.999')
+            # HP kartı kaldırılır
+            html = html[:html.rindex('<div class="product-list__content">')] + '</div></body></html>'
+            listing.write_text(html, encoding='utf-8')
+            output = self.fetch(server, deactivate_missing=True)
+
+        self.assertIn('0 eklendi, 1 güncellendi, 1 değişmedi, 1 kayboldu', output)
+        asus = Product.objects.get(name__startswith='Asus')
+        self.assertEqual(asus.price, Decimal('23999.00'))
+        # Resim adresi değişmediği için yeni resim kaydedilmez
+        self.assertEqual(asus.images.count(), 1)
+        self.assertEqual(Product.objects.get(name__startswith='HP').status, 'inactive')
+
+    def test_missing_product_is_reactivated_when_it_returns(self):
+        fixtures = Path(self.media_root) / 'site'
+        shutil.copytree(VATAN_FIXTURES, fixtures)
+        listing = fixtures / 'notebook' / 'index.html'
+        original = listing.read_text(encoding='utf-8')
+        with FixtureServer(fixtures) as server:
+            self.fetch(server)
+            listing.write_text(
+                original[:original.rindex('<div class="product-list__content">')] + '</div></body></html>', encoding='utf-8'
+            )
+            self.fetch(server, deactivate_missing=True)
+            self.assertEqual(Product.objects.get(name__startswith='HP').status, 'inactive')
+
+            # Ürün aynı içerikle geri döner; özet değişmediği halde etkinleştirilir
+            listing.write_text(original, encoding='utf-8')
+            # Sunucu If-Modified-Since'i saniye çözünürlüğüyle karşılaştırır
+            modified = listing.stat().st_mtime + 10
+            os.utime(listing, (modified, modified))
+            output = self.fetch(server, deactivate_missing=True)
+
+        self.assertIn('0 eklendi, 1 güncellendi, 2 değişmedi, 0 kayboldu', output)
+        self.assertEqual(set(Product.objects.values_list('status', flat=True)), {'active'})
+
+    def test_resumes_from_checkpoint(self):
+        with FixtureServer(VATAN_FIXTURES) as server:
+            checkpoint = Path(self.media_root) / 'scraper' / 'checkpoint.jsonl'
+            checkpoint.parent.mkdir(parents=True)
+            checkpoint.write_text(f'["Laptop", "{server.url}urun/asus-vivobook-15.html"]\n', encoding='utf-8')
+            self.fetch(server)
+            paths = [path for _, path in server.requests]
+
+        self.assertNotIn('/urun/asus-vivobook-15.html', paths)
+        self.assertIn('/urun/lenovo-ideapad-slim-3.html', paths)
+        self.assertFalse(checkpoint.exists())
+
+
+class ContentAddressedStorageTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.media = Path(media_root)
+        self.catalog = CatalogFactory()
+
+    def test_identical_uploads_share_one_file(self):
+        names = []
+        for product in self.catalog.products(2, images=0):
+            image = ProductImage(product=product, is_primary=True)
+            image.image.save(f'{product.slug}-main.jpg', ContentFile(b'ayni-resim'), save=True)
+            names.append(image.image.name)
+
+        self.assertEqual(names[0], names[1])
+        self.assertRegex(names[0], r'^products/[0-9a-f]{2}/[0-9a-f]{64}\.jpg$')
+        self.assertEqual(len([path for path in self.media.rglob('*') if path.is_file()]), 1)
+
+    def test_dedupe_media_migrates_legacy_files(self):
+        legacy = self.media / 'products'
+        legacy.mkdir()
+        for name, content in [('a.jpg', b'x' * 1000), ('a_Xk2p.jpg', b'x' * 1000), ('b.jpg', b'y' * 10)]:
+            (legacy / name).write_bytes(content)
+        product = self.catalog.product(images=0)
+        for name in ['a.jpg', 'a_Xk2p.jpg', 'b.jpg']:
+            ProductImage.objects.create(product=product, image=f'products/{name}')
+
+        output = StringIO()
+        call_command('dedupe_media', stdout=output)
+
+        names = list(ProductImage.objects.order_by('pk').values_list('image', flat=True))
+        self.assertEqual(names[0], names[1])
+        self.assertNotEqual(names[0], names[2])
+        self.assertFalse((legacy / 'a.jpg').exists())
+        self.assertTrue((self.media / names[0]).exists())
+        self.assertIn('Kazanılan alan: 1000 B', output.getvalue())
+
+
+@override_settings(IMAGE_DERIVATIVE_WORKERS=0, IMAGE_DERIVATIVE_WIDTHS=(160, 320, 1280))
+class ImageDerivativeTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.product = CatalogFactory().product(images=0)
+
+    def upload(self, size=(800, 600), color=(200, 30, 30, 255)):
+        buffer = BytesIO()
+        Image.new('RGBA', size, color).save(buffer, 'PNG')
+        image = ProductImage(product=self.product, is_primary=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            image.image.save('urun.png', ContentFile(buffer.getvalue()), save=True)
+        return image
+
+    def test_upload_generates_sizes_in_both_formats(self):
+        image = self.upload()
+        rows = ImageDerivative.objects.filter(source=image.image.name)
+        # Orijinalden geniş olan 1280 atlanır, orijinal genişlik her zaman eklenir
+        self.assertEqual(sorted(set(rows.values_list('width', flat=True))), [160, 320, 800])
+        self.assertEqual(set(rows.values_list('format', flat=True)), {'webp', 'jpeg'})
+
+        data = self.client.get(f'/api/products/{self.product.slug}/').json()
+        srcset = data['images'][0]['srcset']
+        self.assertRegex(srcset['webp'], r'-w160\.webp 160w, .*-w320\.webp 320w, .*-w800\.webp 800w$')
+        self.assertIn('-w160.jpg 160w', srcset['jpeg'])
+
+    def test_transparent_source_is_flattened_onto_white_for_jpeg(self):
+        image = self.upload(size=(200, 100), color=(0, 0, 0, 0))
+        row = ImageDerivative.objects.get(source=image.image.name, format='jpeg', width=200)
+        with row.image.open() as handle:
+            jpeg = Image.open(handle)
+            jpeg.load()
+        self.assertEqual(jpeg.mode, 'RGB')
+        self.assertTrue(all(channel >= 250 for channel in jpeg.getpixel((100, 50))))
+
+    def test_index_reloads_only_changed_sources(self):
+        first = self.upload()
+        self.assertEqual(len(derivative_index.get(first.image.name)), 6)
+        # Sürüm artırılmadan silinen satırlar, eşleme baştan yüklenmediği sürece görünmeye devam eder
+        ImageDerivative.objects.filter(source=first.image.name).delete()
+
+        second = self.upload(size=(300, 200))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(len(derivative_index.get(second.image.name)), 4)
+        self.assertEqual(len(queries), 1)
+        self.assertIn(second.image.name, queries[0]['sql'])
+        self.assertEqual(len(derivative_index.get(first.image.name)), 6)
+
+        derivatives_changed([first.image.name])
+        self.assertEqual(derivative_index.get(first.image.name), [])
+
+    def test_lost_version_reloads_everything(self):
+        first = self.upload()
+        derivative_index.get(first.image.name)
+        ImageDerivative.objects.filter(source=first.image.name).delete()
+        second = self.upload(size=(300, 200))
+        # Sürüm anahtarı düşünce sürüm zamana bağlı yeniden başlar; aradaki değişiklikler bilinemez
+        cache.clear()
+
+        self.assertEqual(derivative_index.get(first.image.name), [])
+        self.assertEqual(len(derivative_index.get(second.image.name)), 4)
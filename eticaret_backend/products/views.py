@@ -1,193 +1,301 @@
-from rest_framework import viewsets, status, permissions
-from rest_framework.decorators import action
-from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
-from django.shortcuts import get_object_or_404
-from django_filters import rest_framework as filters
-import logging
-import traceback
-from .models import Category, SubCategory, Product, Review, Slider
-from .serializers import (
-    CategorySerializer, 
-    SubCategorySerializer, 
-    ProductSerializer, 
-    ProductDetailSerializer,
-    ReviewSerializer,
-    SliderSerializer
-)
-
-logger = logging.getLogger(__name__)
-
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Category.objects.all()
-    serializer_class = CategorySerializer
-    lookup_field = 'slug'
-
-    @action(detail=True, methods=['get'])
-    def subcategories(self, request, slug=None):
-        """Kategoriye ait alt kategorileri getir"""
-        category = self.get_object()
-        subcategories = category.subcategories.all()
-        serializer = SubCategorySerializer(subcategories, many=True)
-        return Response(serializer.data)
-
-class SubCategoryViewSet(viewsets.ReadOnlyModelViewSet):
-    serializer_class = SubCategorySerializer
-    lookup_field = 'slug'
-    
-    def get_queryset(self):
-        queryset = SubCategory.objects.all()
-        category = self.request.query_params.get('category', None)
-        if category is not None:
-            queryset = queryset.filter(category__slug=category)
-        return queryset
-
-class ProductFilter(filters.FilterSet):
-    category = filters.CharFilter(field_name='category__slug')
-    subcategory = filters.CharFilter(field_name='subcategory__slug')
-    
-    class Meta:
-        verbose_name = 'Ürün Filtre'
-        verbose_name_plural = 'Ürün Filtreleri'
-        model = Product
-        fields = ['category', 'subcategory']
-
-class ProductViewSet(viewsets.ModelViewSet):
-    queryset = Product.objects.all()
-    serializer_class = ProductSerializer
-    filter_backends = [filters.DjangoFilterBackend]
-    filterset_class = ProductFilter
-    lookup_field = 'slug'
-    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-
-    def get_serializer_class(self):
-        if self.action == 'retrieve':
-            return ProductDetailSerializer
-        return ProductSerializer
-
-    def get_queryset(self):
-        queryset = Product.objects.select_related(
-            'category', 
-            'subcategory'
-        ).prefetch_related(
-            'images',
-            'variants',
-            'reviews'
-        ).filter(status='active')
-        
-        # Filtreleme parametreleri
-        category = self.request.query_params.get('category', None)
-        subcategory = self.request.query_params.get('subcategory', None)
-        featured = self.request.query_params.get('featured', None)
-        best_seller = self.request.query_params.get('best_seller', None)
-        on_sale = self.request.query_params.get('on_sale', None)
-        min_price = self.request.query_params.get('min_price', None)
-        max_price = self.request.query_params.get('max_price', None)
-        search = self.request.query_params.get('search', None)
-        
-        if category:
-            queryset = queryset.filter(category__slug=category)
-            
-        if subcategory:
-            queryset = queryset.filter(subcategory__slug=subcategory)
-        
-        if featured == 'true':
-            queryset = queryset.filter(is_featured=True)
-            
-        if best_seller == 'true':
-            queryset = queryset.filter(is_best_seller=True)
-            
-        if on_sale == 'true':
-            queryset = queryset.filter(is_on_sale=True)
-            
-        if min_price:
-            queryset = queryset.filter(price__gte=min_price)
-            
-        if max_price:
-            queryset = queryset.filter(price__lte=max_price)
-            
-        if search:
-            queryset = queryset.filter(
-                Q(name__icontains=search) |
-                Q(description__icontains=search)
-            )
-        
-        return queryset
-
-    @action(detail=True, methods=['post'])
-    def review(self, request, slug=None):
-        """Ürüne yorum ekle"""
-        product = self.get_object()
-        
-        # Kullanıcının daha önce yorum yapıp yapmadığını kontrol et
-        if Review.objects.filter(product=product, user=request.user).exists():
-            return Response(
-                {"error": "Bu ürün için zaten bir yorum yapmışsınız."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        serializer = ReviewSerializer(
-            data=request.data,
-            context={'request': request}
-        )
-        
-        if serializer.is_valid():
-            serializer.save(product=product)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-    @action(detail=True, methods=['get'])
-    def variants(self, request, slug=None):
-        """Ürünün varyantlarını getir"""
-        product = self.get_object()
-        variants = product.variants.all()
-        return Response({
-            'variant_types': dict(product.variants.model.VARIANT_TYPES),
-            'variants': variants.values(
-                'id', 'variant_type', 'name', 
-                'sku', 'stock', 'price_adjustment', 
-                'is_default'
-            )
-        })
-
-    @action(detail=True, methods=['get'])
-    def check_stock(self, request, slug=None):
-        """Belirli bir varyant kombinasyonu için stok kontrolü"""
-        product = self.get_object()
-        variant_ids = request.query_params.getlist('variant_ids', [])
-        
-        try:
-            variants = product.variants.filter(id__in=variant_ids)
-            if not variants:
-                return Response({"available": product.stock > 0, "stock": product.stock})
-            
-            # En düşük stoğu al
-            min_stock = min(variant.stock for variant in variants)
-            return Response({
-                "available": min_stock > 0,
-                "stock": min_stock
-            })
-        except Exception as e:
-            logger.error(f"Stok kontrolünde hata: {str(e)}")
-            logger.error(traceback.format_exc())
-            return Response(
-                {"error": "Stok kontrolü yapılırken bir hata oluştu"}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context['request'] = self.request
-        return context
-
-class SliderViewSet(viewsets.ReadOnlyModelViewSet):
-    serializer_class = SliderSerializer
-
-    def get_queryset(self):
-        return Slider.objects.filter(is_active=True).order_by('order')
-
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context['request'] = self.request
+from rest_framework import viewsets, status, permissions
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django.db.models import Min, Q
+from django.db.models.functions import Coalesce
+from django.shortcuts import get_object_or_404
+from django_filters import rest_framework as filters
+import logging
+import traceback
+from .models import Category, ImageDerivative, SubCategory, Product, Review, Slider
+from .serializers import (
+    DynamicFieldsMixin,
+    CategorySerializer, 
+    SubCategorySerializer, 
+    ProductSerializer, 
+    ProductListSerializer,
+    ProductDetailSerializer,
+    ReviewSerializer,
+    SliderSerializer,
+    StockCheckSerializer,
+    StockCheckResultSerializer,
+    approved_reviews_prefetch
+)
+from .pagination import ProductCursorPagination
+from .search import get_search_backend
+from .facets import get_facets
+from .attributes import apply_spec_filters
+from .suggest import suggestion_index
+from .inventory import check_availability
+from .cache import CachedResponseMixin
+from .conditional import ConditionalGetMixin
+
+logger = logging.getLogger(__name__)
+
+class SparseFieldsetMixin:
+    """`?fields=a,b` ve `?expand=c` parametrelerini DynamicFieldsMixin kullanan serializer'a iletir"""
+
+    def get_field_params(self):
+        params = self.request.query_params
+        fields = [name.strip() for name in params.get('fields', '').split(',') if name.strip()]
+        expand = [name.strip() for name in params.get('expand', '').split(',') if name.strip()]
+        return fields or None, expand or None
+
+    def get_selected_fields(self):
+        """Döndürülecek alan adları; serializer alan seçimini desteklemiyorsa None"""
+        serializer_class = self.get_serializer_class()
+        if not issubclass(serializer_class, DynamicFieldsMixin):
+            return None
+        return serializer_class.select_fields(*self.get_field_params())
+
+    def get_serializer(self, *args, **kwargs):
+        if issubclass(self.get_serializer_class(), DynamicFieldsMixin):
+            fields, expand = self.get_field_params()
+            kwargs.setdefault('fields', fields)
+            kwargs.setdefault('expand', expand)
+        return super().get_serializer(*args, **kwargs)
+
+class CategoryViewSet(CachedResponseMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = CategorySerializer
+    lookup_field = 'slug'
+    cache_models = (Category, SubCategory, ImageDerivative)
+
+    def get_queryset(self):
+        queryset = Category.objects.all()
+        selected = self.get_selected_fields()
+        if selected is None or 'subcategories' in selected:
+            queryset = queryset.prefetch_related('subcategories')
+        return queryset
+
+    @action(detail=True, methods=['get'])
+    def subcategories(self, request, slug=None):
+        """Kategoriye ait alt kategorileri getir"""
+        def get_subcategories(request, slug=None):
+            category = self.get_object()
+            subcategories = category.subcategories.all()
+            serializer = SubCategorySerializer(subcategories, many=True, context={'request': request})
+            return Response(serializer.data)
+        return self.cached_response(request, get_subcategories, slug=slug)
+
+class SubCategoryViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = SubCategorySerializer
+    lookup_field = 'slug'
+    cache_models = (Category, SubCategory, ImageDerivative)
+    
+    def get_queryset(self):
+        queryset = SubCategory.objects.all()
+        category = self.request.query_params.get('category', None)
+        if category is not None:
+            queryset = queryset.filter(category__slug=category)
+        return queryset
+
+class ProductFilter(filters.FilterSet):
+    category = filters.CharFilter(field_name='category__slug')
+    subcategory = filters.CharFilter(field_name='subcategory__slug')
+    
+    class Meta:
+        verbose_name = 'Ürün Filtre'
+        verbose_name_plural = 'Ürün Filtreleri'
+        model = Product
+        fields = ['category', 'subcategory']
+
+class ProductViewSet(ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
+    queryset = Product.objects.all()
+    serializer_class = ProductSerializer
+    filter_backends = [filters.DjangoFilterBackend]
+    filterset_class = ProductFilter
+    pagination_class = ProductCursorPagination
+    lookup_field = 'slug'
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    def get_serializer_class(self):
+        if self.action == 'retrieve':
+            return ProductDetailSerializer
+        if self.action == 'list':
+            return ProductListSerializer
+        return ProductSerializer
+
+    def get_queryset(self):
+        selected = self.get_selected_fields()
+
+        def wants(*names):
+            return selected is None or any(name in selected for name in names)
+
+        # Yalnızca istenen alanların ihtiyaç duyduğu ilişkiler yüklenir
+        related = [
+            name for name, fields in [
+                ('category', ['category']),
+                ('subcategory', ['subcategory']),
+                ('rating_summary', ['average_rating', 'review_count']),
+                ('primary_image', ['primary_image_url']),
+            ] if wants(*fields)
+        ]
+        prefetches = []
+        if wants('images'):
+            prefetches.append('images')
+        if wants('variants', 'variant_types'):
+            prefetches.append('variants')
+        if wants('reviews'):
+            prefetches.append(approved_reviews_prefetch())
+        if wants('category') and not issubclass(self.get_serializer_class(), ProductListSerializer):
+            # Liste dışındaki serializer'lar kategoriyi alt kategorileriyle birlikte döndürür
+            prefetches.append('category__subcategories')
+
+        queryset = Product.objects.prefetch_related(*prefetches).filter(status='active')
+        if related:
+            # Argümansız select_related tüm ilişkileri izlediği için boş listede çağrılmaz
+            queryset = queryset.select_related(*related)
+
+        deferred = [name for name in ('description', 'specs') if not wants(name)]
+        if deferred:
+            queryset = queryset.defer(*deferred)
+        
+        # Filtreleme parametreleri
+        category = self.request.query_params.get('category', None)
+        subcategory = self.request.query_params.get('subcategory', None)
+        featured = self.request.query_params.get('featured', None)
+        best_seller = self.request.query_params.get('best_seller', None)
+        on_sale = self.request.query_params.get('on_sale', None)
+        min_price = self.request.query_params.get('min_price', None)
+        max_price = self.request.query_params.get('max_price', None)
+        search = self.request.query_params.get('search', None)
+        
+        if category:
+            queryset = queryset.filter(category__slug=category)
+            
+        if subcategory:
+            queryset = queryset.filter(subcategory__slug=subcategory)
+        
+        if featured == 'true':
+            queryset = queryset.filter(is_featured=True)
+            
+        if best_seller == 'true':
+            queryset = queryset.filter(is_best_seller=True)
+            
+        if on_sale == 'true':
+            queryset = queryset.filter(is_on_sale=True)
+            
+        if min_price:
+            queryset = queryset.filter(price__gte=min_price)
+            
+        if max_price:
+            queryset = queryset.filter(price__lte=max_price)
+            
+        queryset = apply_spec_filters(queryset, self.request.query_params)
+
+        if search:
+            queryset = get_search_backend().search(queryset, search)
+
+        if self.paginator.get_ordering_key(self.request) == 'best_selling':
+            queryset = queryset.annotate(sales_units=Coalesce('sales_summary__units_30d', 0))
+
+        # Sıralama: sayfalama kapalıyken de aynı anahtarlar kullanılır
+        queryset = queryset.order_by(*self.paginator.get_ordering(self.request))
+        
+        return queryset
+
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """Mevcut filtrelere göre kategori, fiyat aralığı, indirim ve özellik sayılarını getir"""
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(get_facets(queryset, request.query_params))
+
+    @action(detail=False, methods=['get'])
+    def suggest(self, request):
+        """Arama kutusu için bellek içi önek indeksinden anlık öneriler getir"""
+        try:
+            limit = min(max(int(request.query_params.get('limit', 8)), 1), 20)
+        except ValueError:
+            limit = 8
+        suggestions = suggestion_index.suggest(request.query_params.get('q', ''), limit)
+        for suggestion in suggestions:
+            if suggestion['thumbnail']:
+                suggestion['thumbnail'] = request.build_absolute_uri(suggestion['thumbnail'])
+        return Response(suggestions)
+
+    @action(detail=True, methods=['post'])
+    def review(self, request, slug=None):
+        """Ürüne yorum ekle"""
+        product = self.get_object()
+        
+        # Kullanıcının daha önce yorum yapıp yapmadığını kontrol et
+        if Review.objects.filter(product=product, user=request.user).exists():
+            return Response(
+                {"error": "Bu ürün için zaten bir yorum yapmışsınız."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        serializer = ReviewSerializer(
+            data=request.data,
+            context={'request': request}
+        )
+        
+        if serializer.is_valid():
+            serializer.save(product=product)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=True, methods=['get'])
+    def variants(self, request, slug=None):
+        """Ürünün varyantlarını getir"""
+        product = self.get_object()
+        variants = product.variants.all()
+        return Response({
+            'variant_types': dict(product.variants.model.VARIANT_TYPES),
+            'variants': variants.values(
+                'id', 'variant_type', 'name', 
+                'sku', 'stock', 'price_adjustment', 
+                'is_default'
+            )
+        })
+
+    @action(detail=True, methods=['get'])
+    def check_stock(self, request, slug=None):
+        """Belirli bir varyant kombinasyonu için stok kontrolü"""
+        product = self.get_object()
+        variant_ids = request.query_params.getlist('variant_ids', [])
+        
+        try:
+            # En düşük stok veritabanında hesaplanır; varyantlar belleğe yüklenmez
+            min_stock = product.variants.filter(id__in=variant_ids).aggregate(stock=Min('stock'))['stock']
+            if min_stock is None:
+                return Response({"available": product.stock > 0, "stock": product.stock})
+            
+            return Response({
+                "available": min_stock > 0,
+                "stock": min_stock
+            })
+        except Exception as e:
+            logger.error(f"Stok kontrolünde hata: {str(e)}")
+            logger.error(traceback.format_exc())
+            return Response(
+                {"error": "Stok kontrolü yapılırken bir hata oluştu"}, 
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @action(detail=False, methods=['post'], url_path='stock-check', permission_classes=[permissions.AllowAny])
+    def stock_check(self, request):
+        """Sepetteki tüm satırların stok durumunu ve güncel fiyatını tek istekte getir"""
+        # Gövde {"lines": [...]} ya da doğrudan satır listesi olabilir
+        data = {'lines': request.data} if isinstance(request.data, list) else request.data
+        serializer = StockCheckSerializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        return Response(StockCheckResultSerializer(check_availability(serializer.validated_data['lines'])).data)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['request'] = self.request
+        return context
+
+class SliderViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = SliderSerializer
+    cache_models = (Slider, ImageDerivative)
+
+    def get_queryset(self):
+        return Slider.objects.filter(is_active=True).order_by('order')
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['request'] = self.request
         return context
\ No newline at end of file
@@ -1,7 +1,10 @@
-from django.apps import AppConfig
-
-
-class SettingsConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'settings'
-    verbose_name = 'Ayarlar'
+from django.apps import AppConfig
+
+
+class SettingsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'settings'
+    verbose_name = 'Ayarlar'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,54 +1,54 @@
-# Generated by Django 5.1.2 on 2024-12-18 22:25
-
-from django.db import migrations, models
-
-
-class Migration(migrations.Migration):
-
-    initial = True
-
-    dependencies = [
-    ]
-
-    operations = [
-        migrations.CreateModel(
-            name='Contact',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('phone', models.CharField(blank=True, max_length=15, null=True)),
-                ('email', models.EmailField(blank=True, max_length=254, null=True)),
-                ('location', models.CharField(blank=True, max_length=100, null=True)),
-            ],
-            options={
-                'verbose_name': 'İletişim Bilgileri',
-                'verbose_name_plural': 'İletişim Bilgileri',
-            },
-        ),
-        migrations.CreateModel(
-            name='PolicyandTerms',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('privacy_policy', models.TextField(blank=True, null=True, verbose_name='Gizlilik Politikası')),
-                ('terms_of_service', models.TextField(blank=True, null=True, verbose_name='Kullanım Şartları')),
-                ('return_policy', models.TextField(blank=True, null=True, verbose_name='İade Şartları')),
-            ],
-            options={
-                'verbose_name': 'Politika ve Şartlar',
-            },
-        ),
-        migrations.CreateModel(
-            name='SocialMedia',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('instagram', models.CharField(blank=True, max_length=100, null=True)),
-                ('facebook', models.CharField(blank=True, max_length=100, null=True)),
-                ('twitter', models.CharField(blank=True, max_length=100, null=True)),
-                ('linkedin', models.CharField(blank=True, max_length=100, null=True)),
-                ('youtube', models.CharField(blank=True, max_length=100, null=True)),
-                ('tiktok', models.CharField(blank=True, max_length=100, null=True)),
-            ],
-            options={
-                'verbose_name': 'Sosyal Medya',
-            },
-        ),
-    ]
+# Generated by Django 5.1.2 on 2024-12-18 22:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Contact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('phone', models.CharField(blank=True, max_length=15, null=True)),
+                ('email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('location', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+            options={
+                'verbose_name': 'İletişim Bilgileri',
+                'verbose_name_plural': 'İletişim Bilgileri',
+            },
+        ),
+        migrations.CreateModel(
+            name='PolicyandTerms',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('privacy_policy', models.TextField(blank=True, null=True, verbose_name='Gizlilik Politikası')),
+                ('terms_of_service', models.TextField(blank=True, null=True, verbose_name='Kullanım Şartları')),
+                ('return_policy', models.TextField(blank=True, null=True, verbose_name='İade Şartları')),
+            ],
+            options={
+                'verbose_name': 'Politika ve Şartlar',
+            },
+        ),
+        migrations.CreateModel(
+            name='SocialMedia',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('instagram', models.CharField(blank=True, max_length=100, null=True)),
+                ('facebook', models.CharField(blank=True, max_length=100, null=True)),
+                ('twitter', models.CharField(blank=True, max_length=100, null=True)),
+                ('linkedin', models.CharField(blank=True, max_length=100, null=True)),
+                ('youtube', models.CharField(blank=True, max_length=100, null=True)),
+                ('tiktok', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+            options={
+                'verbose_name': 'Sosyal Medya',
+            },
+        ),
+    ]
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from products.cache import invalidate_responses
+from .models import Contact, PolicyandTerms, SocialMedia
+
+
+@receiver([post_save, post_delete], sender=Contact)
+@receiver([post_save, post_delete], sender=SocialMedia)
+@receiver([post_save, post_delete], sender=PolicyandTerms)
+def settings_changed(sender, **kwargs):
+    invalidate_responses(sender)
@@ -1,17 +1,21 @@
-from rest_framework import viewsets
-from .models import Contact, SocialMedia, PolicyandTerms
-from .serializers import ContactSerializer, SocialMediaSerializer, PolicyandTermsSerializer
-
-class ContactViewSet(viewsets.ModelViewSet):
-    queryset = Contact.objects.all()
-    serializer_class = ContactSerializer
-
-class SocialMediaViewSet(viewsets.ModelViewSet):
-    queryset = SocialMedia.objects.all()
-    serializer_class = SocialMediaSerializer
-
-class PolicyandTermsViewSet(viewsets.ModelViewSet):
-    queryset = PolicyandTerms.objects.all()
-    serializer_class = PolicyandTermsSerializer
-
-
+from rest_framework import viewsets
+from products.cache import CachedResponseMixin
+from .models import Contact, SocialMedia, PolicyandTerms
+from .serializers import ContactSerializer, SocialMediaSerializer, PolicyandTermsSerializer
+
+class ContactViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    queryset = Contact.objects.all()
+    serializer_class = ContactSerializer
+    cache_models = (Contact,)
+
+class SocialMediaViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    queryset = SocialMedia.objects.all()
+    serializer_class = SocialMediaSerializer
+    cache_models = (SocialMedia,)
+
+class PolicyandTermsViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    queryset = PolicyandTerms.objects.all()
+    serializer_class = PolicyandTermsSerializer
+    cache_models = (PolicyandTerms,)
+
+
@@ -54,8 +54,8 @@ function Header({ user, onLogout }) {
 
     setIsSearching(true);
     try {
-      const response = await productService.search(query);
-      setSearchResults(response.data.slice(0, 5));
+      const response = await productService.suggest(query);
+      setSearchResults(response.data.filter((item) => item.type === 'product').slice(0, 5));
     } catch (error) {
       console.error('Arama hatası:', error);
     } finally {
@@ -176,7 +176,7 @@ function Header({ user, onLogout }) {
               >
                 {searchResults.map((product) => (
                   <MenuItem
-                    key={product.id}
+                    key={product.slug}
                     component={Link}
                     to={`/urun/${product.slug}`}
                     onClick={() => {
@@ -191,7 +191,7 @@ function Header({ user, onLogout }) {
                     }}
                   >
                     <img
-                      src={product.primary_image_url}
+                      src={product.thumbnail}
                       alt={product.name}
                       style={{
                         width: 40,
@@ -200,16 +200,7 @@ function Header({ user, onLogout }) {
                         borderRadius: 4
                       }}
                     />
-                    <Box>
-                      <Typography variant="body2">{product.name}</Typography>
-                      <Typography
-                        variant="body2"
-                        color="text.secondary"
-                        sx={{ fontSize: '0.8rem' }}
-                      >
-                        {product.price} TL
-                      </Typography>
-                    </Box>
+                    <Typography variant="body2">{product.name}</Typography>
                   </MenuItem>
                 ))}
                 
@@ -17,7 +17,7 @@ import AddShoppingCartIcon from '@mui/icons-material/AddShoppingCart';
 function ProductCard({ product, setNotification }) {
   const { addToCart } = useCart();
   const primaryImage = product.images?.find(img => img.is_primary) || product.images?.[0];
-  const imageUrl = primaryImage?.image || '/placeholder.jpg';
+  const imageUrl = product.primary_image_url || primaryImage?.image || '/placeholder.jpg';
 
   const formatPrice = (price) => {
     return parseFloat(price).toLocaleString('tr-TR', {
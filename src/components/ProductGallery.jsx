@@ -138,6 +138,8 @@ function ProductGallery({ images = [], productName }) {
             >
               <img
                 src={img.image}
+                srcSet={img.srcset?.webp}
+                sizes="100px"
                 alt={`${productName} - ${index + 1}`}
                 loading="lazy"
                 style={{ 
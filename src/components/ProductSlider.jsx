@@ -56,6 +56,8 @@ function ProductSlider({ slides = [] }) {
             >
               <img
                 src={slide.image_url}
+                srcSet={slide.image_srcset?.webp}
+                sizes="100vw"
                 alt={slide.title}
                 style={{
                   width: '100%',
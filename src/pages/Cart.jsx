@@ -96,7 +96,7 @@ function Cart() {
             <List>
               {cart.map((item) => {
                 const primaryImage = item.images?.find(img => img.is_primary) || item.images?.[0];
-                const imageUrl = primaryImage?.image || '/placeholder.jpg';
+                const imageUrl = item.primary_image_url || primaryImage?.image || '/placeholder.jpg';
                 const currentPrice = item.is_on_sale ? item.discounted_price : item.price;
 
                 return (
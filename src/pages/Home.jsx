@@ -27,7 +27,8 @@ function Home({ setNotification }) {
       try {
         const response = await productService.getAll({ 
           is_featured: true,
-          limit: 5 
+          limit: 5,
+          expand: 'description'
         });
         const slides = response.data.map(product => ({
           title: product.name,
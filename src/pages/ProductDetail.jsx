@@ -60,14 +60,7 @@ function ProductDetail({ setNotification }) {
         console.log('Product Data:', response.data);
         console.log('Product Images:', response.data.images);
         setProduct(response.data);
-
-        if (response.data.category?.slug) {
-          const relatedResponse = await productService.getByCategorySlug(response.data.category.slug);
-          const filtered = relatedResponse.data
-            .filter(p => p.slug !== slug)
-            .slice(0, 4);
-          setRelatedProducts(filtered);
-        }
+        setRelatedProducts(response.data.related_products || []);
       } catch (err) {
         console.error('Ürün detay hatası:', err);
         setError('Ürün detayları yüklenirken bir hata oluştu');
@@ -36,6 +36,8 @@ export const productService = {
   search: async (query) => {
     return await axiosInstance.get(`/products/?search=${encodeURIComponent(query)}`);
   },
+  suggest: (query) =>
+    axiosInstance.get(`/products/suggest/?q=${encodeURIComponent(query)}`),
 };
 
 // Hata yakalama interceptor'ı